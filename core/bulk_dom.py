@@ -0,0 +1,127 @@
+# 선택자 dict({xpath | class_name | css})에 일치하는 노드를 문서 순서대로 고르는 함수 (다른 스크립트에서도 재사용)
+SELECT_FUNCTION = """
+function select(target, start = 0, end = null) {
+    let nodes = [];
+    if (target.xpath) {
+        const found = document.evaluate(target.xpath, document, null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null);
+        for (let i = 0; i < found.snapshotLength; i++) nodes.push(found.snapshotItem(i));
+    } else if (target.class_name) {
+        nodes = Array.from(document.getElementsByClassName(target.class_name));
+    } else if (target.css) {
+        nodes = Array.from(document.querySelectorAll(target.css));
+    }
+    return nodes.slice(start, end === null ? undefined : end);
+}
+"""
+
+# 선택자에 일치하는 모든 노드에 같은 작업을 브라우저 안에서 한 번에 수행하는 스크립트.
+# 요소마다 WebDriver를 왕복하는 대신(find_elements + 요소별 .text / execute_script) 호출 한 번으로 끝내고,
+# 결과는 문자열/숫자 배열로만 돌려준다 (WebElement 참조를 직렬화하지 않음).
+BULK_SCRIPT = SELECT_FUNCTION + """
+const [targets, op, arg, start, end] = arguments;
+return targets.map(target => {
+    const nodes = select(target, start, end);
+    switch (op) {
+        case "count": return nodes.length;
+        case "text": return nodes.map(node => (node.innerText || "").trim());
+        case "attr": return nodes.map(node => node.getAttribute(arg));
+        case "hide": nodes.forEach(node => { node.style.display = "none"; }); return nodes.length;
+        case "show": nodes.forEach(node => { node.style.display = arg || "block"; }); return nodes.length;
+        case "click": nodes.forEach(node => node.click()); return nodes.length;
+        default: throw new Error("Unknown bulk op: " + op);
+    }
+});
+"""
+
+BULK_OPS = ("count", "text", "attr", "hide", "show", "click")
+
+
+def target_of(xpath=None, class_name=None, css=None):
+    """선택자 인자를 스크립트에 넘길 dict로 변환 (xpath > class_name > css 순으로 하나만 사용)"""
+    if not (xpath or class_name or css):
+        raise ValueError("XPath, class_name 또는 css 중 하나가 필요합니다.")
+    return {"xpath": xpath, "class_name": class_name, "css": css}
+
+
+def bulk_many(driver, op, targets, arg=None, start=0, end=None):
+    """
+    여러 선택자(target dict 목록)에 대해 op를 한 번의 스크립트 호출로 수행하고, 선택자별 결과 목록을 반환한다.
+
+    :param op: count(개수), text(innerText 목록), attr(속성값 목록, arg=속성 이름),
+               hide/show(표시 변경 후 개수, show의 arg=display 값), click(모두 클릭 후 개수)
+    :param start: 선택자마다 일치한 노드 중 start 번째부터
+    :param end: end 번째 전까지 (None이면 끝까지)
+    """
+    if op not in BULK_OPS:
+        raise ValueError(f"Unknown bulk op: {op}")
+    return driver.execute_script(BULK_SCRIPT, list(targets), op, arg, start, end) or []
+
+
+def bulk(driver, op, xpath=None, class_name=None, css=None, arg=None, start=0, end=None):
+    """선택자 하나에 대한 bulk_many"""
+    return bulk_many(driver, op, [target_of(xpath, class_name, css)], arg, start, end)[0]
+
+
+def bulk_count(driver, xpath=None, class_name=None, css=None):
+    return bulk(driver, "count", xpath, class_name, css)
+
+
+def bulk_text(driver, xpath=None, class_name=None, css=None, start=0, end=None):
+    return bulk(driver, "text", xpath, class_name, css, start=start, end=end)
+
+
+def bulk_attr(driver, name, xpath=None, class_name=None, css=None, start=0, end=None):
+    return bulk(driver, "attr", xpath, class_name, css, arg=name, start=start, end=end)
+
+
+def bulk_hide(driver, xpath=None, class_name=None, css=None):
+    return bulk(driver, "hide", xpath, class_name, css)
+
+
+def bulk_show(driver, xpath=None, class_name=None, css=None, display="block"):
+    return bulk(driver, "show", xpath, class_name, css, arg=display)
+
+
+def bulk_click(driver, xpath=None, class_name=None, css=None, start=0, end=None):
+    return bulk(driver, "click", xpath, class_name, css, start=start, end=end)
+
+
+if __name__ == "__main__":
+    import time
+
+    from selenium import webdriver
+    from selenium.webdriver.common.by import By
+
+    COUNT = 2000
+
+    options = webdriver.ChromeOptions()
+    options.add_argument("--headless=new")
+    driver = webdriver.Chrome(options=options)
+    try:
+        rows = "".join(f"<div class='item' data-id='{i}'><span>item {i}</span></div>" for i in range(COUNT))
+        driver.get("data:text/html;charset=utf-8,<html><body>" + rows + "</body></html>")
+
+        start = time.perf_counter()
+        per_element = [element.text for element in driver.find_elements(By.CLASS_NAME, "item")]
+        text_old = time.perf_counter() - start
+        start = time.perf_counter()
+        bulk_texts = bulk_text(driver, class_name="item")
+        text_new = time.perf_counter() - start
+        assert bulk_texts == per_element
+
+        assert bulk_attr(driver, "data-id", class_name="item", start=10, end=13) == ["10", "11", "12"]
+
+        start = time.perf_counter()
+        for element in driver.find_elements(By.CLASS_NAME, "item"):
+            driver.execute_script("arguments[0].style.display = 'none';", element)
+        hide_old = time.perf_counter() - start
+        bulk_show(driver, class_name="item")
+        start = time.perf_counter()
+        hidden = bulk_hide(driver, class_name="item")
+        hide_new = time.perf_counter() - start
+        assert hidden == COUNT
+
+        print(f"{COUNT} nodes, text: per element {text_old:.2f}s, bulk {text_new:.3f}s")
+        print(f"{COUNT} nodes, hide: per element {hide_old:.2f}s, bulk {hide_new:.3f}s")
+    finally:
+        driver.quit()
@@ -0,0 +1,117 @@
+try:
+    from lxml import html as lxml_html
+except ImportError:  # lxml은 선택 의존성: 없으면 BeautifulSoup 내장 html.parser로 파싱한다
+    lxml_html = None
+
+REVIEW_CLASS = "__review-post"
+DEFAULT_PARSER = "lxml" if lxml_html is not None else "html.parser"
+
+# start 번째 이후의 리뷰 노드만 골라 텍스트를 돌려주는 스크립트.
+# BeautifulSoup의 get_text(strip=True)와 같도록 텍스트 노드마다 공백을 자르고 이어 붙인다.
+# (textContent 기반이라 숨겨진 노드의 텍스트도 포함된다)
+NEW_REVIEWS_SCRIPT = """
+const [className, start] = arguments;
+const posts = document.getElementsByClassName(className);
+const texts = [];
+for (let i = start; i < posts.length; i++) {
+    const walker = document.createTreeWalker(posts[i], NodeFilter.SHOW_TEXT);
+    const parts = [];
+    while (walker.nextNode()) {
+        const part = walker.currentNode.nodeValue.trim();
+        if (part) parts.push(part);
+    }
+    texts.push(parts.join(''));
+}
+return texts;
+"""
+
+
+def extract_new_reviews(driver, start, class_name=REVIEW_CLASS):
+    """
+    브라우저 안에서 start 번째 이후에 추가된 리뷰 텍스트만 가져온다.
+    page_source 전체를 직렬화/재파싱하지 않으므로 스크롤 횟수가 늘어도 비용이 일정하다.
+    """
+    return driver.execute_script(NEW_REVIEWS_SCRIPT, class_name, start)
+
+
+def parse_reviews_html(html, start=0, class_name=REVIEW_CLASS, parser=None):
+    """
+    정적 HTML에서 start 번째 이후의 리뷰 텍스트를 추출한다.
+    parser="lxml"이면 lxml로 직접 파싱하고(설치되어 있지 않으면 html.parser), 그 외에는 BeautifulSoup(html, parser)를 사용한다.
+    parser를 지정하지 않으면 DEFAULT_PARSER (lxml이 있으면 lxml).
+    """
+    parser = parser or DEFAULT_PARSER
+    if parser == "lxml" and lxml_html is not None:
+        tree = lxml_html.fromstring(html)
+        posts = tree.xpath(f"//*[contains(concat(' ', normalize-space(@class), ' '), ' {class_name} ')]")
+        return ["".join(t.strip() for t in post.itertext()) for post in posts[start:]]
+
+    from bs4 import BeautifulSoup
+
+    soup = BeautifulSoup(html, "html.parser" if parser == "lxml" else parser)
+    return [post.get_text(strip=True) for post in soup.find_all(class_=class_name)[start:]]
+
+
+def _write_fixture(path, count):
+    with open(path, "w", encoding="utf-8") as f:
+        f.write("<html><body><div id='reviews'>\n")
+        for i in range(count):
+            f.write(
+                f"<div class='{REVIEW_CLASS}'><div class='header'><span>user{i}</span></div>"
+                f"<p>소고기 입에서 살살 녹고 라멘 면발이 너무 맛있었어요 {i}</p>"
+                f"<div class='x9vxc45' style='display:none'>직원분들 친절하시고 분위기도 좋아요</div></div>\n"
+            )
+        f.write("</div></body></html>\n")
+
+
+if __name__ == "__main__":
+    import os
+    import sys
+    import tempfile
+    import time
+
+    # 사용법: python catch_table_extract.py [fixture.html] [posts]  (fixture가 없으면 임시 디렉터리에 생성)
+    count = int(sys.argv[2]) if len(sys.argv) > 2 else 3000
+    per_scroll = 30  # 스크롤 한 번에 추가되는 리뷰 수
+
+    if len(sys.argv) > 1:
+        fixture = sys.argv[1]
+    else:
+        fixture = os.path.join(tempfile.mkdtemp(), "catch_table_fixture.html")
+        _write_fixture(fixture, count)
+    with open(fixture, encoding="utf-8") as f:
+        lines = f.read().splitlines()
+    head, posts, tail = lines[0], lines[1:-1], lines[-1]
+
+    def page_at(n):
+        # n개의 리뷰가 로드된 시점의 page_source를 흉내낸다
+        return "\n".join([head] + posts[:n] + [tail])
+
+    steps = range(per_scroll, len(posts) + 1, per_scroll)
+
+    # 두 방식 모두 같은 파서와 같은 중복 제거(set)를 쓰고, 파싱하는 범위만 다르다
+    # 기존 방식: 매 스크롤마다 그때까지 로드된 전체 페이지를 재파싱
+    start = time.perf_counter()
+    full, full_seen = [], set()
+    for n in steps:
+        for text in parse_reviews_html(page_at(n)):
+            if text not in full_seen:
+                full_seen.add(text)
+                full.append(text)
+    full_time = time.perf_counter() - start
+
+    # 증분 방식: 새로 추가된 노드만 파싱 (브라우저에서는 extract_new_reviews가 같은 역할)
+    start = time.perf_counter()
+    incremental, incremental_seen, processed = [], set(), 0
+    for n in steps:
+        for text in parse_reviews_html("\n".join([head] + posts[processed:n] + [tail])):
+            if text not in incremental_seen:
+                incremental_seen.add(text)
+                incremental.append(text)
+        processed = n
+    incremental_time = time.perf_counter() - start
+
+    assert full == incremental
+    print(f"{len(posts)} posts, {len(steps)} scrolls, parser={DEFAULT_PARSER}")
+    print(f"Full re-parse: {full_time:.2f}s")
+    print(f"Incremental (new nodes only): {incremental_time:.2f}s")
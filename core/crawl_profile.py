@@ -0,0 +1,162 @@
+from selenium import webdriver
+
+# 리뷰 텍스트만 필요한 크롤링에서 받지 않을 요청 (CDP Network.setBlockedURLs 패턴, * 와일드카드)
+ANALYTICS_URLS = (
+    "*google-analytics.com*", "*googletagmanager.com*", "*doubleclick.net*", "*facebook.net*",
+    "*connect.facebook.com*", "*analytics.tiktok.com*", "*wcs.naver.net*", "*lcs.naver.com*",
+    "*nelo2-col.navercorp.com*", "*amplitude.com*", "*sentry.io*", "*hotjar.com*",
+)
+FONT_URLS = ("*.woff", "*.woff2", "*.ttf", "*.otf", "*.eot")
+MEDIA_URLS = ("*.mp4", "*.webm", "*.m3u8", "*.ts", "*.mp3", "*.m4a")
+
+
+class CrawlProfile:
+    """
+    크롤러들이 공유하는 가벼운 브라우저 설정.
+
+    - headless, 확장 프로그램/자동 재생 끔
+    - 이미지는 Chrome 콘텐츠 설정으로, 글꼴/동영상/분석 스크립트는 URL 차단 목록(CDP)으로 받지 않는다
+    - page_load_strategy="eager": DOMContentLoaded에서 driver.get이 반환된다
+      (이미지 등 하위 리소스를 기다리지 않으므로, 호출하는 쪽은 필요한 요소를 기다려야 한다)
+
+    options()로 ChromeOptions를 만들고, 드라이버를 띄운 뒤 apply(driver)로 URL 차단을 건다.
+    start()는 둘을 한 번에 한다.
+
+    :param blocked_urls: 추가로 차단할 URL 패턴
+    """
+
+    def __init__(self, headless=True, block_images=True, block_fonts=True, block_media=True, block_analytics=True,
+                 blocked_urls=(), page_load_strategy="eager", window_size=(1920, 1080)):
+        self.headless = headless
+        self.block_images = block_images
+        self.page_load_strategy = page_load_strategy
+        self.window_size = window_size
+        self.blocked_urls = list(blocked_urls)
+        if block_fonts:
+            self.blocked_urls += FONT_URLS
+        if block_media:
+            self.blocked_urls += MEDIA_URLS
+        if block_analytics:
+            self.blocked_urls += ANALYTICS_URLS
+
+    def options(self, options=None):
+        """ChromeOptions에 이 프로필을 적용해 반환 (options가 없으면 새로 만든다)"""
+        options = options or webdriver.ChromeOptions()
+        if self.headless:
+            options.add_argument("--headless=new")
+        options.add_argument(f"--window-size={self.window_size[0]},{self.window_size[1]}")
+        options.add_argument("--disable-extensions")
+        options.add_argument("--mute-audio")
+        options.add_argument("--autoplay-policy=user-gesture-required")
+        if self.block_images:
+            options.add_experimental_option("prefs", {"profile.managed_default_content_settings.images": 2})
+        options.page_load_strategy = self.page_load_strategy
+        return options
+
+    def apply(self, driver):
+        """실행 중인 드라이버에 URL 차단 목록을 건다 (이후 모든 페이지에 적용)"""
+        if self.blocked_urls:
+            driver.execute_cdp_cmd("Network.enable", {})
+            driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": self.blocked_urls})
+        return driver
+
+    def start(self, options=None, **kwargs):
+        """이 프로필로 Chrome을 띄운다. kwargs는 webdriver.Chrome에 그대로 전달 (service 등)"""
+        return self.apply(webdriver.Chrome(options=self.options(options), **kwargs))
+
+
+# 모든 크롤러의 기본 프로필
+CRAWL_PROFILE = CrawlProfile()
+
+# 페이지 로드 지표: 문서 + 하위 리소스의 전송 바이트(transferSize), DOMContentLoaded / load 시각(ms)
+LOAD_METRICS_SCRIPT = """
+const nav = performance.getEntriesByType("navigation")[0];
+const resources = performance.getEntriesByType("resource");
+return {
+    bytes: (nav ? nav.transferSize : 0) + resources.reduce((sum, r) => sum + (r.transferSize || 0), 0),
+    requests: resources.length + 1,
+    dom_content_loaded: nav ? nav.domContentLoadedEventEnd : null,
+    load: nav ? nav.loadEventEnd : null,
+};
+"""
+
+
+def load_metrics(driver):
+    return driver.execute_script(LOAD_METRICS_SCRIPT)
+
+
+if __name__ == "__main__":
+    import os
+    import threading
+    import time
+    from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+    from selenium.webdriver.common.by import By
+    from selenium.webdriver.support import expected_conditions as EC
+    from selenium.webdriver.support.ui import WebDriverWait
+
+    # 리뷰 20개 + 이미지 30장(각 200KB) + 글꼴 + 동영상 + 분석 스크립트가 있는 리뷰 페이지. 각 리소스는 50ms 지연
+    ASSETS = {
+        "/img.png": (os.urandom(200_000), "image/png"),
+        "/font.woff2": (os.urandom(150_000), "font/woff2"),
+        "/clip.mp4": (os.urandom(2_000_000), "video/mp4"),
+        "/analytics.js": (b"/* tracker */" + b" " * 80_000, "application/javascript"),
+    }
+    PAGE = ("<html><head><style>@font-face{font-family:f;src:url(/font.woff2)} body{font-family:f}</style>"
+            "<script src='/analytics.js'></script></head><body>"
+            + "".join(f"<img src='/img.png?{i}'>" for i in range(30))
+            + "<video src='/clip.mp4' autoplay muted></video>"
+            + "".join(f"<div class='review'>review {i}</div>" for i in range(20))
+            + "</body></html>").encode("utf-8")
+    served = {"bytes": 0}
+    served_lock = threading.Lock()
+
+    class _FixtureHandler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            time.sleep(0.05)
+            body, content_type = ASSETS.get(self.path.split("?")[0], (PAGE, "text/html; charset=utf-8"))
+            self.send_response(200)
+            self.send_header("Content-Type", content_type)
+            self.send_header("Content-Length", str(len(body)))
+            self.send_header("Cache-Control", "no-store")
+            self.end_headers()
+            self.wfile.write(body)
+            with served_lock:
+                served["bytes"] += len(body)
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _FixtureHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    url = f"http://127.0.0.1:{server.server_address[1]}/reviews"
+
+    profiles = {
+        "default": None,  # 기존: webdriver.Chrome() 기본 옵션 (headless만 켬)
+        "crawl": CrawlProfile(blocked_urls=["*/analytics.js"]),  # 로컬 픽스처의 분석 스크립트도 차단
+    }
+    try:
+        for name, profile in profiles.items():
+            if profile is None:
+                options = webdriver.ChromeOptions()
+                options.add_argument("--headless=new")
+                driver = webdriver.Chrome(options=options)
+            else:
+                driver = profile.start()
+            try:
+                with served_lock:
+                    served["bytes"] = 0
+                start = time.perf_counter()
+                driver.get(url)
+                WebDriverWait(driver, 10).until(EC.presence_of_element_located((By.CLASS_NAME, "review")))
+                ready = time.perf_counter() - start
+                texts = [element.text for element in driver.find_elements(By.CLASS_NAME, "review")]
+                assert len(texts) == 20
+                time.sleep(1)  # 늦게 시작된 요청까지 서버 집계에 포함
+                metrics = load_metrics(driver)
+                print(f"{name:>8}: reviews ready in {ready:.2f}s, served {served['bytes'] / 1024:,.0f} KiB, "
+                      f"browser transfer {metrics['bytes'] / 1024:,.0f} KiB over {metrics['requests']} requests")
+            finally:
+                driver.quit()
+    finally:
+        server.shutdown()
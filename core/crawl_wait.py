@@ -0,0 +1,194 @@
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from selenium.webdriver.common.by import By
+
+
+class WaitStats:
+    """
+    대기 호출마다 실제로 기다린 시간과 허용된 최대 시간(고정 sleep이었다면 기다렸을 시간)을 기록한다.
+    """
+
+    def __init__(self):
+        self.calls = 0
+        self.waited = 0.0
+        self.budget = 0.0
+        self.timeouts = 0
+        self._lock = threading.Lock()  # 병렬 샤드가 하나의 WaitStats를 공유한다
+
+    def record(self, waited, budget, timed_out):
+        with self._lock:
+            self.calls += 1
+            self.waited += waited
+            self.budget += budget
+            self.timeouts += int(timed_out)
+
+    @property
+    def saved(self):
+        return self.budget - self.waited
+
+    def report(self):
+        return (f"{self.calls} waits, waited {self.waited:.1f}s of {self.budget:.1f}s "
+                f"(saved {self.saved:.1f}s, {self.timeouts} timeouts)")
+
+
+def wait_until(driver, condition, timeout=10, poll=0.1, stats=None):
+    """
+    condition(driver)가 참이 될 때까지 최대 timeout초 기다린다.
+    조건이 만족되는 즉시 반환하며, 만족 여부를 bool로 돌려준다.
+    """
+    start = time.monotonic()
+    satisfied = False
+    while True:
+        try:
+            satisfied = bool(condition(driver))
+        except Exception:
+            satisfied = False  # 페이지 전환 중 등 일시적인 오류는 다음 폴링에서 다시 확인
+        if satisfied or time.monotonic() - start >= timeout:
+            break
+        time.sleep(poll)
+
+    if stats:
+        stats.record(time.monotonic() - start, timeout, not satisfied)
+    return satisfied
+
+
+# --- 페이지 상태 측정 함수 (probe) ---
+
+def element_count(class_name=None, xpath=None):
+    """class_name 또는 xpath에 해당하는 요소 수를 반환하는 probe"""
+    def probe(driver):
+        if xpath:
+            return driver.execute_script(
+                "return document.evaluate(arguments[0], document, null, "
+                "XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null).snapshotLength;", xpath)
+        return driver.execute_script("return document.getElementsByClassName(arguments[0]).length;", class_name)
+    return probe
+
+
+def scroll_height(driver):
+    return driver.execute_script("return document.body.scrollHeight")
+
+
+def wait_for_change(driver, probe, baseline=None, timeout=10, poll=0.1, stats=None):
+    """
+    probe(driver) 값이 baseline과 달라질 때까지 기다린다 (리뷰 수나 스크롤 높이 변화 감지).
+    클릭/스크롤 전에 baseline을 측정해 넘겨야 그 사이의 변화를 놓치지 않는다.
+    """
+    if baseline is None:
+        baseline = probe(driver)
+    return wait_until(driver, lambda d: probe(d) != baseline, timeout=timeout, poll=poll, stats=stats)
+
+
+# 페이지가 지금까지 완료한 리소스 요청 수를 돌려주는 함수 (다른 스크립트에서도 재사용).
+# getEntriesByType("resource")는 타이밍 버퍼(기본 250개)가 차면 더 늘지 않으므로,
+# 처음 호출될 때 PerformanceObserver를 붙여 이후 요청을 누적해서 센다 (관찰자는 버퍼 크기와 무관하게 통지받는다).
+RESOURCE_COUNT_FUNCTION = """
+function resourceCount() {
+    if (window.__resourceCount === undefined) {
+        window.__resourceCount = performance.getEntriesByType("resource").length;
+        new PerformanceObserver(list => { window.__resourceCount += list.getEntries().length; })
+            .observe({type: "resource"});
+    }
+    return window.__resourceCount;
+}
+"""
+
+
+def resource_count(driver):
+    return driver.execute_script(RESOURCE_COUNT_FUNCTION + "return resourceCount();")
+
+
+def wait_for_network_idle(driver, idle_time=0.5, timeout=10, poll=0.1, stats=None):
+    """완료된 리소스 요청 수(resource_count)가 idle_time 동안 늘지 않으면 네트워크가 한가해진 것으로 본다."""
+    state = {"count": -1, "since": time.monotonic()}
+
+    def idle(d):
+        count = resource_count(d)
+        now = time.monotonic()
+        if count != state["count"]:
+            state["count"], state["since"] = count, now
+            return False
+        return now - state["since"] >= idle_time
+
+    return wait_until(driver, idle, timeout=timeout, poll=poll, stats=stats)
+
+
+def element_present(xpath=None, class_name=None):
+    """요소가 하나 이상 존재하면 참인 condition"""
+    by, value = (By.XPATH, xpath) if xpath else (By.CLASS_NAME, class_name)
+    return lambda d: len(d.find_elements(by, value)) > 0
+
+
+# --- 벤치마크용 로컬 픽스처: 'Load More'를 누르면 지연 후 리뷰가 추가되는 페이지 ---
+
+_FIXTURE_PAGE = """<html><body>
+<ul id="list"></ul>
+<a id="more" href="#" onclick="loadMore(); return false;"><span>더보기</span></a>
+<script>
+let total = 0;
+function loadMore() {
+    setTimeout(() => {
+        const list = document.getElementById('list');
+        for (let i = 0; i < 10; i++) {
+            const li = document.createElement('li');
+            li.innerHTML = '<span class="pui__vn15t2">review ' + (total++) + '</span>';
+            list.appendChild(li);
+        }
+    }, 300 + Math.random() * 500);
+}
+loadMore();
+</script></body></html>"""
+
+
+class _FixtureHandler(BaseHTTPRequestHandler):
+    def do_GET(self):
+        payload = _FIXTURE_PAGE.encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "text/html; charset=utf-8")
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def log_message(self, format, *args):
+        pass
+
+
+if __name__ == "__main__":
+    from selenium import webdriver
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _FixtureHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    url = f"http://127.0.0.1:{server.server_address[1]}/"
+    clicks, fixed_sleep = 10, 3
+
+    options = webdriver.ChromeOptions()
+    options.add_argument("--headless=new")
+    driver = webdriver.Chrome(options=options)
+    try:
+        count = element_count(class_name="pui__vn15t2")
+
+        # 기존 방식: 클릭마다 고정 sleep
+        driver.get(url)
+        start = time.perf_counter()
+        for _ in range(clicks):
+            driver.find_element(By.ID, "more").click()
+            time.sleep(fixed_sleep)
+        fixed_time = time.perf_counter() - start
+
+        # 이벤트 기반: 리뷰 수가 바뀌는 즉시 다음 단계로
+        driver.get(url)
+        stats = WaitStats()
+        start = time.perf_counter()
+        for _ in range(clicks):
+            before = count(driver)
+            driver.find_element(By.ID, "more").click()
+            wait_for_change(driver, count, before, timeout=fixed_sleep, stats=stats)
+        event_time = time.perf_counter() - start
+    finally:
+        driver.quit()
+        server.shutdown()
+
+    print(f"Fixed sleeps: {fixed_time:.1f}s, event-driven: {event_time:.1f}s")
+    print(stats.report())
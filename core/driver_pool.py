@@ -0,0 +1,213 @@
+import functools
+import queue
+import threading
+import time
+from contextlib import contextmanager
+
+from selenium import webdriver
+from selenium.common.exceptions import WebDriverException
+from selenium.webdriver.chrome.service import Service
+from webdriver_manager.chrome import ChromeDriverManager
+
+
+@functools.lru_cache(maxsize=None)
+def resolve_driver_path():
+    """ChromeDriver 바이너리 경로를 프로세스당 한 번만 확인한다."""
+    return ChromeDriverManager(cache_valid_range=7).install()
+
+
+def default_options(headless=True):
+    options = webdriver.ChromeOptions()
+    if headless:
+        options.add_argument("--headless=new")
+    options.add_argument("--window-size=1920,1080")
+    return options
+
+
+class PooledDriver:
+    """
+    lease()가 돌려주는 세션 핸들. WebDriver처럼 그대로 쓰면 되고(속성 접근을 실제 세션에 위임),
+    DriverPool.get이 재활용/장애 복구를 위해 내부 세션(driver)을 새것으로 바꿀 수 있다.
+    """
+
+    def __init__(self, driver):
+        self.driver = driver
+
+    def __getattr__(self, name):
+        return getattr(self.driver, name)
+
+
+class DriverPool:
+    """
+    미리 띄워둔 Chrome 세션을 빌려주고 돌려받는 풀.
+
+    :param size: 동시에 유지할 최대 세션 수
+    :param max_pages: 한 세션이 이만큼 페이지를 연 뒤에는 종료하고 새로 띄운다
+    :param options_factory: ChromeOptions를 만들어 주는 함수 (기본값: headless, profile이 있으면 profile.options)
+    :param profile: 세션마다 적용할 CrawlProfile (core/crawl_profile.py, 리소스 차단 등)
+    :param acquire_timeout: lease()가 빈 세션을 기다리는 기본 최대 시간 (초). 넘으면 TimeoutError
+    """
+
+    def __init__(self, size=2, max_pages=200, options_factory=None, profile=None, acquire_timeout=120):
+        self.size = size
+        self.max_pages = max_pages
+        self.acquire_timeout = acquire_timeout
+        self.profile = profile
+        self.options_factory = options_factory or (profile.options if profile else default_options)
+        self._idle = queue.LifoQueue()
+        self._pages = {}  # id(driver) -> 열었던 페이지 수
+        self._lock = threading.Lock()
+        self._created = 0
+        self._stats = {"created": 0, "leases": 0, "pages": 0, "recycled": 0, "crashed": 0, "wait_time": 0.0, "startup_time": 0.0}
+
+    def _create(self):
+        start = time.perf_counter()
+        driver = webdriver.Chrome(service=Service(resolve_driver_path()), options=self.options_factory())
+        if self.profile:
+            self.profile.apply(driver)
+        with self._lock:
+            self._pages[id(driver)] = 0
+            self._stats["created"] += 1
+            self._stats["startup_time"] += time.perf_counter() - start
+        return driver
+
+    def _discard(self, driver):
+        with self._lock:
+            self._pages.pop(id(driver), None)
+            self._created -= 1
+        try:
+            driver.quit()
+        except Exception:
+            pass
+
+    def warm(self, count=None):
+        """세션을 미리 띄워 둔다 (첫 크롤링의 콜드 스타트 제거)."""
+        count = min(count or self.size, self.size)
+        while True:
+            with self._lock:
+                if self._created >= count:
+                    return
+                self._created += 1
+            try:
+                self._idle.put(self._create())
+            except Exception:
+                with self._lock:
+                    self._created -= 1
+                raise
+
+    def _acquire(self, timeout):
+        deadline = time.monotonic() + timeout
+        while True:
+            try:
+                return self._idle.get_nowait()
+            except queue.Empty:
+                pass
+            with self._lock:
+                can_create = self._created < self.size
+                if can_create:
+                    self._created += 1
+            if can_create:
+                try:
+                    return self._create()
+                except Exception:
+                    with self._lock:
+                        self._created -= 1
+                    raise
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                raise TimeoutError(f"{timeout}초 안에 사용할 수 있는 브라우저 세션이 없습니다.")
+            # 다른 lease가 세션을 폐기해 자리가 나는 경우도 있으므로 짧게 나눠 기다리며 다시 확인한다
+            try:
+                return self._idle.get(timeout=min(remaining, 0.5))
+            except queue.Empty:
+                continue
+
+    @contextmanager
+    def lease(self, timeout=None):
+        """
+        풀에서 세션을 하나 빌린다 (PooledDriver). with 블록이 끝나면 자동으로 반환되며,
+        반환할 때 세션이 죽었거나 max_pages를 넘겼으면 종료하고 다음 요청 때 새로 띄운다.
+
+        :param timeout: 빈 세션을 기다리는 최대 시간 (None이면 acquire_timeout). 넘으면 TimeoutError
+        """
+        start = time.perf_counter()
+        handle = PooledDriver(self._acquire(self.acquire_timeout if timeout is None else timeout))
+        with self._lock:
+            self._stats["leases"] += 1
+            self._stats["wait_time"] += time.perf_counter() - start
+
+        try:
+            yield handle
+        finally:
+            self._release(handle.driver)
+
+    def _release(self, driver):
+        if not self._alive(driver):
+            with self._lock:
+                self._stats["crashed"] += 1
+            self._discard(driver)
+        elif self._pages.get(id(driver), 0) >= self.max_pages:
+            with self._lock:
+                self._stats["recycled"] += 1
+            self._discard(driver)
+        else:
+            self._idle.put(driver)
+
+    def _replace(self, handle, reason):
+        """빌려준 핸들의 세션을 종료하고 새 세션으로 바꾼다 (lease가 끝나지 않아도 재활용/복구되도록)"""
+        with self._lock:
+            self._stats[reason] += 1
+        self._discard(handle.driver)
+        with self._lock:
+            self._created += 1
+        try:
+            handle.driver = self._create()
+        except Exception:
+            with self._lock:
+                self._created -= 1
+            raise
+
+    def get(self, driver, url):
+        """
+        driver.get 대신 사용하면 세션별 페이지 수를 센다.
+        lease()로 빌린 핸들이면, 세션이 max_pages에 도달했을 때 페이지를 열기 전에 새 세션으로 바꾸고,
+        세션이 죽어 있으면 새 세션으로 바꿔 한 번 더 시도한다 (긴 lease 하나로 수천 페이지를 열어도 재활용된다).
+        """
+        pooled = isinstance(driver, PooledDriver)
+        if pooled and self._pages.get(id(driver.driver), 0) >= self.max_pages:
+            self._replace(driver, "recycled")
+        try:
+            driver.get(url)
+        except WebDriverException:
+            if not pooled or self._alive(driver.driver):
+                raise
+            self._replace(driver, "crashed")
+            driver.get(url)
+        key = id(driver.driver) if pooled else id(driver)
+        with self._lock:
+            self._pages[key] = self._pages.get(key, 0) + 1
+            self._stats["pages"] += 1
+
+    @staticmethod
+    def _alive(driver):
+        try:
+            driver.execute_script("return 1;")
+            return True
+        except Exception:
+            return False
+
+    def metrics(self):
+        with self._lock:
+            metrics = dict(self._stats)
+            metrics["open"] = self._created
+            metrics["idle"] = self._idle.qsize()
+            metrics["in_use"] = self._created - metrics["idle"]
+        return metrics
+
+    def close(self):
+        while True:
+            try:
+                driver = self._idle.get_nowait()
+            except queue.Empty:
+                break
+            self._discard(driver)
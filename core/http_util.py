@@ -0,0 +1,42 @@
+import threading
+import time
+from urllib.parse import urlparse
+
+import requests
+from requests.adapters import HTTPAdapter
+
+
+class HostRateLimiter:
+    """
+    호스트별 토큰 버킷 방식의 요청 속도 제한기.
+    고정된 time.sleep(1) 대신, 같은 호스트로 나가는 요청을 초당 `rate`회로 제한한다.
+    """
+
+    def __init__(self, rate=5.0, burst=1):
+        self.rate = rate
+        self.burst = burst
+        self._buckets = {}  # host -> [tokens, last_refill]
+        self._lock = threading.Lock()
+
+    def acquire(self, url):
+        host = urlparse(url).netloc
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                tokens, last = self._buckets.get(host, (self.burst, now))
+                tokens = min(self.burst, tokens + (now - last) * self.rate)
+                if tokens >= 1:
+                    self._buckets[host] = (tokens - 1, now)
+                    return
+                self._buckets[host] = (tokens, now)
+                wait = (1 - tokens) / self.rate
+            time.sleep(wait)
+
+
+def make_session(pool_size=10):
+    """keep-alive 연결 풀을 가진 requests.Session 생성"""
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
@@ -0,0 +1,99 @@
+import gzip
+import json
+import os
+import time
+import zlib
+
+
+class JsonlSink:
+    """
+    크롤링 결과를 도착하는 즉시 한 줄에 하나씩(JSONL) 추가 기록하는 스트리밍 저장소.
+    경로가 .gz로 끝나면 gzip으로 압축해서 기록한다.
+
+    :param path: 기록할 파일 경로 (이어쓰기 모드로 열림)
+    :param compress: gzip 압축 여부 (None이면 확장자로 판단)
+    :param flush_every: 이 개수만큼 기록할 때마다 flush
+    :param fsync_interval: 마지막 fsync 이후 이 시간(초)이 지나면 flush 시 fsync까지 수행
+    """
+
+    def __init__(self, path, compress=None, flush_every=20, fsync_interval=5.0):
+        if compress is None:
+            compress = path.endswith(".gz")
+        self.path = path
+        self.flush_every = flush_every
+        self.fsync_interval = fsync_interval
+        self.count = 0
+        self._raw = open(path, "ab")
+        # gzip은 flush 시 Z_SYNC_FLUSH로 블록을 마무리하므로 읽는 쪽이 중간까지 풀 수 있다
+        self._gzip = gzip.GzipFile(fileobj=self._raw, mode="ab") if compress else None
+        self._last_fsync = time.monotonic()
+
+    def write(self, record):
+        line = (json.dumps(record, ensure_ascii=False) + "\n").encode("utf-8")
+        (self._gzip or self._raw).write(line)
+        self.count += 1
+        if self.count % self.flush_every == 0:
+            self.flush()
+
+    def flush(self, fsync=False):
+        if self._gzip:
+            self._gzip.flush()
+        self._raw.flush()
+        if fsync or time.monotonic() - self._last_fsync >= self.fsync_interval:
+            os.fsync(self._raw.fileno())
+            self._last_fsync = time.monotonic()
+
+    def close(self):
+        if self._raw.closed:
+            return
+        self.flush(fsync=True)
+        if self._gzip:
+            self._gzip.close()
+        self._raw.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+
+def read_jsonl(path, follow=False, poll_interval=1.0):
+    """
+    JSONL(.gz 포함) 파일의 레코드를 순서대로 돌려주는 제너레이터.
+    follow=True면 파일 끝에 도달해도 멈추지 않고 (tail -f 처럼) 새로 추가되는 레코드를 기다린다.
+    """
+    compressed = path.endswith(".gz")
+    decompressor = zlib.decompressobj(wbits=31) if compressed else None
+    pending = b""
+
+    with open(path, "rb") as f:
+        while True:
+            chunk = f.read(65536)
+            if not chunk:
+                if not follow:
+                    break
+                time.sleep(poll_interval)
+                continue
+
+            if decompressor:
+                data = b""
+                while chunk:
+                    data += decompressor.decompress(chunk)
+                    # 이어쓰기로 생긴 다음 gzip 멤버는 새 압축 해제기로 처리
+                    chunk = decompressor.unused_data
+                    if decompressor.eof:
+                        decompressor = zlib.decompressobj(wbits=31)
+                chunk = data
+
+            lines = (pending + chunk).split(b"\n")
+            pending = lines.pop()  # 아직 줄바꿈이 오지 않은 마지막 조각
+            for line in lines:
+                if line.strip():
+                    yield json.loads(line)
+
+    if pending.strip():
+        try:
+            yield json.loads(pending)
+        except ValueError:
+            pass  # 기록 도중인 마지막 줄
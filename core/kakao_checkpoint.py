@@ -0,0 +1,58 @@
+import json
+import os
+
+
+class CommentCheckpoint:
+    """
+    place_id 단위로 카카오 리뷰 수집 상태를 디스크에 저장한다.
+
+    - {place_id}.comments.jsonl : 지금까지 수집한 리뷰 (한 줄에 한 개)
+    - {place_id}.state.json     : 다음에 요청할 `commentid` 커서, 완료 여부,
+                                  가장 최신 리뷰 ID(newest_id)와 증분 수집 종료 지점(stop_at)
+    """
+
+    def __init__(self, checkpoint_dir, place_id):
+        os.makedirs(checkpoint_dir, exist_ok=True)
+        self.comments_path = os.path.join(checkpoint_dir, f"{place_id}.comments.jsonl")
+        self.state_path = os.path.join(checkpoint_dir, f"{place_id}.state.json")
+
+    def load_state(self):
+        state = {"cursor": None, "complete": False, "newest_id": None, "stop_at": None}
+        if os.path.exists(self.state_path):
+            with open(self.state_path, "r", encoding="utf-8") as f:
+                state.update(json.load(f))
+        return state
+
+    def save_state(self, state):
+        # 임시 파일에 쓴 뒤 교체해서 중간에 죽어도 상태 파일이 깨지지 않도록 함
+        tmp_path = self.state_path + ".tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(state, f)
+        os.replace(tmp_path, self.state_path)
+
+    def load_comments(self):
+        if not os.path.exists(self.comments_path):
+            return []
+        comments = []
+        with open(self.comments_path, "r", encoding="utf-8") as f:
+            for line in f:
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    comments.append(json.loads(line))
+                except ValueError:
+                    continue  # 중간에 종료되어 쓰다 만 줄은 건너뜀
+        return comments
+
+    def known_ids(self):
+        return {comment["commentid"] for comment in self.load_comments()}
+
+    def save_page(self, comments, state):
+        """리뷰를 먼저 기록하고 상태를 갱신한다 (커서가 리뷰보다 앞서 나가지 않도록)."""
+        with open(self.comments_path, "a", encoding="utf-8") as f:
+            for comment in comments:
+                f.write(json.dumps(comment, ensure_ascii=False) + "\n")
+            f.flush()
+            os.fsync(f.fileno())
+        self.save_state(state)
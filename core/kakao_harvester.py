@@ -0,0 +1,99 @@
+import json
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from http_util import HostRateLimiter, make_session
+from review_kakao import BASE_URL, scrape_all_comments
+
+
+def harvest_comments(place_ids, max_workers=8, rate=5.0, base_url=BASE_URL, checkpoint_dir=None, incremental=False):
+    """
+    여러 place_id의 카카오 리뷰를 동시에 수집한다.
+
+    :param place_ids: 수집할 place_id 목록
+    :param max_workers: 동시에 실행할 워커 수
+    :param rate: 호스트당 초당 최대 요청 수
+    :param base_url: commentlist API 주소 (로컬 스텁 서버 벤치마크용으로 교체 가능)
+    :param checkpoint_dir: place별 커서/리뷰를 저장할 디렉터리 (scrape_all_comments 참고)
+    :param incremental: 이미 수집한 리뷰를 만나면 중단하는 증분 수집 모드
+    :return: {place_id: comments} 딕셔너리
+    """
+    limiter = HostRateLimiter(rate=rate, burst=max_workers)
+    local = threading.local()
+    sessions = []
+
+    def worker(place_id):
+        # requests.Session은 스레드 간 공유가 안전하지 않으므로 워커마다 하나씩 유지
+        if not hasattr(local, "session"):
+            local.session = make_session()
+            sessions.append(local.session)
+        return scrape_all_comments(place_id, session=local.session, rate_limiter=limiter, base_url=base_url,
+                                   checkpoint_dir=checkpoint_dir, incremental=incremental)
+
+    results = {}
+    try:
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = {executor.submit(worker, place_id): place_id for place_id in place_ids}
+            for future in as_completed(futures):
+                place_id = futures[future]
+                try:
+                    results[place_id] = future.result()
+                except Exception as e:
+                    print(f"Failed to harvest {place_id}: {e}")
+                    results[place_id] = []
+    finally:
+        for session in sessions:
+            session.close()
+
+    return results
+
+
+# 벤치마크용 로컬 스텁 서버: commentlist/v/{place_id}/{commentid} 페이지네이션을 흉내낸다
+class _StubCommentHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"  # keep-alive 지원
+    total_comments = 100
+    page_size = 5
+    latency = 0.02
+
+    def do_GET(self):
+        parts = self.path.strip("/").split("/")  # commentlist/v/{place_id}[/{commentid}]
+        cursor = int(parts[3]) if len(parts) > 3 else self.total_comments + 1
+        ids = range(cursor - 1, max(cursor - 1 - self.page_size, 0), -1)
+        comments = [{"commentid": i, "contents": f"review {parts[2]}-{i}", "point": i % 5 + 1} for i in ids]
+        body = {"comment": {"list": comments}} if comments else {"comment": {}}
+        payload = json.dumps(body).encode("utf-8")
+
+        time.sleep(self.latency)
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def log_message(self, format, *args):
+        pass
+
+
+def run_stub_server(port=0):
+    server = ThreadingHTTPServer(("127.0.0.1", port), _StubCommentHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server, f"http://127.0.0.1:{server.server_address[1]}/commentlist/v/"
+
+
+if __name__ == "__main__":
+    server, stub_url = run_stub_server()
+    place_ids = [str(10000 + i) for i in range(20)]
+
+    start = time.perf_counter()
+    sequential = {p: scrape_all_comments(p, base_url=stub_url, delay=0) for p in place_ids}
+    sequential_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    concurrent = harvest_comments(place_ids, max_workers=8, rate=200, base_url=stub_url)
+    concurrent_time = time.perf_counter() - start
+
+    server.shutdown()
+    total = sum(len(c) for c in concurrent.values())
+    print(f"Sequential: {sequential_time:.2f}s, Concurrent: {concurrent_time:.2f}s ({total} comments)")
@@ -0,0 +1,383 @@
+import json
+import math
+import re
+import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+
+import requests
+
+from http_util import HostRateLimiter, make_session
+from review_dedup import ReviewDeduper
+
+GRAPHQL_URL = "https://pcmap-api.place.naver.com/graphql"
+DEFAULT_HEADERS = {
+    "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0 Safari/537.36",
+    "Accept-Language": "ko-KR,ko;q=0.9",
+}
+
+# 방문자 리뷰 목록 화면이 "더보기"를 누를 때 보내는 것과 같은 형태의 GraphQL 요청
+VISITOR_REVIEWS_QUERY = """
+query getVisitorReviews($input: VisitorReviewsInput) {
+  visitorReviews(input: $input) {
+    items { id rating author { id nickname } body visitCount visited created }
+    total
+  }
+}
+"""
+
+_PLACE_URL = re.compile(r"/(\w+)/(\d+)/review")
+_APOLLO_MARKER = "window.__APOLLO_STATE__"
+
+
+class NaverHttpError(Exception):
+    """HTTP 응답에서 리뷰를 읽을 수 없을 때 (Selenium 경로로 넘어가야 함)"""
+
+
+def parse_place_url(page_url):
+    """".../restaurant/11592650/review/visitor" -> ("restaurant", "11592650")"""
+    match = _PLACE_URL.search(page_url)
+    if not match:
+        raise ValueError(f"네이버 플레이스 리뷰 URL이 아닙니다: {page_url}")
+    return match.group(1), match.group(2)
+
+
+def normalize_review(raw, refs=None):
+    """
+    GraphQL/Apollo 리뷰 객체를 저장용 dict로 정리한다.
+    review(본문)와 value(방문 횟수)는 Selenium 수집기(review_yuzu_naver)가 만드는 값과 같은 의미다.
+
+    :param raw: VisitorReview 객체
+    :param refs: Apollo 상태 전체 ({"__ref": key} 참조를 풀 때 사용)
+    """
+    author = raw.get("author") or {}
+    if "__ref" in author:
+        author = (refs or {}).get(author["__ref"], {})
+    return {
+        "id": raw.get("id"),
+        "review": (raw.get("body") or "").strip(),
+        "value": raw.get("visitCount"),
+        "rating": raw.get("rating"),
+        "author": author.get("nickname"),
+        "visited": raw.get("visited"),
+        "created": raw.get("created"),
+    }
+
+
+def parse_graphql_reviews(payload):
+    """
+    getVisitorReviews 응답(배치 요청이면 목록)에서 (정리된 리뷰 목록, 전체 리뷰 수)를 꺼낸다.
+    응답 형태가 예상과 다르면 NaverHttpError.
+    """
+    if isinstance(payload, list):
+        if not payload:
+            raise NaverHttpError("빈 GraphQL 응답")
+        payload = payload[0]
+    if payload.get("errors"):
+        raise NaverHttpError(f"GraphQL 오류: {payload['errors'][0].get('message', payload['errors'][0])}")
+    data = (payload.get("data") or {}).get("visitorReviews")
+    if not isinstance(data, dict) or not isinstance(data.get("items"), list):
+        raise NaverHttpError("응답에 visitorReviews.items가 없습니다")
+    return [normalize_review(item) for item in data["items"]], data.get("total")
+
+
+def parse_apollo_state(html):
+    """페이지 HTML에 들어 있는 window.__APOLLO_STATE__ 객체를 dict로 반환"""
+    marker = html.find(_APOLLO_MARKER)
+    if marker < 0:
+        raise NaverHttpError("페이지에 __APOLLO_STATE__가 없습니다")
+    start = html.find("{", marker)
+    try:
+        state, _ = json.JSONDecoder().raw_decode(html, start)
+    except ValueError as e:
+        raise NaverHttpError(f"__APOLLO_STATE__를 해석할 수 없습니다: {e}") from e
+    return state
+
+
+def parse_apollo_reviews(html):
+    """페이지에 처음부터 실려 오는 리뷰(첫 화면 분량)를 Apollo 상태에서 꺼낸다"""
+    state = parse_apollo_state(html)
+    return [normalize_review(value, state) for key, value in state.items() if key.startswith("VisitorReview:")]
+
+
+class NaverReviewClient:
+    """
+    네이버 플레이스 방문자 리뷰를 브라우저 없이 HTTP로 읽는 클라이언트.
+
+    첫 페이지에서 전체 리뷰 수를 받은 뒤 나머지 페이지를 workers개 스레드로 동시에 요청한다.
+    requests.Session은 스레드마다 하나씩 유지하고, 요청 속도는 HostRateLimiter로 제한한다.
+
+    :param page_url: 방문자 리뷰 페이지 URL (업종과 place id를 여기서 읽는다)
+    :param page_size: 한 번에 요청할 리뷰 수
+    :param rate_limiter: HostRateLimiter (없으면 제한 없음)
+    :param graphql_url: GraphQL 주소 (로컬 스텁 서버 벤치마크용으로 교체 가능)
+    """
+
+    def __init__(self, page_url, page_size=50, rate_limiter=None, graphql_url=GRAPHQL_URL, timeout=10):
+        self.page_url = page_url
+        self.business_type, self.business_id = parse_place_url(page_url)
+        self.page_size = page_size
+        self.rate_limiter = rate_limiter
+        self.graphql_url = graphql_url
+        self.timeout = timeout
+        self.headers = dict(DEFAULT_HEADERS, Referer=page_url)
+        self._local = threading.local()
+        self._sessions = []
+        self._lock = threading.Lock()
+
+    def _session(self):
+        session = getattr(self._local, "session", None)
+        if session is None:
+            session = self._local.session = make_session()
+            with self._lock:
+                self._sessions.append(session)
+        return session
+
+    def _request(self, method, url, **kwargs):
+        if self.rate_limiter:
+            self.rate_limiter.acquire(url)
+        response = self._session().request(method, url, headers=self.headers, timeout=self.timeout, **kwargs)
+        response.raise_for_status()
+        return response
+
+    def fetch_page(self, page):
+        """page번째(1부터) 리뷰 페이지 -> (리뷰 목록, 전체 리뷰 수)"""
+        variables = {"input": {"businessId": self.business_id, "businessType": self.business_type,
+                               "item": "0", "page": page, "size": self.page_size,
+                               "includeContent": True, "isPhotoUsed": False}}
+        payload = [{"operationName": "getVisitorReviews", "variables": variables, "query": VISITOR_REVIEWS_QUERY}]
+        return parse_graphql_reviews(self._request("POST", self.graphql_url, json=payload).json())
+
+    def fetch_embedded(self):
+        """GraphQL을 쓸 수 없을 때: 리뷰 페이지 HTML에 실린 첫 화면 분량의 리뷰"""
+        return parse_apollo_reviews(self._request("GET", self.page_url).text)
+
+    def iter_pages(self, workers=4):
+        """
+        페이지별 리뷰 목록을 순서대로 돌려주는 제너레이터.
+
+        재수집이면 앞쪽 페이지는 이미 본 리뷰뿐일 수 있으므로, 필요한 리뷰 수가 아니라 마지막 페이지까지 진행한다.
+        동시에 요청 중인 페이지는 workers x 2개로 제한하며, 소비하는 쪽이 멈추면 아직 시작하지 않은 요청은 취소한다.
+        """
+        reviews, total = self.fetch_page(1)
+        yield reviews
+        if len(reviews) < self.page_size:
+            return
+
+        if total is None:
+            # 전체 수를 모르면 덜 찬 페이지가 나올 때까지 차례로 요청
+            page = 1
+            while reviews and len(reviews) >= self.page_size:
+                page += 1
+                reviews, _ = self.fetch_page(page)
+                yield reviews
+            return
+
+        last_page = math.ceil(total / self.page_size)
+        next_page = 2
+        pending = deque()
+        executor = ThreadPoolExecutor(max_workers=workers)
+        try:
+            while True:
+                while next_page <= last_page and len(pending) < workers * 2:
+                    pending.append(executor.submit(self.fetch_page, next_page))
+                    next_page += 1
+                if not pending:
+                    return
+                reviews, _ = pending.popleft().result()
+                yield reviews
+                if not reviews:
+                    return
+        finally:
+            executor.shutdown(wait=True, cancel_futures=True)
+
+    def close(self):
+        with self._lock:
+            sessions, self._sessions = self._sessions, []
+        for session in sessions:
+            session.close()
+
+
+def default_record(review):
+    return {"review": review["review"], "value": review["value"]}
+
+
+def fetch_reviews(page_url, max_reviews=100, sink=None, seen_path=None, record=default_record, fallback=None,
+                  page_size=50, workers=4, rate=5.0, graphql_url=GRAPHQL_URL):
+    """
+    방문자 리뷰를 HTTP로 먼저 수집하고, 실패하면 fallback(Selenium 수집기)으로 나머지를 채운다.
+
+    1. GraphQL 페이지를 동시에 요청 (정상 경로)
+    2. GraphQL이 실패하면 리뷰 페이지 HTML의 __APOLLO_STATE__에서 첫 화면 분량만 읽는다
+    3. 그래도 max_reviews에 못 미치면 fallback(남은 개수)을 호출한다
+
+    :param record: 정리된 리뷰 dict -> sink에 쓰고 반환할 값 (기본값: {"review", "value"})
+    :param fallback: remaining -> 수집한 레코드 목록. 예: lambda n: scrape_reviews(..., max_reviews=n, seen_path=seen_path)
+                     seen_path를 같이 넘기면 HTTP로 이미 받은 리뷰를 건너뛴다
+    :param rate: 호스트당 초당 최대 요청 수 (요청 하나에 page_size개 리뷰)
+    :return: record로 변환한 리뷰 목록
+    """
+    results = []
+    seen = ReviewDeduper("naver", page_url, path=seen_path)
+    client = NaverReviewClient(page_url, page_size=page_size, graphql_url=graphql_url,
+                               rate_limiter=HostRateLimiter(rate=rate, burst=workers))
+    complete = False
+
+    def take(reviews):
+        """새 리뷰를 기록하고, max_reviews를 채웠으면 True"""
+        try:
+            for review in reviews:
+                if not review["review"] or not seen.add(review["review"]):
+                    continue
+                item = record(review)
+                results.append(item)
+                if sink:
+                    sink.write(item)
+                if len(results) >= max_reviews:
+                    return True
+            return False
+        finally:
+            if sink:
+                sink.flush()  # 리뷰를 먼저 기록한 뒤 키를 기록해야, 중단되어도 리뷰가 빠지지 않는다
+            seen.flush()
+
+    try:
+        try:
+            for reviews in client.iter_pages(workers):
+                if take(reviews):
+                    break
+            complete = True
+        except (requests.RequestException, ValueError, NaverHttpError) as e:
+            print(f"GraphQL fetch failed ({e}); reading reviews embedded in the page.")
+            try:
+                take(client.fetch_embedded())
+            except (requests.RequestException, ValueError, NaverHttpError) as e:
+                print(f"Embedded review state unavailable: {e}")
+    finally:
+        client.close()
+        seen.close()  # fallback이 같은 seen_path를 다시 열 수 있도록 먼저 닫는다
+
+    print(f"Collected {len(results)} reviews over HTTP.")
+    if not complete and fallback and len(results) < max_reviews:
+        print("Falling back to Selenium for the remaining reviews.")
+        results.extend(fallback(max_reviews - len(results)))
+    return results
+
+
+def _graphql_response(start, count, total):
+    items = [{"__typename": "VisitorReview", "id": f"r{i}", "rating": None, "body": f"리뷰 {i} 맛있어요\n또 올게요",
+              "visitCount": i % 3 + 1, "visited": "1.1.월", "created": "1.2.화",
+              "author": {"__typename": "VisitorReviewAuthor", "id": f"a{i}", "nickname": f"user{i}"}}
+             for i in range(start, min(start + count, total))]
+    return [{"data": {"visitorReviews": {"__typename": "VisitorReviewsResult", "items": items, "total": total}}}]
+
+
+if __name__ == "__main__":
+    import os
+    import tempfile
+    import time
+    from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+    # fixtures/: 방문자 리뷰 페이지의 GraphQL getVisitorReviews 응답과 첫 화면 HTML(__APOLLO_STATE__)을 같은 형태로 옮긴 샘플.
+    # 리뷰 본문은 data/naver_yuzu_review.csv의 실제 리뷰. 응답 형태가 바뀌면 브라우저에서 다시 저장해 교체한다
+    fixture_dir = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fixtures")
+    with open(os.path.join(fixture_dir, "naver_graphql_visitor_reviews.json"), encoding="utf-8") as f:
+        raw = f.read()
+    with open(os.path.join(fixture_dir, "naver_visitor_page.html"), encoding="utf-8") as f:
+        page_html = f.read()
+
+    reviews, total = parse_graphql_reviews(json.loads(raw))
+    assert total == 1873 and len(reviews) == 10, (total, len(reviews))
+    assert reviews[0] == {
+        "id": "65d1c3f2a8e4b1002e7f3a10", "review": reviews[0]["review"], "value": 1, "rating": None,
+        "author": "라멘러버", "visited": "2.17.토", "created": "2.18.일",
+    }, reviews[0]
+    assert reviews[0]["review"].startswith("북촌나들이\n창덕궁 가기전") and reviews[0]["review"].endswith("그래도 맛있게 잘 먹음^^")
+    assert [r["value"] for r in reviews] == [1, 1, 1, 1, 1, 1, 1, 2, 1, 1]
+    assert reviews[-1]["review"] == "" and reviews[-1]["author"] == "녹는다", "사진만 있는 리뷰는 본문이 null"
+
+    embedded = parse_apollo_reviews(page_html)
+    assert len(embedded) == 10, len(embedded)
+    assert embedded[0]["author"] == "라멘러버", "작성자는 __ref로 풀어야 한다"
+    assert embedded == reviews, "첫 화면 분량은 GraphQL 첫 페이지와 같은 리뷰여야 한다"
+
+    for payload in ([{"errors": [{"message": "PersistedQueryNotFound"}]}],
+                    [{"data": {"visitorReviewStats": {"id": "1734509786", "review": {"totalCount": 1873}}}}], []):
+        try:
+            parse_graphql_reviews(payload)
+            raise AssertionError(f"NaverHttpError expected: {payload}")
+        except NaverHttpError:
+            pass
+    try:
+        parse_apollo_reviews("<html><body></body></html>")
+        raise AssertionError("a page without __APOLLO_STATE__ must raise NaverHttpError")
+    except NaverHttpError:
+        pass
+    print(f"Fixtures OK: {len(reviews)} reviews (total {total}) from GraphQL, {len(embedded)} from page state")
+
+    rounds = 200
+    start = time.perf_counter()
+    for _ in range(rounds):
+        parse_graphql_reviews(json.loads(raw))
+    elapsed = time.perf_counter() - start
+    print(f"Parsing: {rounds * len(reviews) / elapsed:,.0f} reviews/sec")
+
+    # 응답에 100ms가 걸리는 로컬 스텁 서버로 수집 전체를 측정
+    LATENCY, TOTAL = 0.1, 2000
+    failing = {"graphql": False}
+
+    class _StubHandler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def _reply(self, status, body, content_type):
+            data = body.encode("utf-8")
+            time.sleep(LATENCY)
+            self.send_response(status)
+            self.send_header("Content-Type", content_type)
+            self.send_header("Content-Length", str(len(data)))
+            self.end_headers()
+            self.wfile.write(data)
+
+        def do_POST(self):
+            request = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+            if failing["graphql"]:
+                self._reply(200, json.dumps([{"errors": [{"message": "schema changed"}]}]), "application/json")
+                return
+            page_input = request[0]["variables"]["input"]
+            size = page_input["size"]
+            body = _graphql_response((page_input["page"] - 1) * size, size, TOTAL)
+            self._reply(200, json.dumps(body, ensure_ascii=False), "application/json")
+
+        def do_GET(self):
+            self._reply(200, page_html, "text/html")
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _StubHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    base = f"http://127.0.0.1:{server.server_address[1]}"
+    page_url = f"{base}/restaurant/11592650/review/visitor"
+    try:
+        start = time.perf_counter()
+        collected = fetch_reviews(page_url, max_reviews=TOTAL, graphql_url=f"{base}/graphql", workers=8, rate=100)
+        elapsed = time.perf_counter() - start
+        assert len(collected) == TOTAL and collected[0] == {"review": "리뷰 0 맛있어요\n또 올게요", "value": 1}
+        print(f"HTTP fetch ({LATENCY * 1000:.0f}ms/page): {len(collected)} reviews in {elapsed:.2f}s "
+              f"= {len(collected) / elapsed:,.0f} reviews/sec")
+
+        # 재수집: 앞의 100개는 이미 본 리뷰라도 그다음 100개를 받아야 한다
+        seen_path = os.path.join(tempfile.mkdtemp(), "naver.seen")
+        first = fetch_reviews(page_url, max_reviews=100, seen_path=seen_path, graphql_url=f"{base}/graphql", rate=100)
+        second = fetch_reviews(page_url, max_reviews=100, seen_path=seen_path, graphql_url=f"{base}/graphql", rate=100)
+        assert second[0]["review"] == "리뷰 100 맛있어요\n또 올게요" and len(first) == len(second) == 100
+        print("Re-crawl with a persisted seen index: pages of already-seen reviews skipped, next 100 collected")
+
+        failing["graphql"] = True
+        requested = []
+        collected = fetch_reviews(page_url, max_reviews=30, graphql_url=f"{base}/graphql",
+                                  fallback=lambda remaining: requested.append(remaining) or [])
+        assert len(collected) == 9 and requested == [21], (len(collected), requested)
+        print("GraphQL failure: 9 reviews from page state, remaining 21 handed to the Selenium fallback")
+    finally:
+        server.shutdown()
@@ -0,0 +1,210 @@
+import base64
+import json
+import re
+import time
+from collections import namedtuple
+
+from selenium.common.exceptions import WebDriverException
+
+# 리뷰 객체로 볼 수 있는 본문 키 (플랫폼마다 다름: 카카오 contents, 네이버 body 등)
+TEXT_KEYS = ("contents", "content", "body", "reviewText", "text", "comment")
+
+CapturedResponse = namedtuple("CapturedResponse", ["url", "status", "mime_type", "data"])
+
+
+def capture_options(options):
+    """
+    ChromeOptions에 performance 로그(네트워크 이벤트)를 켠다. headless에서도 동작한다.
+    DriverPool에는 options_factory=lambda: capture_options(default_options())처럼 넘긴다.
+    """
+    options.set_capability("goog:loggingPrefs", {"performance": "ALL"})
+    options.add_experimental_option("perfLoggingPrefs", {"enableNetwork": True, "enablePage": False})
+    return options
+
+
+class NetworkCapture:
+    """
+    페이지가 스크롤/클릭 중에 받아 오는 XHR/fetch 응답을 Chrome DevTools performance 로그로 기록한다.
+
+    poll()은 지난 호출 이후 끝난 응답 중 url_pattern에 맞는 것의 본문을 CDP(Network.getResponseBody)로 읽어
+    CapturedResponse 목록으로 반환한다. 요소마다 WebDriver를 왕복하거나 숨겨진 노드를 펼칠 필요 없이
+    리뷰를 API 응답(JSON)에서 바로 꺼낼 수 있다.
+
+    :param driver: capture_options()로 만든 WebDriver
+    :param url_pattern: 기록할 응답 URL 정규식 (None이면 전부)
+    :param resource_types: 기록할 요청 종류
+    :param json_only: JSON으로 해석되지 않는 본문은 버린다
+    """
+
+    def __init__(self, driver, url_pattern=None, resource_types=("XHR", "Fetch"), json_only=True):
+        self.driver = driver
+        self.url_pattern = re.compile(url_pattern) if url_pattern else None
+        self.resource_types = set(resource_types)
+        self.json_only = json_only
+        self._pending = {}  # requestId -> (url, status, mime_type): 응답 헤더는 왔지만 본문이 아직 끝나지 않은 요청
+        self.stats = {"events": 0, "matched": 0, "bodies": 0, "errors": 0}
+
+    def clear(self):
+        """지금까지 쌓인 로그를 버린다 (이후 발생한 요청만 기록)"""
+        self.driver.get_log("performance")
+        self._pending.clear()
+
+    def _matches(self, params):
+        response = params.get("response", {})
+        if params.get("type") not in self.resource_types:
+            return False
+        return self.url_pattern is None or bool(self.url_pattern.search(response.get("url", "")))
+
+    def _body(self, request_id, url, status, mime_type):
+        try:
+            result = self.driver.execute_cdp_cmd("Network.getResponseBody", {"requestId": request_id})
+        except WebDriverException:
+            self.stats["errors"] += 1  # 본문이 이미 버려졌거나(페이지 이동) 읽을 수 없는 응답
+            return None
+        body = result.get("body", "")
+        if result.get("base64Encoded"):
+            body = base64.b64decode(body).decode("utf-8", "replace")
+        try:
+            data = json.loads(body)
+        except ValueError:
+            if self.json_only:
+                return None
+            data = body
+        self.stats["bodies"] += 1
+        return CapturedResponse(url, status, mime_type, data)
+
+    def poll(self):
+        """지난 poll 이후 본문 수신이 끝난 응답 목록"""
+        captured = []
+        for entry in self.driver.get_log("performance"):
+            self.stats["events"] += 1
+            message = json.loads(entry["message"])["message"]
+            method, params = message.get("method"), message.get("params", {})
+            if method == "Network.responseReceived" and self._matches(params):
+                response = params["response"]
+                self._pending[params["requestId"]] = (response.get("url"), response.get("status"), response.get("mimeType"))
+                self.stats["matched"] += 1
+            elif method == "Network.loadingFinished" and params.get("requestId") in self._pending:
+                response = self._body(params["requestId"], *self._pending.pop(params["requestId"]))
+                if response is not None:
+                    captured.append(response)
+            elif method == "Network.loadingFailed":
+                self._pending.pop(params.get("requestId"), None)
+        return captured
+
+    def wait(self, timeout=5, poll_interval=0.1):
+        """응답이 하나 이상 들어올 때까지(최대 timeout초) 기다려 반환"""
+        deadline = time.monotonic() + timeout
+        captured = self.poll()
+        while not captured and time.monotonic() < deadline:
+            time.sleep(poll_interval)
+            captured = self.poll()
+        return captured
+
+
+def iter_records(data, text_keys=TEXT_KEYS):
+    """응답 JSON을 문서 순서대로 훑어 text_keys 중 하나를 문자열로 가진 dict(리뷰 객체)를 돌려준다"""
+    stack = [data]
+    while stack:
+        node = stack.pop()
+        if isinstance(node, dict):
+            if any(isinstance(node.get(key), str) for key in text_keys):
+                yield node
+                continue
+            stack.extend(reversed(list(node.values())))
+        elif isinstance(node, list):
+            stack.extend(reversed(node))
+
+
+def review_texts(data, text_keys=TEXT_KEYS):
+    """응답 JSON에 들어 있는 리뷰 본문 목록"""
+    texts = []
+    for record in iter_records(data, text_keys):
+        text = next(record[key] for key in text_keys if isinstance(record.get(key), str)).strip()
+        if text:
+            texts.append(text)
+    return texts
+
+
+if __name__ == "__main__":
+    import threading
+    from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+    from selenium import webdriver
+    from selenium.webdriver.common.by import By
+
+    from crawl_wait import scroll_height, wait_for_change
+
+    PAGES, PER_PAGE = 20, 30
+
+    # 스크롤할 때마다 /api/reviews?page=n 을 fetch해서 리뷰를 붙이는 무한 스크롤 페이지 (본문 일부는 숨겨져 있음)
+    PAGE = """<html><body><div id='reviews'></div><script>
+let page = 0, loading = false;
+async function more() {
+    if (loading || page >= %d) return;
+    loading = true;
+    const data = await (await fetch('/api/reviews?page=' + (++page))).json();
+    for (const r of data.reviews) {
+        const div = document.createElement('div');
+        div.className = 'review';
+        div.style.height = '120px';
+        div.innerHTML = '<p>' + r.contents + '</p><div class="x9vxc45" style="display:none">' + r.extra + '</div>';
+        document.getElementById('reviews').appendChild(div);
+    }
+    loading = false;
+}
+window.addEventListener('scroll', more);
+more();
+</script></body></html>""" % PAGES
+
+    class _FixtureHandler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            if self.path.startswith("/api/reviews"):
+                page = int(self.path.split("page=")[1])
+                reviews = [{"id": i, "contents": f"리뷰 {i}", "extra": "숨겨진 내용"}
+                           for i in range((page - 1) * PER_PAGE, page * PER_PAGE)]
+                body, content_type = json.dumps({"reviews": reviews}, ensure_ascii=False), "application/json"
+            else:
+                body, content_type = PAGE, "text/html"
+            data = body.encode("utf-8")
+            self.send_response(200)
+            self.send_header("Content-Type", content_type)
+            self.send_header("Content-Length", str(len(data)))
+            self.end_headers()
+            self.wfile.write(data)
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _FixtureHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    url = f"http://127.0.0.1:{server.server_address[1]}/"
+
+    options = webdriver.ChromeOptions()
+    options.add_argument("--headless=new")
+    driver = webdriver.Chrome(options=capture_options(options))
+    try:
+        capture = NetworkCapture(driver, url_pattern=r"/api/reviews")
+        driver.get(url)
+        captured = []
+        dom_time = 0.0
+        while True:
+            captured.extend(text for response in capture.wait(timeout=2) for text in review_texts(response.data))
+
+            # 비교용: 기존 방식 (숨겨진 노드를 펼치고 요소마다 .text)
+            start = time.perf_counter()
+            driver.execute_script("document.querySelectorAll('.x9vxc45').forEach(el => el.style.display = 'block');")
+            dom = [element.text for element in driver.find_elements(By.CLASS_NAME, "review")]
+            dom_time += time.perf_counter() - start
+
+            before = scroll_height(driver)
+            driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
+            if not wait_for_change(driver, scroll_height, before, timeout=2):
+                break
+
+        assert captured == [f"리뷰 {i}" for i in range(PAGES * PER_PAGE)], len(captured)
+        print(f"Captured {len(captured)} reviews from {capture.stats['bodies']} responses: {capture.stats}")
+        print(f"DOM extraction (unhide + element.text on every scroll): {dom_time:.2f}s for {len(dom)} elements")
+    finally:
+        driver.quit()
+        server.shutdown()
@@ -0,0 +1,250 @@
+import hashlib
+import os
+import re
+import unicodedata
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+
+# 규칙을 바꾸면 올려서, 이전 규칙으로 정제한 캐시 항목을 쓰지 않게 한다
+RULES_VERSION = 2
+
+# 전각 영숫자/기호 -> 반각 (NFKC는 ㅋ 같은 호환 자모까지 바꿔 버리므로 이 범위만 직접 변환)
+_FULLWIDTH = {code: code - 0xFEE0 for code in range(0xFF01, 0xFF5F)}
+_FULLWIDTH[0x3000] = 0x20
+# 보이지 않는 문자: zero-width, BOM, 이모지 변형 선택자, 피부색 수식자
+_INVISIBLE = {code: None for code in (0x200B, 0x200C, 0x200D, 0x2060, 0xFEFF, 0xFE0E, 0xFE0F)}
+_INVISIBLE.update({code: None for code in range(0x1F3FB, 0x1F400)})
+_TRANSLATE = {**_FULLWIDTH, **_INVISIBLE}
+
+_EMOJI = "\U0001F300-\U0001FAFF☀-➿⭐❤"
+
+# (이름, 정규식, 치환) 목록. 모듈을 불러올 때 한 번만 컴파일되고, 프로세스 풀의 각 워커도 import 시 한 번 컴파일한다.
+RULES = tuple((name, re.compile(pattern, flags), repl) for name, pattern, flags, repl in (
+    # 화면에서 함께 긁힌 UI 문구 (네이버 "더보기"/"접기", 번역 버튼 등). 버튼은 본문 끝의 별도 줄에 붙으므로
+    # 줄바꿈 뒤에 단독으로 있을 때만 지운다 ("종이접기", "우산 접기" 같은 본문의 낱말은 남긴다)
+    ("ui_residue", r"(?:\n\s*(?:더보기|접기|펼쳐보기|번역보기|원문보기))+\s*$", 0, ""),
+    # ㅋㅋㅋㅋ / ㅎㅎㅎ / ㅠㅠㅠㅠ 같은 자모 반복은 두 글자로
+    ("jamo_run", r"([ㄱ-ㅎㅏ-ㅣ])\1{2,}", 0, r"\1\1"),
+    # ^^^^ / ;;;; / ~~~~ / !!!! / ???? 반복은 두 글자로
+    ("symbol_run", r"([\^;~!?♡♥☆★])\1{2,}", 0, r"\1\1"),
+    # 말줄임: .... / 。。。 / … -> ...
+    ("ellipsis", r"(?:\.{3,}|…+|。{2,})", 0, "..."),
+    # 같은 이모지 반복은 하나로 (👍👍👍 -> 👍)
+    ("emoji_run", rf"([{_EMOJI}])\1+", 0, r"\1"),
+    # 줄 안의 공백 묶음은 한 칸, 줄바꿈 묶음은 한 줄바꿈
+    ("spaces", r"[ \t\u00a0]+", 0, " "),
+    ("newlines", r" ?\n\s*", 0, "\n"),
+))
+
+
+def clean_text(text):
+    """리뷰 본문 하나를 정제한다: 유니코드 정규화(NFC, 전각->반각, 보이지 않는 문자 제거) 후 RULES를 차례로 적용"""
+    if not text:
+        return text
+    text = unicodedata.normalize("NFC", text).translate(_TRANSLATE)
+    for _, pattern, repl in RULES:
+        text = pattern.sub(repl, text)
+    return text.strip()
+
+
+def clean_chunk(texts):
+    """워커 프로세스에서 실행되는 단위 작업"""
+    return [clean_text(text) for text in texts]
+
+
+def text_key(text):
+    return hashlib.blake2b(f"{RULES_VERSION}\x1f{text}".encode("utf-8"), digest_size=16).digest()
+
+
+class CleanCache:
+    """
+    본문 해시 -> 정제 결과 캐시. 재수집/중복 파일처럼 같은 본문이 반복되면 정규식을 다시 돌리지 않는다.
+
+    :param max_entries: 최대 항목 수 (가득 차면 더 넣지 않고 기존 항목만 사용)
+    """
+
+    def __init__(self, max_entries=1_000_000):
+        self.max_entries = max_entries
+        self._items = {}
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key):
+        value = self._items.get(key)
+        if value is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+        return value
+
+    def put(self, key, value):
+        if len(self._items) < self.max_entries:
+            self._items[key] = value
+
+    def __len__(self):
+        return len(self._items)
+
+    def report(self):
+        total = self.hits + self.misses
+        return f"{self.hits}/{total} cache hits ({self.hits / total:.0%}), {len(self)} entries" if total else "no lookups"
+
+
+def _chunks(items, size):
+    chunk = []
+    for item in items:
+        chunk.append(item)
+        if len(chunk) >= size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+def iter_clean(texts, workers=None, chunk_size=2000, cache=None, max_pending=None):
+    """
+    본문 스트림을 정제해 입력 순서대로 돌려주는 제너레이터.
+
+    입력을 chunk_size개씩 묶어, 캐시에 없는 (묶음 안에서도 중복을 뺀) 본문만 프로세스 풀로 보낸다.
+    동시에 처리 중인 묶음은 max_pending개(기본값: 워커 수 x 2)로 제한하므로 입력이 아무리 커도 메모리가 일정하다.
+
+    :param texts: 본문 iterable (None/빈 문자열은 그대로 통과)
+    :param workers: 프로세스 수 (0이면 현재 프로세스에서 처리, None이면 CPU 수)
+    :param cache: CleanCache (None이면 캐시 없이 처리)
+    """
+    def plan(chunk):
+        # 캐시에 있거나 빈 본문은 바로 값을 채우고(None은 미정), 나머지는 {본문: 캐시 키}로 모아 워커로 보낸다
+        values, misses = [], {}
+        for text in chunk:
+            value = None
+            if not text:
+                value = text
+            elif text not in misses and cache is not None:
+                value = cache.get(text_key(text))
+            if value is None:
+                misses.setdefault(text, text_key(text) if cache is not None else None)
+            values.append(value)
+        return chunk, values, misses
+
+    def assemble(chunk, values, misses, cleaned):
+        results = dict(zip(misses, cleaned))
+        if cache is not None:
+            for key, value in zip(misses.values(), cleaned):
+                cache.put(key, value)
+        for text, value in zip(chunk, values):
+            yield results[text] if value is None else value
+
+    if workers == 0:
+        for chunk in _chunks(texts, chunk_size):
+            chunk, values, misses = plan(chunk)
+            yield from assemble(chunk, values, misses, clean_chunk(list(misses)))
+        return
+
+    workers = workers or os.cpu_count() or 1
+    limit = max_pending or workers * 2
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        pending = deque()
+        for chunk in _chunks(texts, chunk_size):
+            chunk, values, misses = plan(chunk)
+            pending.append((chunk, values, misses, executor.submit(clean_chunk, list(misses))))
+            if len(pending) >= limit:
+                chunk, values, misses, future = pending.popleft()
+                yield from assemble(chunk, values, misses, future.result())
+        while pending:
+            chunk, values, misses, future = pending.popleft()
+            yield from assemble(chunk, values, misses, future.result())
+
+
+def iter_clean_records(records, field="text", **kwargs):
+    """
+    dict 레코드 스트림의 field 값을 정제한 새 레코드를 돌려준다 (문자열 레코드는 문자열 자체를 정제).
+    field가 없거나 값이 문자열이 아닌(숫자, 목록 등) dict 레코드는 그대로 돌려준다.
+    """
+    buffer = deque()
+
+    def texts():
+        for record in records:
+            buffer.append(record)
+            text = record.get(field) if isinstance(record, dict) else record
+            yield text if isinstance(text, str) else None  # 문자열이 아닌 값은 정제하지 않고 통과
+
+    for cleaned in iter_clean(texts(), **kwargs):
+        record = buffer.popleft()
+        if not isinstance(record, dict):
+            yield cleaned if isinstance(record, str) else record
+        else:
+            yield {**record, field: cleaned} if isinstance(record.get(field), str) else record
+
+
+if __name__ == "__main__":
+    import glob
+    import itertools
+    import sys
+    import time
+
+    from jsonl_sink import JsonlSink, read_jsonl
+
+    # 사용법: python preprocess.py input.jsonl output.jsonl [field]  (레코드가 문자열이면 field 무시)
+    if len(sys.argv) > 2:
+        field = sys.argv[3] if len(sys.argv) > 3 else "review"
+        cache = CleanCache()
+        with JsonlSink(sys.argv[2]) as sink:
+            for record in iter_clean_records(read_jsonl(sys.argv[1]), field=field, cache=cache):
+                sink.write(record)
+        print(f"Cleaned {sink.count} records: {cache.report()}")
+        sys.exit(0)
+
+    from review_store import read_source
+
+    samples = {
+        "맛있어요ㅋㅋㅋㅋㅋ 또 올게요ㅎㅎㅎ\n더보기": "맛있어요ㅋㅋ 또 올게요ㅎㅎ",
+        "최고👍👍👍🏻👍  친절해요^^^^ ！！": "최고👍 친절해요^^ !!",
+        "웨이팅   길어요....\n\n\n 그래도  추천": "웨이팅 길어요...\n그래도 추천",
+        "조금 아쉬웠어요ㅠㅠㅠㅠ\u200b\n접기": "조금 아쉬웠어요ㅠㅠ",
+        "번역이 필요해요\n번역보기\n 원문보기 ": "번역이 필요해요",
+        "종이접기": "종이접기",
+        "우산 접기": "우산 접기",
+        "설명은 더보기": "설명은 더보기",
+    }
+    for raw, expected in samples.items():
+        assert clean_text(raw) == expected, (clean_text(raw), expected)
+    records = [{"text": "좋아요ㅋㅋㅋ", "id": 1}, {"id": 2, "rating": 5}, "문자열 레코드ㅎㅎㅎ",
+               {"text": 5, "id": 3}, {"text": ["a", "b"], "id": 4}, {"text": None, "id": 5}]
+    assert list(iter_clean_records(records, workers=0)) == [{"text": "좋아요ㅋㅋ", "id": 1}, {"id": 2, "rating": 5},
+                                                           "문자열 레코드ㅎㅎ", {"text": 5, "id": 3},
+                                                           {"text": ["a", "b"], "id": 4}, {"text": None, "id": 5}]
+
+    data_dir = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "data")
+    corpus = [r["text"] for path in sorted(glob.glob(os.path.join(data_dir, "*"))) if os.path.isfile(path)
+              for r in read_source(path) if r["text"]]
+    rows = 1_000_000
+    print(f"Corpus: {len(corpus)} reviews from data/, replicated to {rows:,} rows")
+
+    def replicated():
+        return itertools.islice(itertools.cycle(corpus), rows)
+
+    # 비교용: 규칙마다 매번 re.sub(문자열 패턴)을 호출하는 단일 프로세스 처리 (앞부분 100k로 측정 후 환산)
+    def clean_text_uncompiled(text):
+        text = unicodedata.normalize("NFC", text).translate(_TRANSLATE)
+        for _, pattern, repl in RULES:
+            text = re.sub(pattern.pattern, repl, text)
+        return text.strip()
+
+    sample = list(itertools.islice(replicated(), 100_000))
+    start = time.perf_counter()
+    baseline = [clean_text_uncompiled(text) for text in sample]
+    baseline_rate = len(sample) / (time.perf_counter() - start)
+    print(f"{'re.sub per rule, 1 process':>34}: {baseline_rate:,.0f} rows/sec")
+
+    cpus = os.cpu_count() or 1
+    for label, kwargs in [("compiled, 1 process", {"workers": 0}),
+                          (f"compiled, {cpus} processes", {"workers": cpus}),
+                          (f"compiled, {cpus} processes + cache", {"workers": cpus, "cache": CleanCache()})]:
+        start = time.perf_counter()
+        count = 0
+        for cleaned in iter_clean(replicated(), **kwargs):
+            if count < len(baseline):
+                assert cleaned == baseline[count]
+            count += 1
+        elapsed = time.perf_counter() - start
+        extra = f" ({kwargs['cache'].report()})" if "cache" in kwargs else ""
+        print(f"{label:>34}: {count / elapsed:,.0f} rows/sec, {elapsed:.1f}s{extra}")
@@ -0,0 +1,77 @@
+import hashlib
+import os
+import re
+import unicodedata
+
+_WHITESPACE = re.compile(r"\s+")
+
+
+def content_key(text, platform, place):
+    """정규화한 리뷰 텍스트 + 플랫폼 + 장소로 만든 고정 길이 해시 키"""
+    normalized = _WHITESPACE.sub(" ", unicodedata.normalize("NFC", text or "")).strip()
+    raw = f"{platform}\x1f{place}\x1f{normalized}".encode("utf-8")
+    return hashlib.blake2b(raw, digest_size=16).hexdigest()
+
+
+class ReviewDeduper:
+    """
+    이미 수집한 리뷰인지 O(1)로 판별하는 중복 제거 인덱스.
+    리스트 대신 해시 키 집합을 사용하고, path를 지정하면 키를 파일에 누적 저장해
+    다음 실행에서도 이미 본 리뷰를 건너뛸 수 있다. 키 파일은 flush()를 호출할 때(한 묶음을 처리할 때마다)와
+    close()에서 디스크까지 기록된다.
+
+    :param platform: 플랫폼 이름 (예: "naver", "catchtable")
+    :param place: 장소 식별자 (place_id 또는 페이지 URL)
+    :param path: 키를 저장할 파일 경로 (None이면 메모리에서만 유지)
+    """
+
+    def __init__(self, platform, place, path=None):
+        self.platform = platform
+        self.place = place
+        self._keys = set()
+        self._file = None
+        if path:
+            if os.path.exists(path):
+                with open(path, "r", encoding="ascii") as f:
+                    self._keys.update(line.strip() for line in f if line.strip())
+            self._file = open(path, "a", encoding="ascii")
+
+    def key(self, text):
+        return content_key(text, self.platform, self.place)
+
+    def add(self, text):
+        """처음 보는 리뷰면 등록하고 True, 이미 본 리뷰면 False를 반환"""
+        key = self.key(text)
+        if key in self._keys:
+            return False
+        self._keys.add(key)
+        if self._file:
+            self._file.write(key + "\n")
+        return True
+
+    def __contains__(self, text):
+        return self.key(text) in self._keys
+
+    def __len__(self):
+        return len(self._keys)
+
+    def flush(self):
+        """
+        지금까지 추가한 키를 디스크까지 기록(fsync)한다. 리뷰 한 묶음(페이지)을 내보낸 뒤 호출하면,
+        중간에 프로세스가 죽어도 다음 실행이 그 리뷰들을 다시 내보내지 않는다.
+        """
+        if self._file:
+            self._file.flush()
+            os.fsync(self._file.fileno())
+
+    def close(self):
+        if self._file:
+            self.flush()
+            self._file.close()
+            self._file = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
@@ -1,9 +1,12 @@
 import requests
-import json
 import time
 
-def get_comments(place_id, start_comment_id=None):
-    base_url = "https://place.map.kakao.com/commentlist/v/"
+from jsonl_sink import JsonlSink
+from kakao_checkpoint import CommentCheckpoint
+
+BASE_URL = "https://place.map.kakao.com/commentlist/v/"
+
+def get_comments(place_id, start_comment_id=None, session=None, base_url=BASE_URL):
     url = f"{base_url}{place_id}/{start_comment_id}" if start_comment_id else f"{base_url}{place_id}"
 
     headers = {
@@ -21,7 +24,8 @@ def get_comments(place_id, start_comment_id=None):
         "user-agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/131.0.0.0 Safari/537.36"
     }
 
-    response = requests.get(url, headers=headers)
+    # session이 주어지면 keep-alive 연결을 재사용
+    response = (session or requests).get(url, headers=headers, timeout=10)
 
     if response.status_code == 200:
         return response.json()
@@ -29,35 +33,91 @@ def get_comments(place_id, start_comment_id=None):
         print(f"Error: {response.status_code}")
         return None
 
-def scrape_all_comments(place_id):
+def scrape_all_comments(place_id, session=None, rate_limiter=None, base_url=BASE_URL, delay=1,
+                        checkpoint_dir=None, incremental=False, sink=None):
+    """
+    place_id의 리뷰를 `commentid` 커서를 따라 끝까지 수집한다.
+
+    :param checkpoint_dir: 지정하면 페이지마다 리뷰와 커서를 저장하고, 중단된 수집을 이어서 진행한다.
+    :param incremental: 이미 완료된 place를 다시 수집할 때, 이미 수집한 리뷰(known_ids)를 처음 만나면 중단한다.
+                        이 경우 새로 수집된 리뷰만 반환한다.
+    :param sink: JsonlSink를 주면 새로 수집된 리뷰를 도착하는 즉시 기록한다.
+    """
+    checkpoint = CommentCheckpoint(checkpoint_dir, place_id) if checkpoint_dir else None
+    state = checkpoint.load_state() if checkpoint else {"cursor": None, "newest_id": None, "stop_at": None}
+    known_ids = checkpoint.known_ids() if checkpoint else set()
+
+    if state.get("complete"):
+        if not incremental:
+            return checkpoint.load_comments()
+        # 증분 수집: 처음부터 내려오다가 이미 수집한 리뷰를 만나면 중단
+        state.update(cursor=None, complete=False, stop_at=state["newest_id"])
+
+    # 중단된 증분 수집을 이어가는 경우에도 stop_at이 남아 있으므로 같은 규칙으로 멈춘다
+    syncing = incremental and state.get("stop_at") is not None
+    previous_ids = set(known_ids) if syncing else set()
     all_comments = []
-    last_comment_id = None
+    last_comment_id = state["cursor"]
+    finished = False
 
     while True:
-        data = get_comments(place_id, last_comment_id)
+        if rate_limiter:
+            rate_limiter.acquire(base_url)
+        data = get_comments(place_id, last_comment_id, session=session, base_url=base_url)
 
-        if not data or "list" not in data["comment"]:
+        if not data:
+            break  # 요청 실패: 커서를 남겨두고 다음 실행에서 이어서 진행
+        if not data.get("comment", {}).get("list"):
+            finished = True
             break
 
         comments = data["comment"]["list"]
-        all_comments.extend(comments)
+        if last_comment_id is None:
+            state["newest_id"] = comments[0]["commentid"]
+
+        new_comments = []
+        for comment in comments:
+            if comment["commentid"] in known_ids:
+                if syncing and comment["commentid"] in previous_ids:
+                    # 이미 수집한 리뷰에 도달: 그 아래는 모두 지난 수집분 (지난번 최신 리뷰가 삭제됐어도 여기서 멈춘다)
+                    finished = True
+                    break
+                continue
+            known_ids.add(comment["commentid"])
+            new_comments.append(comment)
+            if sink:
+                sink.write(comment)
+        all_comments.extend(new_comments)
 
         # 다음 페이지로 넘어갈 `commentid` 설정
         last_comment_id = comments[-1]["commentid"]
+        state["cursor"] = last_comment_id
+        if checkpoint:
+            checkpoint.save_page(new_comments, state)
+
+        print(f"Fetched {len(new_comments)} comments. Total: {len(all_comments)}")
+
+        if finished:
+            break
 
-        print(f"Fetched {len(comments)} comments. Total: {len(all_comments)}")
+        # 서버에 부담을 줄이기 위한 딜레이 (rate_limiter 사용 시 호스트 단위로 제어)
+        if not rate_limiter:
+            time.sleep(delay)
 
-        # 서버에 부담을 줄이기 위한 딜레이
-        time.sleep(1)
+    if checkpoint and finished:
+        state.update(cursor=None, complete=True, stop_at=None)
+        checkpoint.save_state(state)
+        if not incremental:
+            return checkpoint.load_comments()
 
     return all_comments
 
-# 실행
-place_id = "10332413"  # 명동교자 본점 ID
-comments = scrape_all_comments(place_id)
+if __name__ == "__main__":
+    # 실행
+    place_id = "10332413"  # 명동교자 본점 ID
 
-# 결과 저장
-with open("comments.json", "w", encoding="utf-8") as f:
-    json.dump(comments, f, ensure_ascii=False, indent=4)
+    # 결과는 수집되는 즉시 JSONL로 저장
+    with JsonlSink("comments.jsonl") as sink:
+        comments = scrape_all_comments(place_id, sink=sink)
 
-print(f"총 {len(comments)}개의 리뷰를 크롤링했습니다.")
+    print(f"총 {len(comments)}개의 리뷰를 크롤링했습니다.")
@@ -3,10 +3,30 @@ from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.common.exceptions import TimeoutException
-import json
-import time
 
-def scrape_reviews(page_url: str, review_class: str, button_xpath: str, max_reviews: int = 100):
+from crawl_profile import CRAWL_PROFILE, CrawlProfile
+from crawl_wait import WaitStats, element_count, wait_for_change, wait_for_network_idle, wait_until
+from jsonl_sink import JsonlSink
+from naver_http import NaverHttpError, fetch_reviews, parse_apollo_reviews, parse_graphql_reviews
+from network_capture import NetworkCapture, capture_options
+from review_dedup import ReviewDeduper
+
+
+def _captured_reviews(capture):
+    """캡처한 GraphQL 응답 중 방문자 리뷰 목록 응답에서 리뷰 본문을 꺼낸다"""
+    texts = []
+    for response in capture.poll():
+        try:
+            reviews, _ = parse_graphql_reviews(response.data)
+        except NaverHttpError:
+            continue  # 리뷰 목록이 아닌 다른 GraphQL 요청
+        texts.extend(review["review"] for review in reviews)
+    return texts
+
+
+def scrape_reviews(page_url: str, review_class: str, button_xpath: str, max_reviews: int = 100, sink: JsonlSink = None,
+                   seen_path: str = None, max_wait: float = 10, wait_stats: WaitStats = None, source: str = "dom",
+                   profile: CrawlProfile = CRAWL_PROFILE):
     """
     Scrapes reviews from a dynamic page by scrolling and clicking a 'Load More' button.
 
@@ -14,33 +34,69 @@ def scrape_reviews(page_url: str, review_class: str, button_xpath: str, max_revi
     :param review_class: The class name of the review elements.
     :param button_xpath: The XPath of the 'Load More' button.
     :param max_reviews: Maximum number of reviews to scrape.
+    :param sink: Optional JsonlSink that receives each review as soon as it is scraped.
+    :param seen_path: Optional file that persists the dedup index, so re-crawls skip reviews seen before.
+    :param max_wait: Upper bound (seconds) to wait for new reviews after each 'Load More' click.
+    :param wait_stats: Optional WaitStats that records how long was actually waited.
+    :param source: "dom" reads the text of each review element; "network" reads the reviews from the page's
+                   embedded state and the GraphQL responses each 'Load More' click fetches (no per-element reads).
+    :param profile: Browser profile (headless, blocked images/fonts/trackers). None starts a default, visible Chrome.
     :return: A list of reviews.
     """
     reviews = []
-    previous_review_count = 0
+    seen = ReviewDeduper("naver", page_url, path=seen_path)
+    loaded = 0  # 지금까지 페이지에 나타난 리뷰 수 (이미 본 리뷰 포함)
+    previous_loaded = 0
+    wait_stats = wait_stats or WaitStats()
+    review_count = element_count(class_name=review_class)
 
     # Initialize WebDriver
-    driver = webdriver.Chrome()
+    options = webdriver.ChromeOptions()
+    if source == "network":
+        options = capture_options(options)
+    if profile:
+        driver = profile.start(options)
+    else:
+        driver = webdriver.Chrome(options=options)
+        driver.maximize_window()
+    capture = NetworkCapture(driver, url_pattern=r"/graphql") if source == "network" else None
     driver.get(page_url)
-    driver.maximize_window()
+    wait_until(driver, review_count, timeout=max_wait, stats=wait_stats)  # 첫 리뷰가 보일 때까지 대기
 
     try:
+        if capture:
+            # 첫 화면 분량은 페이지에 실려 오는 Apollo 상태에서 읽는다
+            try:
+                captured = [review["review"] for review in parse_apollo_reviews(driver.page_source)]
+            except NaverHttpError:
+                captured = []
+            captured += _captured_reviews(capture)
+
         while len(reviews) < max_reviews:
             # Extract reviews from the current page
-            review_elements = driver.find_elements(By.CLASS_NAME, review_class)
-            for review in review_elements:
-                review_text = review.text
-                if review_text not in reviews:  # Avoid duplicates
+            if capture:
+                review_texts = captured
+                loaded += len(captured)
+            else:
+                review_texts = [review.text for review in driver.find_elements(By.CLASS_NAME, review_class)]
+                loaded = len(review_texts)
+            for review_text in review_texts:
+                if seen.add(review_text):  # Avoid duplicates
                     reviews.append(review_text)
+                    if sink:
+                        sink.write(review_text)
                 if len(reviews) >= max_reviews:
                     break
+            if sink:
+                sink.flush()  # 리뷰를 먼저 기록한 뒤 키를 기록해야, 중단되어도 리뷰가 빠지지 않는다
+            seen.flush()
 
-            # Check if new reviews are loaded
-            if len(reviews) == previous_review_count:
+            # Check if the list grew. 재수집이면 앞쪽은 이미 본 리뷰뿐이므로, 새 리뷰 수가 아니라 목록 길이로 판단한다
+            if loaded == previous_loaded:
                 print("No new reviews loaded. Stopping.")
                 break
 
-            previous_review_count = len(reviews)
+            previous_loaded = loaded
 
             # Find and click 'Load More' button if available
             try:
@@ -48,20 +104,26 @@ def scrape_reviews(page_url: str, review_class: str, button_xpath: str, max_revi
                     EC.element_to_be_clickable((By.XPATH, button_xpath))
                 )
                 driver.execute_script("arguments[0].scrollIntoView({block: 'center', inline: 'nearest'});", load_more_button)  # Scroll to the button
-                time.sleep(3)  # Allow time for scrolling
+                wait_for_network_idle(driver, timeout=3, stats=wait_stats)  # Allow time for scrolling
+                before = review_count(driver)
                 load_more_button.click()
-                time.sleep(10)  # Wait for new content to load
+                # Wait until new reviews appear instead of a fixed sleep
+                wait_for_change(driver, review_count, before, timeout=max_wait, stats=wait_stats)
+                if capture:
+                    captured = _captured_reviews(capture)
             except TimeoutException:
                 print("No 'Load More' button found or clickable. Stopping.")
                 break
 
         print(f"Collected {len(reviews)} reviews.")
+        print(f"Wait time: {wait_stats.report()}")
 
     except Exception as e:
         print(f"An error occurred during scraping: {e}")
 
     finally:
         driver.quit()
+        seen.close()
 
     return reviews
 
@@ -71,12 +133,16 @@ if __name__ == "__main__":
     review_class = "pui__vn15t2"
     button_xpath = "//*[@id=\"app-root\"]/div/div/div/div[6]/div[3]/div[3]/div[2]/div/a/span"
 
-    collected_reviews = scrape_reviews(page_url, review_class, button_xpath, max_reviews=10000)
+    seen_path = "naver_review.seen"  # HTTP로 받은 리뷰를 Selenium 경로가 다시 수집하지 않도록 공유
+
+    # 수집되는 즉시 JSONL 파일로 저장. HTTP(GraphQL)로 먼저 읽고, 실패하면 브라우저로 나머지를 채운다
+    with JsonlSink("naver_review.jsonl") as sink:
+        collected_reviews = fetch_reviews(
+            page_url, max_reviews=10000, sink=sink, seen_path=seen_path, record=lambda review: review["review"],
+            fallback=lambda remaining: scrape_reviews(page_url, review_class, button_xpath, max_reviews=remaining,
+                                                      sink=sink, seen_path=seen_path),
+        )
 
     print("Reviews:")
     for i, review in enumerate(collected_reviews, 1):
         print(f"{i}: {review}")
-
-    # JSON 파일로 저장
-    with open("naver_review.csv", "w", encoding="utf-8") as f:
-        json.dump(collected_reviews, f, ensure_ascii=False, indent=4)
@@ -0,0 +1,346 @@
+import csv
+import json
+import os
+from datetime import datetime
+
+import pyarrow as pa
+import pyarrow.dataset as ds
+from pyarrow import fs
+
+from jsonl_sink import read_jsonl
+
+# 모든 플랫폼의 리뷰를 담는 공통 스키마. platform은 파티션 컬럼(디렉터리 이름)으로 저장된다.
+SCHEMA = pa.schema([
+    ("platform", pa.string()),
+    ("place", pa.string()),
+    ("review_id", pa.string()),
+    ("text", pa.string()),
+    ("rating", pa.float32()),
+    ("visit_count", pa.int32()),
+    ("timestamp", pa.timestamp("s")),
+])
+PARTITIONING = ds.partitioning(pa.schema([("platform", pa.string())]), flavor="hive")
+
+# 원본 파일 이름(확장자 제외) -> (platform, place). 각 크롤러의 __main__ 출력 이름과 data/ 의 기존 파일
+KNOWN_SOURCES = {
+    "Naver_review": ("naver", "11592650"),
+    "naver_review": ("naver", "11592650"),
+    "naver_yuzu_review": ("naver", "1557353265"),
+    "naver_yuzu_review_2": ("naver", "1557353265"),
+    "naver_yuzu_review_80": ("naver", "1557353265"),
+    "catch_yuzu_review": ("catchtable", "Y2F0Y2hfV0FhQTRRNTVTVFhYS1owL2J1UDN0dz09"),
+    "comments": ("kakao", "10332413"),
+    "myungdong_kakao": ("kakao", "10332413"),
+    "review_yuzu_kakao": ("kakao", "1104039439"),
+    "news_comments": ("news", None),  # 장소 대신 ArticleID 컬럼을 place로 사용
+}
+
+# 원본이 아니라 다른 파일을 가공해 만든 파일. 본문이 바뀌어 있어 중복으로 걸러지지 않으므로 저장소에 넣지 않는다
+# (myungdong_kakao_cleaned: comments.csv/myungdong_kakao.csv의 본문을 정리한 전처리 결과)
+DERIVED_SOURCES = {"myungdong_kakao_cleaned"}
+
+# 원본 컬럼 이름 -> 공통 스키마 필드 (앞에 있는 이름이 우선)
+FIELD_ALIASES = {
+    "text": ("review", "contents", "Review", "Comment", "text", "body"),
+    "rating": ("point", "Rating", "rating"),
+    "visit_count": ("value", "visitCount", "visit_count"),
+    "review_id": ("commentid", "id", "review_id"),
+    "timestamp": ("date", "Date", "created", "timestamp"),
+    "place": ("ArticleID", "place"),
+}
+TIMESTAMP_FORMATS = ("%Y.%m.%d.", "%Y.%m.%d", "%Y-%m-%d %H:%M:%S", "%Y-%m-%d", "%Y.%m.%d %H:%M")
+
+
+def sniff_format(path):
+    """확장자와 상관없이 내용을 보고 json(배열) / jsonl / csv를 판별한다 (data/ 에는 JSON 배열을 담은 .csv가 있다)"""
+    if path.endswith((".jsonl", ".jsonl.gz")):
+        return "jsonl"
+    with open(path, "r", encoding="utf-8-sig") as f:
+        head = f.read(64).lstrip()
+    if head.startswith("["):
+        return "json"
+    if head.startswith("{"):
+        return "jsonl"
+    return "csv"
+
+
+def iter_raw_records(path):
+    """원본 파일의 레코드를 dict로 돌려준다 (문자열만 있는 JSON 배열은 {"review": 문자열})"""
+    kind = sniff_format(path)
+    if kind == "csv":
+        with open(path, "r", encoding="utf-8-sig", newline="") as f:
+            yield from csv.DictReader(f)
+        return
+    if kind == "json":
+        with open(path, "r", encoding="utf-8") as f:
+            records = json.load(f)
+    else:
+        records = read_jsonl(path)
+    for record in records:
+        yield record if isinstance(record, dict) else {"review": record}
+
+
+def is_derived(path):
+    return os.path.basename(path).split(".")[0] in DERIVED_SOURCES
+
+
+def source_of(path):
+    """파일 이름으로 (platform, place)를 정한다. 모르는 파일은 이름에서 플랫폼을 짐작하고 place는 파일 이름"""
+    stem = os.path.basename(path).split(".")[0]
+    if stem in KNOWN_SOURCES:
+        return KNOWN_SOURCES[stem]
+    lowered = stem.lower()
+    for token, platform in (("naver", "naver"), ("kakao", "kakao"), ("catch", "catchtable"), ("news", "news")):
+        if token in lowered:
+            return platform, stem
+    return "unknown", stem
+
+
+def _first(record, field):
+    for name in FIELD_ALIASES[field]:
+        value = record.get(name)
+        if value not in (None, ""):
+            return value
+    return None
+
+
+def _number(value, cast):
+    try:
+        return cast(float(value)) if value is not None else None
+    except (TypeError, ValueError):
+        return None
+
+
+def _timestamp(value):
+    if value is None:
+        return None
+    if isinstance(value, (int, float)):
+        return datetime.fromtimestamp(value / 1000 if value > 1e11 else value)  # 밀리초 epoch도 허용
+    value = str(value).strip()
+    for fmt in TIMESTAMP_FORMATS:
+        try:
+            return datetime.strptime(value, fmt)
+        except ValueError:
+            pass
+    try:
+        return datetime.fromisoformat(value)
+    except ValueError:
+        return None
+
+
+def normalize_record(record, platform, place=None, row_key=None):
+    """
+    원본 레코드 하나를 공통 스키마 dict로 변환. 본문도 평점도 없으면 None
+    (본문 없이 평점만 있는 카카오 리뷰는 평점 분석을 위해 남긴다).
+
+    :param row_key: 원본에 id가 없을 때 쓸 id (예: "comments#12"). 본문으로 만들면 같은 장소의 같은 문구
+                    ("맛있어요" 등) 리뷰들이 하나로 합쳐지므로, 원본 파일의 행 위치를 쓴다
+    """
+    text = _first(record, "text")
+    text = text if isinstance(text, str) and text.strip() else None
+    rating = _number(_first(record, "rating"), float)
+    if text is None and rating is None:
+        return None
+    place = place or _first(record, "place")
+    place = str(place) if place is not None else None
+    review_id = _first(record, "review_id")
+    if review_id is None:
+        review_id = row_key
+    return {
+        "platform": platform,
+        "place": place,
+        "review_id": str(review_id) if review_id is not None else None,
+        "text": text,
+        "rating": rating,
+        "visit_count": _number(_first(record, "visit_count"), int),
+        "timestamp": _timestamp(_first(record, "timestamp")),
+    }
+
+
+def _iter_source(path, platform=None, place=None):
+    """원본 파일의 레코드를 (정규화한 레코드, 원본에 id가 있는지)로 돌려준다"""
+    if platform is None:
+        platform, known_place = source_of(path)
+        place = place or known_place
+    stem = os.path.basename(path).split(".")[0]
+    for i, record in enumerate(iter_raw_records(path)):
+        row = normalize_record(record, platform, place, row_key=f"{stem}#{i}")
+        if row:
+            yield row, _first(record, "review_id") is not None
+
+
+def read_source(path, platform=None, place=None):
+    """원본 파일 하나를 정규화한 레코드 목록으로 읽는다"""
+    return [row for row, _ in _iter_source(path, platform, place)]
+
+
+def to_table(records):
+    return pa.Table.from_pylist(records, schema=SCHEMA)
+
+
+def write_store(table, root, format="parquet", row_group_size=128 * 1024):
+    """
+    공통 스키마 테이블을 platform별 파티션(root/platform=naver/...)으로 기록한다. 같은 파티션의 기존 파일은 교체한다.
+
+    :param format: "parquet" (zstd 압축, 디스크 효율) 또는 "arrow" (압축 없는 Arrow IPC, memory map으로 복사 없이 읽힘)
+    :param row_group_size: 행 그룹(배치) 크기. 열 단위로 읽을 때 한 번에 읽는 단위
+    """
+    if format == "parquet":
+        file_format = ds.ParquetFileFormat()
+        options = file_format.make_write_options(compression="zstd", use_dictionary=["place"])
+    elif format == "arrow":
+        file_format = ds.IpcFileFormat()
+        options = file_format.make_write_options()
+    else:
+        raise ValueError(f"Unknown store format: {format}")
+    ds.write_dataset(
+        table, root, format=file_format, file_options=options, partitioning=PARTITIONING,
+        existing_data_behavior="delete_matching", basename_template=f"part-{{i}}.{format}",
+        max_rows_per_group=row_group_size, min_rows_per_group=min(row_group_size, 1024),
+    )
+
+
+def ingest(paths, root, format="parquet", row_group_size=128 * 1024):
+    """
+    원본 파일들을 정규화해 하나의 저장소로 기록하고, 파일별 레코드 수를 반환한다.
+    원본에 id가 있는 리뷰가 여러 파일에 있으면 (platform, place, review_id) 기준으로 한 번만 넣는다.
+    id가 없는 원본은 본문이 같아도 다른 리뷰일 수 있으므로(같은 문구, 다른 평점) 모든 행을 넣는다.
+    가공된 파일(DERIVED_SOURCES)은 넣지 않고 레코드 수를 None으로 반환한다.
+    """
+    records, counts, seen = [], {}, set()
+    for path in paths:
+        if is_derived(path):
+            counts[path] = None
+            continue
+        counts[path] = 0
+        for row, native_id in _iter_source(path):
+            counts[path] += 1
+            if native_id:
+                key = (row["platform"], row["place"], row["review_id"])
+                if key in seen:
+                    continue
+                seen.add(key)
+            records.append(row)
+    write_store(to_table(records), root, format=format, row_group_size=row_group_size)
+    return counts
+
+
+def open_store(root, format="parquet", memory_map=True):
+    """
+    저장소를 pyarrow Dataset으로 연다. memory_map=True면 파일을 메모리 매핑해서 읽는다
+    (arrow 형식은 요청한 열의 버퍼만 페이지 단위로 올라오고 복사되지 않는다).
+    """
+    file_format = "parquet" if format == "parquet" else "ipc"
+    filesystem = fs.LocalFileSystem(use_mmap=memory_map)
+    return ds.dataset(root, format=file_format, partitioning=PARTITIONING, filesystem=filesystem)
+
+
+def load(root, columns=None, platform=None, place=None, format="parquet", memory_map=True):
+    """
+    필요한 열만 읽는다. 예: load(root, columns=["rating"])은 text 열의 데이터를 읽지 않는다.
+    platform은 파티션(디렉터리) 단위로 걸러지므로 다른 플랫폼 파일은 열지 않는다.
+    """
+    condition = None
+    for field, value in (("platform", platform), ("place", place)):
+        if value is not None:
+            term = ds.field(field) == value
+            condition = term if condition is None else condition & term
+    return open_store(root, format, memory_map).to_table(columns=columns, filter=condition)
+
+
+if __name__ == "__main__":
+    import glob
+    import sys
+    import tempfile
+    import time
+
+    import pyarrow.parquet as pq
+
+    # 사용법: python review_store.py [data_dir] [store_dir]
+    data_dir = sys.argv[1] if len(sys.argv) > 1 else os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "data")
+    store_dir = sys.argv[2] if len(sys.argv) > 2 else os.path.join(data_dir, "review_store")
+
+    paths = sorted(path for path in glob.glob(os.path.join(data_dir, "*")) if os.path.isfile(path))
+    counts = ingest(paths, store_dir)
+    for path, count in counts.items():
+        print(f"{os.path.basename(path):>30}: {'derived, skipped' if count is None else f'{count} reviews'}")
+    stored = load(store_dir, columns=["platform", "rating"])
+    print(stored.group_by("platform").aggregate([("rating", "count"), ("rating", "mean")]).to_pylist())
+    print(f"{stored.num_rows} reviews in {store_dir}")
+    if len(sys.argv) < 2:
+        # data/ 의 파일에는 원본 id가 없으므로 읽은 행이 모두 저장되어야 한다 (같은 문구의 다른 리뷰도 각각)
+        assert stored.num_rows == sum(count or 0 for count in counts.values()), stored.num_rows
+        assert counts[os.path.join(data_dir, "comments.csv")] == 1691
+
+    # 100만 건 합성 데이터: rating만 읽을 때 text 바이트를 읽지 않는지 확인
+    class _CountingFile:
+        """파일에서 실제로 읽은 바이트 수를 센다"""
+
+        def __init__(self, path):
+            self._f = open(path, "rb")
+            self.bytes_read = 0
+            self.closed = False
+
+        def read(self, size=-1):
+            data = self._f.read(size)
+            self.bytes_read += len(data)
+            return data
+
+        def seek(self, offset, whence=0):
+            return self._f.seek(offset, whence)
+
+        def tell(self):
+            return self._f.tell()
+
+        def seekable(self):
+            return True
+
+        def readable(self):
+            return True
+
+        def close(self):
+            self.closed = True
+            self._f.close()
+
+    count = 1_000_000
+    filler = "라멘 국물이 진하고 유자향이 좋아요. 직원분들도 친절하고 웨이팅도 금방 빠졌습니다. " * 3
+    table = pa.table({
+        "platform": pa.array(["naver", "kakao", "catchtable", "kakao"] * (count // 4)),
+        "place": pa.array([str(i % 50) for i in range(count)]),
+        "review_id": pa.array([f"r{i}" for i in range(count)]),
+        "text": pa.array([f"{i} {filler}" for i in range(count)]),
+        "rating": pa.array([float(i % 5 + 1) for i in range(count)], pa.float32()),
+        "visit_count": pa.array([i % 4 + 1 for i in range(count)], pa.int32()),
+        "timestamp": pa.array([None] * count, pa.timestamp("s")),
+    }, schema=SCHEMA)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        for format in ("parquet", "arrow"):
+            root = os.path.join(tmp, format)
+            start = time.perf_counter()
+            write_store(table, root, format=format)
+            written = time.perf_counter() - start
+
+            start = time.perf_counter()
+            ratings = load(root, columns=["rating"], format=format)
+            rating_time = time.perf_counter() - start
+            start = time.perf_counter()
+            full = load(root, format=format)
+            full_time = time.perf_counter() - start
+            assert ratings.num_rows == full.num_rows == count
+            print(f"{format:>8}: write {written:.2f}s, rating only {rating_time:.3f}s, all columns {full_time:.3f}s")
+
+        # Parquet 파일 하나에서 rating만 읽을 때 실제로 읽은 바이트 vs text 열 크기
+        path = glob.glob(os.path.join(tmp, "parquet", "platform=kakao", "*.parquet"))[0]
+        metadata = pq.read_metadata(path)
+        column_bytes = {}
+        for g in range(metadata.num_row_groups):
+            for c in range(metadata.num_columns):
+                column = metadata.row_group(g).column(c)
+                column_bytes[column.path_in_schema] = column_bytes.get(column.path_in_schema, 0) + column.total_compressed_size
+        source = _CountingFile(path)
+        pq.ParquetFile(source).read(columns=["rating"])
+        print(f"kakao partition: read {source.bytes_read / 1024:,.0f} KiB for rating "
+              f"(rating column {column_bytes['rating'] / 1024:,.0f} KiB, text column {column_bytes['text'] / 1024:,.0f} KiB, "
+              f"file {os.path.getsize(path) / 1024:,.0f} KiB)")
+        assert source.bytes_read < column_bytes["text"]
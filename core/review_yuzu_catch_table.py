@@ -3,75 +3,105 @@ from selenium.webdriver.common.by import By
 from selenium.webdriver.common.action_chains import ActionChains
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-from bs4 import BeautifulSoup
-import time
 
-def fetch_reviews(target_count):
+from catch_table_extract import REVIEW_CLASS, extract_new_reviews, parse_reviews_html
+from crawl_profile import CRAWL_PROFILE
+from crawl_wait import WaitStats, element_count, scroll_height, wait_for_change, wait_until
+from jsonl_sink import JsonlSink
+from network_capture import NetworkCapture, capture_options, review_texts
+from review_dedup import ReviewDeduper
+
+# 리뷰 목록 API 응답으로 볼 URL (network 모드)
+REVIEW_API_PATTERN = r"(?i)review"
+
+def fetch_reviews(target_count, sink=None, seen_path=None, extract_mode="incremental", parser=None,
+                  max_wait=3, wait_stats=None, profile=CRAWL_PROFILE):
+    # extract_mode="incremental": 브라우저에서 새로 추가된 리뷰 노드만 읽어온다
+    # extract_mode="full": 매번 page_source 전체를 parser로 다시 파싱한다 (None이면 lxml, 없으면 html.parser)
+    # extract_mode="network": 스크롤할 때 페이지가 받아 오는 리뷰 API(JSON) 응답에서 바로 읽는다
+    #   (숨겨진 요소를 펼치거나 DOM을 읽지 않는다. 본문은 API의 리뷰 텍스트 필드만 담긴다)
+    # profile: 브라우저 프로필 (기본값: headless + 이미지/글꼴/분석 스크립트 차단, None이면 기본 Chrome)
     # Selenium WebDriver 설정
     options = webdriver.ChromeOptions()
-    driver = webdriver.Chrome(options=options)
+    if extract_mode == "network":
+        options = capture_options(options)
+    driver = profile.start(options) if profile else webdriver.Chrome(options=options)
+    capture = NetworkCapture(driver, url_pattern=REVIEW_API_PATTERN) if extract_mode == "network" else None
 
     # 크롤링 대상 URL
     url = "https://app.catchtable.co.kr/ct/shop/Y2F0Y2hfV0FhQTRRNTVTVFhYS1owL2J1UDN0dz09?type=DINING&foodKeywords=%EC%9C%A0%EC%A6%88+%EB%9D%BC%EB%A9%98"
     driver.get(url)
 
-    # 페이지 로드 대기
-    time.sleep(5)
+    # 페이지 로드 대기 (리뷰가 나타나는 즉시 진행, 최대 5초)
+    wait_stats = wait_stats or WaitStats()
+    wait_until(driver, element_count(class_name=REVIEW_CLASS), timeout=5, stats=wait_stats)
 
-    # 리뷰를 저장할 리스트
+    # 리뷰를 저장할 리스트 (중복 판별은 해시 인덱스로)
     reviews = []
+    seen = ReviewDeduper("catchtable", url, path=seen_path)
 
     # 무한 스크롤
     fetched_count = 0
+    processed_count = 0  # 증분 모드에서 이미 읽은 리뷰 노드 수
     previous_height = 0
 
     while fetched_count < target_count:
-        # 숨겨진 요소 표시
-        driver.execute_script("""
-            let elements = document.querySelectorAll('.x9vxc45');
-            elements.forEach(el => el.style.display = 'block');
-        """)
+        if capture:
+            # 지난 스크롤 이후 도착한 리뷰 API 응답에서 추출 (DOM을 읽지 않음)
+            new_reviews = [text for response in capture.poll() for text in review_texts(response.data)]
+        else:
+            # 숨겨진 요소 표시
+            driver.execute_script("""
+                let elements = document.querySelectorAll('.x9vxc45');
+                elements.forEach(el => el.style.display = 'block');
+            """)
 
-        # 페이지 소스 파싱
-        page_source = driver.page_source
-        soup = BeautifulSoup(page_source, 'html.parser')
-        new_reviews = soup.find_all(class_="__review-post")
+            # 리뷰 텍스트 추출
+            if extract_mode == "incremental":
+                new_reviews = extract_new_reviews(driver, processed_count)
+                processed_count += len(new_reviews)
+            else:
+                new_reviews = parse_reviews_html(driver.page_source, parser=parser)
 
         # 중복되지 않은 리뷰만 추가
-        for review in new_reviews:
-            text = review.get_text(strip=True)
-            if text not in reviews:
+        for text in new_reviews:
+            if seen.add(text):
                 reviews.append(text)
+                if sink:
+                    sink.write(text)
                 fetched_count += 1
                 if fetched_count >= target_count:
                     break
+        if sink:
+            sink.flush()  # 리뷰를 먼저 기록한 뒤 키를 기록해야, 중단되어도 리뷰가 빠지지 않는다
+        seen.flush()
 
-        # 스크롤 실행 및 대기
-        previous_height = driver.execute_script("return document.body.scrollHeight")
+        # 스크롤 실행 후 페이지 높이가 바뀌는 즉시 진행 (최대 max_wait초)
+        previous_height = scroll_height(driver)
         driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-        time.sleep(3)
-        current_height = driver.execute_script("return document.body.scrollHeight")
+        height_changed = wait_for_change(driver, scroll_height, previous_height, timeout=max_wait, stats=wait_stats)
 
         # 더 이상 새로운 데이터가 로드되지 않으면 종료
-        if previous_height == current_height:
+        if not height_changed:
             print("더 이상 로드할 리뷰가 없습니다.")
             break
 
     # 드라이버 종료
     driver.quit()
+    seen.close()
+    if capture:
+        print(f"네트워크 캡처: {capture.stats}")
 
     return reviews[:target_count]
-import csv
-import json
-
-# 크롤링 실행
-target_count = 235
-reviews = fetch_reviews(target_count)
 
-# 결과 출력
-for idx, review in enumerate(reviews, start=1):
-    print(f"Review {idx}: {review}")
+if __name__ == "__main__":
+    # 크롤링 실행 (수집되는 즉시 JSONL 파일로 저장)
+    target_count = 235
+    wait_stats = WaitStats()
+    with JsonlSink("catch_yuzu_review.jsonl") as sink:
+        reviews = fetch_reviews(target_count, sink=sink, wait_stats=wait_stats)
+    print(f"대기 시간: {wait_stats.report()}")
 
-# Save to JSON file
-with open("catch_yuzu_review.csv", "w", encoding="utf-8") as f:
-    json.dump(reviews, f, ensure_ascii=False, indent=4)
\ No newline at end of file
+    # 결과 출력
+    for idx, review in enumerate(reviews, start=1):
+        print(f"Review {idx}: {review}")
\ No newline at end of file
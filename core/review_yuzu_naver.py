@@ -3,83 +3,140 @@ from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.common.exceptions import TimeoutException
-import json
-import time
 import re
 from tqdm import tqdm  # tqdm 추가
 
-
-def scrape_reviews(page_url: str, review_class: str, button_xpath: str, value_xpath_template: str, max_reviews: int = 100):
+from crawl_profile import CRAWL_PROFILE, CrawlProfile
+from crawl_wait import WaitStats, element_count, wait_for_change, wait_for_network_idle, wait_until
+from jsonl_sink import JsonlSink
+from naver_http import fetch_reviews
+from review_dedup import ReviewDeduper
+
+
+# 리뷰 텍스트와 값(value_xpath_template)을 start 인덱스 이후 항목에 대해 한 번의 스크립트 실행으로 가져온다
+BATCH_SCRIPT = """
+const [reviewClass, valueTemplate, start] = arguments;
+const reviews = document.getElementsByClassName(reviewClass);
+const items = [];
+for (let i = start; i < reviews.length; i++) {
+    const xpath = valueTemplate.replace('{}', String(i + 1));
+    const node = document.evaluate(xpath, document, null, XPathResult.FIRST_ORDERED_NODE_TYPE, null).singleNodeValue;
+    items.push([reviews[i].innerText.trim(), node ? node.innerText.trim() : null]);
+}
+return items;
+"""
+
+
+def parse_value(value_text):
+    match = re.search(r'\d+', value_text or "")
+    return int(match.group()) if match else None
+
+
+def extract_reviews_batch(driver, review_class, value_xpath_template, start=0):
+    """start 번째 이후 리뷰의 (텍스트, 값) 목록을 WebDriver 왕복 한 번으로 추출"""
+    items = driver.execute_script(BATCH_SCRIPT, review_class, value_xpath_template, start)
+    return [(text, parse_value(value_text)) for text, value_text in items]
+
+
+def extract_reviews_per_index(driver, review_class, value_xpath_template, start=0):
+    """요소마다 XPath 대기를 거는 기존 방식 (배치 스크립트를 쓸 수 없을 때 사용)"""
+    items = []
+    review_elements = driver.find_elements(By.CLASS_NAME, review_class)
+    for index, review in enumerate(review_elements[start:], start=start):
+        review_text = review.text.strip()
+
+        # Extract value for the current review
+        try:
+            dynamic_value_xpath = value_xpath_template.format(index + 1)
+            value_element = WebDriverWait(driver, 10).until(
+                EC.presence_of_element_located((By.XPATH, dynamic_value_xpath))
+            )
+            value = parse_value(value_element.text.strip())
+        except TimeoutException:
+            print(f"Value element not found for review {index + 1}.")
+            value = None
+        except Exception as e:
+            print(f"Failed to extract value for review {index + 1}: {e}")
+            value = None
+
+        items.append((review_text, value))
+    return items
+
+
+def scrape_reviews(page_url: str, review_class: str, button_xpath: str, value_xpath_template: str, max_reviews: int = 100,
+                   sink: JsonlSink = None, seen_path: str = None, max_wait: float = 8,
+                   wait_stats: WaitStats = None, batch: bool = True, profile: CrawlProfile = CRAWL_PROFILE):
     reviews = []
-    previous_review_count = 0
+    processed_count = 0  # 이미 처리한 리뷰 요소 수 (다음 반복은 이 인덱스부터)
+    seen = ReviewDeduper("naver", page_url, path=seen_path)
+    wait_stats = wait_stats or WaitStats()
+    review_count = element_count(class_name=review_class)
 
     # Initialize WebDriver
-    driver = webdriver.Chrome()
+    # profile이 있으면 headless + 이미지/글꼴/분석 스크립트 차단, 없으면 기존처럼 화면에 띄운다
+    if profile:
+        driver = profile.start()
+    else:
+        driver = webdriver.Chrome()
+        driver.maximize_window()
     driver.get(page_url)
-    driver.maximize_window()
-    time.sleep(4)
+    wait_until(driver, review_count, timeout=4, stats=wait_stats)  # 첫 리뷰가 보일 때까지 대기
 
     try:
         # tqdm으로 진행률 표시 추가
         with tqdm(total=max_reviews, desc="Scraping Reviews", unit="review") as pbar:
             while len(reviews) < max_reviews:
-                # Extract reviews
-                review_elements = driver.find_elements(By.CLASS_NAME, review_class)
-                for index, review in enumerate(review_elements):
-                    review_text = review.text.strip()
-
-                    # Extract value for the current review
-                    try:
-                        dynamic_value_xpath = value_xpath_template.format(index + 1)
-                        value_element = WebDriverWait(driver, 10).until(
-                            EC.presence_of_element_located((By.XPATH, dynamic_value_xpath))
-                        )
-                        value_text = value_element.text.strip()
-                        match = re.search(r'\d+', value_text)
-                        value = int(match.group()) if match else None
-                    except TimeoutException:
-                        print(f"Value element not found for review {index + 1}.")
-                        value = None
-                    except Exception as e:
-                        print(f"Failed to extract value for review {index + 1}: {e}")
-                        value = None
-
+                # Extract reviews (이전에 처리한 인덱스 이후의 새 리뷰만)
+                if batch:
+                    new_items = extract_reviews_batch(driver, review_class, value_xpath_template, processed_count)
+                else:
+                    new_items = extract_reviews_per_index(driver, review_class, value_xpath_template, processed_count)
+                processed_count += len(new_items)
+
+                for review_text, value in new_items:
                     # Add review and value as a dictionary
                     review_data = {"review": review_text, "value": value}
-                    if review_data not in reviews:  # Avoid duplicates
+                    if seen.add(review_text):  # Avoid duplicates
                         reviews.append(review_data)
+                        if sink:
+                            sink.write(review_data)
                         pbar.update(1)  # Update tqdm progress bar
 
                     if len(reviews) >= max_reviews:
                         break
+                if sink:
+                    sink.flush()  # 리뷰를 먼저 기록한 뒤 키를 기록해야, 중단되어도 리뷰가 빠지지 않는다
+                seen.flush()
 
-                # Check if new reviews loaded
-                if len(reviews) == previous_review_count:
+                # Check if new review elements loaded. 재수집이면 앞쪽은 이미 본 리뷰뿐이므로, 새 리뷰 수가 아니라 요소 수로 판단한다
+                if not new_items:
                     print("No new reviews loaded. Stopping.")
                     break
 
-                previous_review_count = len(reviews)
-
                 # Click 'Load More' button
                 try:
                     load_more_button = WebDriverWait(driver, 5).until(
                         EC.element_to_be_clickable((By.XPATH, button_xpath))
                     )
                     driver.execute_script("arguments[0].scrollIntoView(true);", load_more_button)
-                    time.sleep(3)
+                    wait_for_network_idle(driver, timeout=3, stats=wait_stats)
+                    before = review_count(driver)
                     load_more_button.click()
-                    time.sleep(8)
+                    # 고정 sleep 대신 리뷰 수가 늘어나는 즉시 진행
+                    wait_for_change(driver, review_count, before, timeout=max_wait, stats=wait_stats)
                 except TimeoutException:
                     print("No 'Load More' button found or clickable. Stopping.")
                     break
 
         print(f"Collected {len(reviews)} reviews.")
+        print(f"Wait time: {wait_stats.report()}")
 
     except Exception as e:
         print(f"An error occurred during scraping: {e}")
 
     finally:
         driver.quit()
+        seen.close()
 
     return reviews
 
@@ -91,15 +148,17 @@ if __name__ == "__main__":
     button_xpath = "//*[@id=\"app-root\"]/div/div/div/div[6]/div[3]/div[3]/div[2]/div/a/span"
     value_xpath_template = "//*[@id=\"app-root\"]/div/div/div/div[6]/div[3]/div[3]/div[1]/ul/li[{}]/div[7]/div[2]/div/span[2]"  # Dynamic XPath
 
-    collected_reviews = scrape_reviews(
-        page_url, review_class, button_xpath, value_xpath_template, max_reviews=80
-    )
+    seen_path = "naver_yuzu_review_80.seen"  # HTTP로 받은 리뷰를 Selenium 경로가 다시 수집하지 않도록 공유
+
+    # 수집되는 즉시 JSONL 파일로 저장. HTTP(GraphQL)로 먼저 읽고(value = 방문 횟수), 실패하면 브라우저로 나머지를 채운다
+    with JsonlSink("naver_yuzu_review_80.jsonl") as sink:
+        collected_reviews = fetch_reviews(
+            page_url, max_reviews=80, sink=sink, seen_path=seen_path,
+            fallback=lambda remaining: scrape_reviews(page_url, review_class, button_xpath, value_xpath_template,
+                                                      max_reviews=remaining, sink=sink, seen_path=seen_path),
+        )
 
     # Print reviews and values
     print("Reviews and Values:")
     for i, review_data in enumerate(collected_reviews, 1):
         print(f"{i}: Review: {review_data['review']}, Value: {review_data['value']}")
-
-    # Save to JSON file
-    with open("naver_yuzu_review_80.csv", "w", encoding="utf-8") as f:
-        json.dump(collected_reviews, f, ensure_ascii=False, indent=4)
@@ -0,0 +1,209 @@
+import time
+
+from bulk_dom import SELECT_FUNCTION, target_of
+from crawl_wait import RESOURCE_COUNT_FUNCTION, wait_until
+
+# 지난 호출 이후 새로 나타난 항목만 [순번, text]로 돌려준다. 순번은 피드에 나타난 순서대로 0부터 늘어난다.
+# 항목은 노드 자체로 구분하므로(WeakMap), 텍스트가 같은 항목("5", "5", "4" 같은 평점)도 각각 센다.
+# 식별 속성(data-id 등)은 재활용된 노드를 알아보는 데만 쓴다: 노드의 속성 값이 바뀌면 가상 목록이 그 노드에
+# 다른 항목을 다시 그린 것이고, 이미 읽은 값이면(다른 노드에서 읽은 항목이 옮겨 온 것) 건너뛴다.
+COLLECT_SCRIPT = SELECT_FUNCTION + RESOURCE_COUNT_FUNCTION + """
+const [target, reset] = arguments;
+if (reset || !window.__scrollCollector) window.__scrollCollector = {nodes: new WeakMap(), ids: new Set(), next: 0};
+const state = window.__scrollCollector;
+const nodes = select(target);
+const items = [];
+for (const node of nodes) {
+    const text = (node.innerText || "").trim();
+    if (!text) continue;  // 아직 내용이 채워지지 않은 자리(스켈레톤 등)는 채워진 뒤에 읽는다
+    const id = node.getAttribute("data-id") || node.getAttribute("data-key") || node.getAttribute("data-index")
+        || node.getAttribute("aria-rowindex") || "";
+    if (state.nodes.has(node) && state.nodes.get(node) === id) continue;  // 이미 읽은 노드
+    state.nodes.set(node, id);
+    if (id) {
+        if (state.ids.has(id)) continue;
+        state.ids.add(id);
+    }
+    items.push([state.next++, text]);
+}
+const last = nodes[nodes.length - 1];
+return {
+    items: items,
+    resources: resourceCount(),
+    at_end: !last || last.getBoundingClientRect().bottom <= window.innerHeight + 1,
+};
+"""
+
+# 마지막 항목을 화면 맨 위로 올린다. 가상 목록은 그 아래 항목을 새로 그리고, 무한 스크롤은 다음 페이지를 요청한다.
+# 창이 움직이지 않았으면(항목이 없거나 이미 맨 위) 문서 끝으로 스크롤한다.
+SCROLL_SCRIPT = SELECT_FUNCTION + """
+const nodes = select(arguments[0]);
+const last = nodes[nodes.length - 1];
+const y = window.scrollY;
+if (last) last.scrollIntoView({block: "start"});
+if (!last || window.scrollY === y) window.scrollTo(0, document.body.scrollHeight);
+"""
+
+
+def iter_scroll_items(driver, xpath=None, class_name=None, start_idx=0, end_idx=None, max_wait=3, idle_time=1.0,
+                      poll=0.1, stats=None):
+    """
+    스크롤하면서 새로 추가된 항목의 텍스트를 묶음(list)으로 돌려주는 제너레이터.
+
+    - 스크롤할 때마다 새로 나타난 노드만 읽으므로, 항목이 늘어나도 한 번에 읽는 양이 일정하다.
+    - 항목은 노드로 구분하고 식별 속성(data-id 등)으로 재활용된 노드를 알아보므로, 가상 목록도 처리할 수 있다
+      (식별 속성 없이 노드를 재활용하는 목록은 처음 그려진 노드 수만큼만 읽힌다).
+    - start_idx/end_idx는 피드에 나타난 순서 기준 위치이며, end_idx에 도달하면 바로 멈춘다.
+    - 마지막 항목이 화면 안에 있고 idle_time 동안 완료된 네트워크 요청이 없으면 max_wait를 기다리지 않고 끝으로 본다
+      (응답이 idle_time보다 오래 걸리는 사이트는 idle_time을 늘린다).
+
+    :param max_wait: 스크롤 후 새 항목을 기다리는 최대 시간 (초)
+    :param stats: crawl_wait.WaitStats (실제로 기다린 시간 기록)
+    """
+    target = target_of(xpath=xpath, class_name=class_name)
+    count = 0  # 지금까지 피드에 나타난 항목 수
+    result = driver.execute_script(COLLECT_SCRIPT, target, True)
+
+    while True:
+        batch = [text for position, text in result["items"]
+                 if position >= start_idx and (end_idx is None or position < end_idx)]
+        count += len(result["items"])
+        if batch:
+            yield batch
+        if end_idx is not None and count >= end_idx:
+            return
+
+        driver.execute_script(SCROLL_SCRIPT, target)
+        state = {"resources": result["resources"], "since": time.monotonic()}
+
+        def arrived(d):
+            nonlocal result
+            result = d.execute_script(COLLECT_SCRIPT, target, False)
+            if result["items"]:
+                return True
+            now = time.monotonic()
+            if result["resources"] != state["resources"]:
+                state["resources"], state["since"] = result["resources"], now  # 아직 응답을 받는 중
+                return False
+            return result["at_end"] and now - state["since"] >= idle_time
+
+        wait_until(driver, arrived, timeout=max_wait, poll=poll, stats=stats)
+        if not result["items"]:
+            return  # 피드 끝
+
+
+if __name__ == "__main__":
+    import threading
+    from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+    from selenium import webdriver
+    from selenium.webdriver.common.by import By
+
+    from crawl_wait import WaitStats
+
+    TOTAL = 300
+
+    # /feed: 스크롤하면 200ms 뒤 20개씩 붙는 무한 스크롤, /virtual: 노드 30개를 재활용하는 가상 목록,
+    # /ratings: 같은 텍스트가 반복되는 항목
+    RATINGS = ["5", "5", "4", "5", "3", "3"]
+    PAGES = {
+        "/ratings": "<html><body>" + "".join(f"<div class='item'>{r}</div>" for r in RATINGS) + "</body></html>",
+        "/feed": """<html><body><div id='list'></div><script>
+let n = 0, loading = false;
+function more() {
+    if (loading || n >= %(total)d) return;
+    loading = true;
+    setTimeout(() => {
+        for (let i = 0; i < 20 && n < %(total)d; i++) {
+            const div = document.createElement('div');
+            div.className = 'item'; div.style.height = '60px'; div.textContent = 'item ' + (n++);
+            document.getElementById('list').appendChild(div);
+        }
+        loading = false;
+    }, 200);
+}
+window.addEventListener('scroll', () => { if (innerHeight + scrollY >= document.body.scrollHeight - 200) more(); });
+more();
+</script></body></html>""" % {"total": TOTAL},
+        "/virtual": """<html><body><div id='viewport' style='height:600px;overflow:auto'>
+<div id='spacer' style='position:relative;height:%(height)dpx'></div></div><script>
+const viewport = document.getElementById('viewport'), spacer = document.getElementById('spacer'), rows = [];
+for (let i = 0; i < 30; i++) {
+    const div = document.createElement('div');
+    div.className = 'item'; div.style.cssText = 'position:absolute;height:40px;width:100%%';
+    spacer.appendChild(div); rows.push(div);
+}
+function render() {
+    const first = Math.floor(viewport.scrollTop / 40);
+    rows.forEach((div, i) => {
+        const index = first + i;
+        div.style.display = index < %(total)d ? '' : 'none';
+        div.style.top = (index * 40) + 'px';
+        div.setAttribute('data-index', index);
+        div.textContent = index < %(total)d ? 'row ' + index : '';
+    });
+}
+viewport.addEventListener('scroll', render);
+render();
+</script></body></html>""" % {"total": TOTAL, "height": TOTAL * 40},
+    }
+
+    class _FixtureHandler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            data = PAGES[self.path].encode("utf-8")
+            self.send_response(200)
+            self.send_header("Content-Type", "text/html; charset=utf-8")
+            self.send_header("Content-Length", str(len(data)))
+            self.end_headers()
+            self.wfile.write(data)
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _FixtureHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    base = f"http://127.0.0.1:{server.server_address[1]}"
+
+    options = webdriver.ChromeOptions()
+    options.add_argument("--headless=new")
+    driver = webdriver.Chrome(options=options)
+    try:
+        # 기존 방식: 스크롤마다 전체 find_elements, 높이가 더 안 늘면 10초 timeout
+        driver.get(base + "/feed")
+        start = time.perf_counter()
+        height = driver.execute_script("return document.body.scrollHeight")
+        while True:
+            driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
+            if not wait_until(driver, lambda d: d.execute_script("return document.body.scrollHeight") > height, timeout=10):
+                break
+            height = driver.execute_script("return document.body.scrollHeight")
+            elements = driver.find_elements(By.CLASS_NAME, "item")
+        old_texts = [element.text for element in driver.find_elements(By.CLASS_NAME, "item")]
+        old_time = time.perf_counter() - start
+
+        driver.get(base + "/feed")
+        stats = WaitStats()
+        start = time.perf_counter()
+        texts = [text for batch in iter_scroll_items(driver, class_name="item", stats=stats) for text in batch]
+        new_time = time.perf_counter() - start
+        assert texts == old_texts == [f"item {i}" for i in range(TOTAL)], len(texts)
+        print(f"Feed of {TOTAL}: full re-scan + timeout {old_time:.1f}s, incremental {new_time:.1f}s ({stats.report()})")
+
+        driver.get(base + "/feed")
+        window = [text for batch in iter_scroll_items(driver, class_name="item", start_idx=50, end_idx=70) for text in batch]
+        assert window == [f"item {i}" for i in range(50, 70)]
+
+        driver.get(base + "/ratings")
+        ratings = [text for batch in iter_scroll_items(driver, class_name="item", idle_time=0.2) for text in batch]
+        assert ratings == RATINGS, ratings
+        driver.get(base + "/ratings")
+        ratings = [text for batch in iter_scroll_items(driver, class_name="item", start_idx=1, end_idx=4) for text in batch]
+        assert ratings == RATINGS[1:4], ratings
+
+        driver.get(base + "/virtual")
+        rows = [text for batch in iter_scroll_items(driver, class_name="item") for text in batch]
+        assert rows == [f"row {i}" for i in range(TOTAL)], len(rows)
+        print(f"Virtualized list: {len(rows)} rows through {len(driver.find_elements(By.CLASS_NAME, 'item'))} recycled nodes")
+    finally:
+        driver.quit()
+        server.shutdown()
@@ -0,0 +1,324 @@
+import itertools
+import json
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from contextlib import ExitStack
+
+from selenium.webdriver.common.by import By
+from selenium.webdriver.support import expected_conditions as EC
+from selenium.webdriver.support.ui import WebDriverWait
+
+from bulk_dom import bulk_many
+
+# 브라우저 세션이 필요한 단계. 나머지(crawl 등 API 단계)는 브라우저와 독립적으로 동시에 실행된다.
+BROWSER_OPS = {"load", "click", "hover", "hide", "delay", "click-list", "sweep"}
+
+# click-list 대상 요소들의 링크를 한 번에 모은다 (요소 자신, 조상, 자손 중 첫 번째 a[href])
+LINKS_SCRIPT = """
+const target = arguments[0];
+let nodes = [];
+if (target.xpath) {
+    const found = document.evaluate(target.xpath, document, null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null);
+    for (let i = 0; i < found.snapshotLength; i++) nodes.push(found.snapshotItem(i));
+} else if (target.class_name) {
+    nodes = Array.from(document.getElementsByClassName(target.class_name));
+}
+const urls = [];
+for (const node of nodes) {
+    const link = node.href ? node : (node.closest('a[href]') || node.querySelector('a[href]'));
+    if (link && link.href && !urls.includes(link.href)) urls.push(link.href);
+}
+return urls;
+"""
+
+
+def _as_list(value):
+    return list(value) if isinstance(value, (list, tuple)) else [value]
+
+
+def _take_while(actions, start, predicate):
+    end = start
+    while end < len(actions) and predicate(actions[end]):
+        end += 1
+    return actions[start:end]
+
+
+def _compile_steps(actions, ids):
+    steps = [{"id": next(ids), "op": "load", "deps": []}]  # 페이지 로드는 세션당 한 번만
+    chain_tail = steps[0]["id"]
+    index = 0
+    while index < len(actions):
+        action = actions[index]
+        kind = action.get("type")
+
+        if kind == "crawl":
+            # 연달아 있는 API crawl은 한 단계로 묶고, 브라우저 단계와 독립적으로 실행
+            group = _take_while(actions, index, lambda a: a.get("type") == "crawl")
+            steps.append({"id": next(ids), "op": "crawl", "actions": group, "deps": []})
+            index += len(group)
+            continue
+
+        step_id = next(ids)
+        if kind == "hide":
+            # 연달아 있는 hide는 선택자 목록 하나로 합쳐 한 번에 처리
+            group = _take_while(actions, index, lambda a: a.get("type") == "hide")
+            step = {"op": "hide", "targets": [a.get("target", {}) for a in group]}
+            index += len(group)
+        elif kind == "click-list" or (kind == "click" and action.get("end_idx")):
+            # 링크(대상)마다 실행할 액션: 명시된 actions가 없으면 바로 뒤에 이어지는 브라우저 액션들
+            # (crawl 등 API 액션은 링크 페이지가 아니라 원래 페이지 기준이므로 본문에 넣지 않는다)
+            body = action.get("actions")
+            index += 1
+            if body is None:
+                body = _take_while(actions, index, lambda a: a.get("type") in BROWSER_OPS)
+                index += len(body)
+            step = {"op": "click-list", "target": action.get("target", {}), "delay": action.get("delay", 1),
+                    "body": _compile_steps(body, ids)}
+            if kind == "click":
+                # 인덱스 범위가 있는 click: 범위의 대상들을 한 번의 탐색(sweep)으로 열고, 열린 페이지마다 body 실행
+                step.update(op="sweep", start_idx=_as_list(action.get("start_idx", 0)), end_idx=_as_list(action["end_idx"]),
+                            navigation=action.get("navigation", "tab"))
+        else:
+            step = {"op": kind, "target": action.get("target", {}), "delay": action.get("delay", 1)}
+            index += 1
+
+        step["id"] = step_id
+        step["deps"] = [chain_tail]
+        chain_tail = step["id"]
+        steps.append(step)
+    return steps
+
+
+class ActionPlan:
+    """
+    action_list를 실행 계획(단계 목록)으로 컴파일한 결과. JSON으로 저장/불러오기할 수 있다.
+
+    각 단계는 dict이며 id, op, deps(같은 단계 목록에서 먼저 끝나야 하는 단계 id)를 가진다.
+    실행기는 deps가 모두 끝난 단계부터 실행한다. 컴파일 결과에서 브라우저 단계는 앞 단계에 의존하는 사슬을 이루고,
+    crawl 단계는 의존성이 없어 동시에 실행된다 (불러온 계획에서 deps를 고치면 그대로 반영된다).
+    click-list 단계의 body는 링크마다 별도 세션에서 실행되는 하위 계획이고,
+    sweep 단계의 body는 탐색으로 연 대상 페이지마다 그 페이지에서 실행되는 하위 계획이다 (run_on_page).
+    """
+
+    def __init__(self, url, actions, steps):
+        self.url = url
+        self.actions = actions
+        self.steps = steps
+
+    @classmethod
+    def compile(cls, url, actions):
+        return cls(url, [dict(action) for action in actions], _compile_steps(actions, itertools.count(1)))
+
+    def to_dict(self):
+        return {"version": 1, "url": self.url, "actions": self.actions, "steps": self.steps}
+
+    def save(self, path):
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(self.to_dict(), f, ensure_ascii=False, indent=2)
+
+    @classmethod
+    def load(cls, path):
+        with open(path, "r", encoding="utf-8") as f:
+            data = json.load(f)
+        validate_steps(data["steps"])
+        return cls(data.get("url", ""), data.get("actions", []), data["steps"])
+
+    def describe(self):
+        lines = []
+
+        def walk(steps, indent):
+            for step in steps:
+                detail = ""
+                if step["op"] == "hide":
+                    detail = f" x{len(step['targets'])}"
+                elif step["op"] == "crawl":
+                    detail = f" x{len(step['actions'])}"
+                elif step.get("target"):
+                    detail = f" {step['target']}"
+                if step["deps"]:
+                    deps = f" <- s{', s'.join(map(str, step['deps']))}"
+                else:
+                    deps = "" if step["op"] in BROWSER_OPS else " (parallel)"
+                lines.append(f"{'  ' * indent}s{step['id']} {step['op']}{detail}{deps}")
+                if step.get("body"):
+                    walk(step["body"], indent + 1)
+
+        walk(self.steps, 0)
+        return "\n".join(lines)
+
+
+def validate_steps(steps):
+    """deps가 같은 단계 목록 안의 id만 가리키고 순환이 없는지 확인한다 (잘못되면 ValueError)"""
+    ids = {step["id"] for step in steps}
+    for step in steps:
+        unknown = [dep for dep in step.get("deps", []) if dep not in ids]
+        if unknown:
+            raise ValueError(f"s{step['id']}의 deps {unknown}는 같은 단계 목록에 없습니다.")
+    done = set()
+    remaining = list(steps)
+    while remaining:
+        ready = [step for step in remaining if all(dep in done for dep in step.get("deps", []))]
+        if not ready:
+            raise ValueError(f"deps에 순환이 있습니다: {', '.join('s' + str(step['id']) for step in remaining)}")
+        done.update(step["id"] for step in ready)
+        remaining = [step for step in remaining if step["id"] not in done]
+    for step in steps:
+        if step.get("body"):
+            validate_steps(step["body"])
+
+
+def compile_plan(url, actions):
+    return ActionPlan.compile(url, actions)
+
+
+class PlanExecutor:
+    """
+    ActionPlan을 DriverPool 세션에서 실행하고 단계별 소요 시간을 기록한다.
+
+    :param driver_pool: DriverPool (core/driver_pool.py)
+    :param handlers: op 이름 -> handler(driver, step, url). click/hover/crawl 등 화면에 따라 다른 동작을 넘겨준다
+    :param max_branches: click-list 링크를 동시에 처리할 최대 세션 수 (기본값: 풀 크기 - 1)
+    :param checkpoint: 각 단계 전에 호출 (일시정지/취소 처리)
+    :param log: 로그 함수
+    :param propagate: handler에서 발생해도 삼키지 않고 다시 던질 예외 타입 (예: 취소)
+    """
+
+    def __init__(self, driver_pool, handlers, max_branches=None, checkpoint=None, log=print, propagate=()):
+        self.driver_pool = driver_pool
+        self.handlers = handlers
+        self.max_branches = max_branches or max(1, driver_pool.size - 1)
+        self.checkpoint = checkpoint
+        self.log = log
+        self.propagate = tuple(propagate)
+        self.timings = []
+        self._lock = threading.Lock()
+
+    def run(self, plan, url=None):
+        """계획을 실행하고 단계별 timing 목록을 반환한다."""
+        self.timings = []
+        validate_steps(plan.steps)
+        self._run_steps(None, plan.steps, url or plan.url, "main")
+        return self.timings
+
+    def run_on_page(self, driver, steps, url, branch):
+        """
+        이미 대상 페이지가 열린 driver에서 하위 계획(sweep 단계의 body)을 실행한다.
+        페이지는 호출한 쪽이 열었으므로 load 단계는 끝난 것으로 보고 건너뛴다.
+        """
+        self._run_steps(driver, steps, url, branch, done={step["id"] for step in steps if step["op"] == "load"})
+
+    def _run_steps(self, driver, steps, url, branch, done=()):
+        """
+        deps가 모두 끝난 단계부터 실행한다. 브라우저 단계는 세션 하나에서 차례로,
+        그 외 단계(crawl 등)는 스레드에서 동시에 실행된다. 세션은 첫 브라우저 단계가 준비될 때 빌린다.
+
+        :param done: 이미 끝난 것으로 볼 단계 id
+        """
+        finished = set(done)
+        remaining = [step for step in steps if step["id"] not in finished]
+        running = {}  # future -> 단계 id
+
+        with ExitStack() as stack:
+            executor = stack.enter_context(ThreadPoolExecutor(
+                max_workers=max(1, sum(step["op"] not in BROWSER_OPS for step in steps))))
+            while remaining or running:
+                ready = [step for step in remaining if all(dep in finished for dep in step.get("deps", []))]
+                for step in ready:
+                    if step["op"] not in BROWSER_OPS:
+                        running[executor.submit(self._run_step, None, step, url, branch)] = step["id"]
+                        remaining.remove(step)
+                browser = [step for step in ready if step["op"] in BROWSER_OPS]
+                if browser:
+                    if driver is None:
+                        driver = stack.enter_context(self.driver_pool.lease())
+                    step = browser[0]
+                    remaining.remove(step)
+                    self._run_step(driver, step, url, branch)
+                    finished.add(step["id"])
+                    continue
+                if not running:
+                    raise ValueError(f"실행할 수 없는 단계가 남았습니다 (deps 확인): {[step['id'] for step in remaining]}")
+                done, _ = wait(list(running), return_when=FIRST_COMPLETED)
+                for future in done:
+                    future.result()
+                    finished.add(running.pop(future))
+
+    def _run_step(self, driver, step, url, branch):
+        if self.checkpoint:
+            self.checkpoint()
+        op = step["op"]
+        status = "ok"
+        start = time.perf_counter()
+        try:
+            if op == "load":
+                self.driver_pool.get(driver, url)
+                WebDriverWait(driver, 10).until(EC.presence_of_element_located((By.TAG_NAME, "body")))
+            elif op == "delay":
+                time.sleep(step.get("delay", 1))
+            elif op == "hide":
+                # 여러 선택자의 요소를 한 번의 스크립트 호출로 숨긴다
+                counts = bulk_many(driver, "hide", step["targets"])
+                self.log(f"Hid {sum(counts or [])} elements for {len(step['targets'])} selectors.")
+            elif op == "click-list":
+                self._click_list(driver, step, url, branch)
+            elif op in self.handlers:
+                self.handlers[op](driver, step, url)
+            else:
+                raise ValueError(f"Unsupported action type: {op}")
+        except self.propagate:
+            status = "cancelled"
+            raise
+        except Exception as e:
+            status = "error"
+            self.log(f"Error in step s{step['id']} ({op}, {branch}): {e}")
+            if op == "load":
+                raise  # 페이지를 못 열면 이 세션의 나머지 단계는 의미가 없다
+        finally:
+            with self._lock:
+                self.timings.append({"id": step["id"], "op": op, "branch": branch, "status": status,
+                                     "seconds": time.perf_counter() - start})
+
+    def _click_list(self, driver, step, url, branch):
+        urls = driver.execute_script(LINKS_SCRIPT, step.get("target", {})) or []
+        self.log(f"click-list: {len(urls)} links")
+
+        def run_branch(index, link, branch_driver=None):
+            name = f"{branch}/{index}"
+            try:
+                self._run_steps(branch_driver, step["body"], link, name)
+            except self.propagate:
+                raise
+            except Exception as e:
+                self.log(f"Branch {name} ({link}) failed: {e}")
+            time.sleep(step.get("delay", 0))
+
+        if branch == "main":
+            # 링크마다 다른 세션에서 동시에 실행 (메인 세션은 현재 페이지를 유지)
+            with ThreadPoolExecutor(max_workers=self.max_branches) as executor:
+                futures = [executor.submit(run_branch, i, link) for i, link in enumerate(urls)]
+                for future in futures:
+                    future.result()
+        else:
+            # 중첩된 click-list는 세션을 더 빌리지 않고 현재 세션에서 차례로 실행 (풀 고갈 방지)
+            for i, link in enumerate(urls):
+                run_branch(i, link, driver)
+            if urls:
+                self.driver_pool.get(driver, url)  # 이 세션의 다음 단계를 위해 원래 페이지로 복귀
+
+
+def format_timings(timings):
+    """단계 id별로 실행 횟수, 총/평균 시간, 오류 수를 정리한 표 문자열"""
+    summary = {}
+    for timing in timings:
+        entry = summary.setdefault(timing["id"], {"op": timing["op"], "runs": 0, "total": 0.0, "errors": 0})
+        entry["runs"] += 1
+        entry["total"] += timing["seconds"]
+        entry["errors"] += timing["status"] != "ok"
+
+    lines = [f"{'step':>6} {'op':<11} {'runs':>5} {'total(s)':>9} {'avg(s)':>8} {'errors':>6}"]
+    for step_id in sorted(summary):
+        entry = summary[step_id]
+        lines.append(f"{'s' + str(step_id):>6} {entry['op']:<11} {entry['runs']:>5} {entry['total']:>9.2f} "
+                     f"{entry['total'] / entry['runs']:>8.2f} {entry['errors']:>6}")
+    return "\n".join(lines)
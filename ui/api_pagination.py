@@ -0,0 +1,130 @@
+from concurrent.futures import ThreadPoolExecutor
+
+from json_paths import compile_selector, extract_items
+
+PAGINATION_MODES = ("none", "page", "offset", "cursor")
+
+
+def _next_cursor(item, cursor_path):
+    for value in compile_selector(cursor_path).select(item):
+        return value
+    return None
+
+
+def iter_pages(fetch, key_path, mode="page", page_size=30, base_payload=None, start=None,
+               size_param="page_size", page_param="page", offset_param="offset",
+               cursor_path="id", cursor_param="cursor", max_items=None, max_pages=None,
+               prefetch=True, submit=None):
+    """
+    페이지네이션 API를 끝까지(또는 예산까지) 따라가며 페이지별 항목 목록을 돌려주는 제너레이터.
+
+    현재 페이지를 돌려주기 전에 다음 페이지 요청을 미리 보내 두므로(prefetch),
+    호출하는 쪽이 결과를 처리하는 동안 다음 응답을 기다리는 시간이 겹친다.
+
+    :param fetch: payload(dict)를 받아 응답(dict)을 반환하는 함수 (예: call_api를 감싼 함수). 실패 시 None
+    :param key_path: 응답에서 항목 목록을 꺼낼 경로 (json_paths.extract_items 참고)
+    :param mode: "page"(페이지 번호), "offset"(시작 위치), "cursor"(마지막 항목의 값), "none"(한 번만 요청)
+    :param page_size: 한 페이지에 요청할 항목 수 (size_param으로 전송)
+    :param base_payload: 모든 요청에 공통으로 넣을 값
+    :param start: 첫 페이지 번호/offset/cursor (기본값: page=1, offset=0, cursor=없음)
+    :param cursor_path: cursor 모드에서 마지막 항목에서 다음 커서를 꺼낼 경로 (예: "commentid")
+    :param max_items: 이만큼 모으면 중단 (마지막 페이지는 잘라서 반환)
+    :param max_pages: 이만큼 요청하면 중단
+    :param prefetch: 다음 페이지를 미리 요청할지 여부
+    :param submit: fetch를 백그라운드에서 실행할 함수 (executor.submit 형태). 없으면 내부 스레드 하나를 사용
+    """
+    if mode not in PAGINATION_MODES:
+        raise ValueError(f"Unknown pagination mode: {mode}")
+
+    def payload_for(position):
+        payload = dict(base_payload or {})
+        payload[size_param] = page_size
+        if mode == "page":
+            payload[page_param] = position
+        elif mode == "offset":
+            payload[offset_param] = position
+        elif mode == "cursor" and position is not None:
+            payload[cursor_param] = position
+        return payload
+
+    own_executor = None
+    if prefetch and submit is None:
+        own_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="prefetch")
+        submit = own_executor.submit
+
+    def request(position):
+        if prefetch:
+            return submit(fetch, payload_for(position))
+        return fetch(payload_for(position))
+
+    if start is None:
+        start = {"page": 1, "offset": 0}.get(mode)
+
+    position = start
+    pending = request(position)
+    collected = pages = 0
+    try:
+        while pending is not None:
+            response = pending.result() if prefetch else pending
+            pending = None
+            pages += 1
+
+            items = extract_items(response, key_path)
+            if not items:
+                break  # 빈 페이지 = 끝
+            if max_items is not None and collected + len(items) > max_items:
+                items = items[:max_items - collected]
+            collected += len(items)
+
+            # 다음 페이지 위치를 정하고, 결과를 돌려주기 전에 미리 요청해 둔다
+            more = (mode != "none"
+                    and (max_items is None or collected < max_items)
+                    and (max_pages is None or pages < max_pages))
+            if more and mode in ("page", "offset"):
+                more = len(items) >= page_size  # 덜 찬 페이지 = 마지막 페이지
+                position = position + 1 if mode == "page" else position + len(items)
+            elif more:
+                cursor = _next_cursor(items[-1], cursor_path)
+                more = cursor is not None and cursor != position
+                position = cursor
+            if more:
+                pending = request(position)
+
+            yield items
+    finally:
+        if pending is not None and prefetch:
+            pending.cancel()
+        if own_executor:
+            own_executor.shutdown(wait=False)
+
+
+if __name__ == "__main__":
+    import time
+
+    # 응답에 50ms가 걸리는 가짜 API와, 항목 처리에 페이지당 50ms가 걸리는 소비자
+    LATENCY = 0.05
+    rows = [{"commentid": 10000 - i, "contents": f"review {i}"} for i in range(1000)]
+
+    def fake_api(payload):
+        time.sleep(LATENCY)
+        size = payload["page_size"]
+        if "cursor" in payload:
+            start = next(i for i, r in enumerate(rows) if r["commentid"] == payload["cursor"]) + 1
+        else:
+            start = payload.get("offset", (payload.get("page", 1) - 1) * size)
+        return {"comment": {"list": rows[start:start + size]}}
+
+    for mode, kwargs in [("page", {}), ("offset", {}), ("cursor", {"cursor_path": "commentid"})]:
+        timings = {}
+        for prefetch in (False, True):
+            start = time.perf_counter()
+            got = []
+            for page in iter_pages(fake_api, "comment.list", mode=mode, page_size=50, prefetch=prefetch, **kwargs):
+                time.sleep(LATENCY)  # 결과 처리 (sink에 쓰기 등)
+                got.extend(page)
+            timings[prefetch] = time.perf_counter() - start
+            assert got == rows, mode
+
+        budget = sum(len(p) for p in iter_pages(fake_api, "comment.list", mode=mode, page_size=50, max_items=120, **kwargs))
+        assert budget == 120
+        print(f"{mode:>6}: sequential {timings[False]:.2f}s, prefetch {timings[True]:.2f}s")
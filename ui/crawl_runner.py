@@ -0,0 +1,129 @@
+import queue
+import threading
+
+
+class CrawlCancelled(Exception):
+    """CrawlRunner.cancel()로 작업이 취소되었을 때 checkpoint()에서 발생"""
+
+
+class CrawlRunner:
+    """
+    Tk 버튼 콜백 대신 백그라운드 스레드에서 크롤링을 실행하는 엔진.
+
+    작업 스레드는 log()/emit()/progress()로 메시지를 큐에 넣기만 하고,
+    UI 스레드가 root.after로 큐를 주기적으로 비우면서 위젯에 한꺼번에 반영한다.
+    작업 함수는 중간중간 checkpoint()를 호출해 일시정지/취소 요청을 처리한다.
+
+    :param root: Tk 루트 위젯
+    :param on_log: 로그 문자열 묶음(str)을 받아 위젯에 쓰는 함수
+    :param on_results: 결과 목록(list)을 받아 위젯에 쓰는 함수
+    :param on_done: 작업이 끝났을 때 상태("done", "cancelled", "error")와 메시지를 받는 함수
+    :param poll_ms: 큐를 비우는 주기 (밀리초)
+    :param batch_size: 한 번의 폴링에서 처리할 최대 메시지 수
+    """
+
+    def __init__(self, root, on_log, on_results, on_done=None, poll_ms=100, batch_size=1000):
+        self.root = root
+        self.on_log = on_log
+        self.on_results = on_results
+        self.on_done = on_done
+        self.poll_ms = poll_ms
+        self.batch_size = batch_size
+        self._queue = queue.Queue()
+        self._progress = {}
+        self._progress_lock = threading.Lock()
+        self._cancel = threading.Event()
+        self._resume = threading.Event()
+        self._thread = None
+
+    @property
+    def running(self):
+        return self._thread is not None and self._thread.is_alive()
+
+    @property
+    def paused(self):
+        return not self._resume.is_set()
+
+    def start(self, target, *args, **kwargs):
+        """target(*args, **kwargs)를 백그라운드에서 실행한다. 이미 실행 중이면 False를 반환."""
+        if self.running:
+            return False
+        self._cancel.clear()
+        self._resume.set()
+
+        def run():
+            try:
+                target(*args, **kwargs)
+                self._queue.put(("done", "done", None))
+            except CrawlCancelled:
+                self._queue.put(("done", "cancelled", None))
+            except Exception as e:
+                self._queue.put(("done", "error", str(e)))
+
+        self._thread = threading.Thread(target=run, daemon=True)
+        self._thread.start()
+        self.root.after(self.poll_ms, self._poll)
+        return True
+
+    # --- 작업 스레드에서 호출 ---
+
+    def log(self, message):
+        self._queue.put(("log", message))
+
+    def emit(self, *results):
+        self._queue.put(("results", results))
+
+    def progress(self, key, status):
+        """key별 최신 진행 상황만 유지했다가 폴링 때 한 줄씩 표시한다."""
+        with self._progress_lock:
+            self._progress[key] = status
+
+    def checkpoint(self):
+        """일시정지 상태면 재개될 때까지 기다리고, 취소되었으면 CrawlCancelled를 발생시킨다."""
+        while not self._resume.wait(0.2):
+            if self._cancel.is_set():
+                break
+        if self._cancel.is_set():
+            raise CrawlCancelled()
+
+    # --- UI 스레드에서 호출 ---
+
+    def pause(self):
+        self._resume.clear()
+
+    def resume(self):
+        self._resume.set()
+
+    def cancel(self):
+        self._cancel.set()
+        self._resume.set()
+
+    def _poll(self):
+        logs, results, finished = [], [], None
+        for _ in range(self.batch_size):
+            try:
+                kind, *payload = self._queue.get_nowait()
+            except queue.Empty:
+                break
+            if kind == "log":
+                logs.append(payload[0])
+            elif kind == "results":
+                results.extend(payload[0])
+            elif kind == "done":
+                finished = payload
+                break
+
+        with self._progress_lock:
+            progress, self._progress = self._progress, {}
+        logs.extend(f"[{key}] {status}" for key, status in sorted(progress.items()))
+
+        if logs:
+            self.on_log("\n".join(logs))
+        if results:
+            self.on_results(results)
+
+        if finished:
+            if self.on_done:
+                self.on_done(*finished)
+            return
+        self.root.after(self.poll_ms, self._poll)
@@ -0,0 +1,233 @@
+import random
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from email.utils import parsedate_to_datetime
+
+import requests
+from requests.adapters import HTTPAdapter
+
+BODYLESS_METHODS = {"OPTIONS", "HEAD"}
+SUPPORTED_METHODS = {"GET", "POST", "PUT", "PATCH", "DELETE", "OPTIONS", "HEAD"}
+
+
+def parse_retry_after(value):
+    """Retry-After 헤더(초 또는 HTTP 날짜)를 대기 시간(초)으로 변환. 해석할 수 없으면 None."""
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
+
+
+class HttpEngine:
+    """
+    call_api 뒤에서 동작하는 HTTP 요청 엔진.
+
+    - 스레드마다 keep-alive 연결 풀을 가진 requests.Session을 재사용한다.
+    - 모든 요청에 timeout을 건다.
+    - 429/5xx 응답과 연결 오류는 지수 백오프(full jitter)로 재시도하고, Retry-After가 있으면 그 값을 따른다.
+    - fan_out()으로 여러 요청을 최대 concurrency개까지 동시에 보낸다.
+
+    :param concurrency: 동시에 보낼 최대 요청 수 (스레드 수 및 호스트당 연결 풀 크기)
+    :param timeout: 요청 timeout (초, 또는 (connect, read) 튜플)
+    :param max_retries: 첫 시도 이후 최대 재시도 횟수
+    :param backoff: 백오프 기본 간격 (초). n번째 재시도는 0 ~ backoff * 2**n 사이에서 무작위로 기다린다
+    :param max_backoff: 한 번에 기다리는 최대 시간 (Retry-After에도 적용)
+    :param retry_statuses: 재시도할 HTTP 상태 코드
+    """
+
+    def __init__(self, concurrency=8, timeout=10, max_retries=4, backoff=0.5, max_backoff=30.0,
+                 retry_statuses=(429, 500, 502, 503, 504)):
+        self.concurrency = concurrency
+        self.timeout = timeout
+        self.max_retries = max_retries
+        self.backoff = backoff
+        self.max_backoff = max_backoff
+        self.retry_statuses = set(retry_statuses)
+        self._local = threading.local()
+        self._sessions = []
+        self._lock = threading.Lock()
+        self._executor = None
+        self._stats = {"requests": 0, "attempts": 0, "retries": 0, "failures": 0, "retry_wait": 0.0}
+
+    def _session(self):
+        # requests.Session은 스레드 간 공유가 안전하지 않으므로 스레드마다 하나씩 유지
+        session = getattr(self._local, "session", None)
+        if session is None:
+            session = self._local.session = requests.Session()
+            adapter = HTTPAdapter(pool_connections=self.concurrency, pool_maxsize=self.concurrency)
+            session.mount("https://", adapter)
+            session.mount("http://", adapter)
+            with self._lock:
+                self._sessions.append(session)
+        return session
+
+    def _count(self, key, amount=1):
+        with self._lock:
+            self._stats[key] += amount
+
+    def _retry_delay(self, attempt, response=None):
+        if response is not None:
+            retry_after = parse_retry_after(response.headers.get("Retry-After"))
+            if retry_after is not None:
+                return min(retry_after, self.max_backoff)
+        return random.uniform(0, min(self.max_backoff, self.backoff * 2 ** attempt))
+
+    def request(self, method, url, headers=None, payload=None, **kwargs):
+        """
+        요청을 보내고 requests.Response를 반환한다.
+        재시도를 모두 소진하면 마지막 응답을 그대로 돌려주거나(상태 코드 확인은 호출하는 쪽에서)
+        마지막 연결 오류를 다시 발생시킨다.
+
+        payload는 GET이면 쿼리 파라미터로, OPTIONS/HEAD가 아니면 JSON 본문으로 보낸다.
+        나머지 키워드 인자(stream 등)는 requests에 그대로 전달한다.
+        """
+        method = method.upper()
+        if method not in SUPPORTED_METHODS:
+            raise ValueError(f"지원되지 않는 HTTP 메서드입니다: {method}")
+        if method == "GET":
+            kwargs["params"] = payload
+        elif method not in BODYLESS_METHODS:
+            kwargs["json"] = payload
+        kwargs.setdefault("timeout", self.timeout)
+
+        self._count("requests")
+        session = self._session()
+        attempt = 0
+        while True:
+            self._count("attempts")
+            try:
+                response = session.request(method, url, headers=headers, **kwargs)
+            except (requests.exceptions.ConnectionError, requests.exceptions.Timeout):
+                if attempt >= self.max_retries:
+                    self._count("failures")
+                    raise
+                delay = self._retry_delay(attempt)
+            else:
+                if response.status_code not in self.retry_statuses:
+                    return response
+                if attempt >= self.max_retries:
+                    self._count("failures")
+                    return response
+                delay = self._retry_delay(attempt, response)
+                response.close()
+
+            attempt += 1
+            self._count("retries")
+            self._count("retry_wait", delay)
+            time.sleep(delay)
+
+    def submit(self, func, *args, **kwargs):
+        """func를 엔진의 스레드 풀에서 실행하고 Future를 반환한다 (페이지 prefetch 등에 사용)."""
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(max_workers=self.concurrency, thread_name_prefix="http-engine")
+            executor = self._executor
+        return executor.submit(func, *args, **kwargs)
+
+    def fan_out(self, func, calls):
+        """
+        calls의 각 항목(인자 튜플 또는 키워드 dict)으로 func를 동시에 실행하고 결과를 입력 순서대로 반환한다.
+        func 안에서 이 엔진의 request()를 사용하면 concurrency개의 연결로 나누어 보내게 된다.
+        """
+        futures = [self.submit(func, **call) if isinstance(call, dict) else self.submit(func, *call) for call in calls]
+        return [future.result() for future in futures]
+
+    def metrics(self):
+        with self._lock:
+            return dict(self._stats)
+
+    def close(self):
+        with self._lock:
+            executor, self._executor = self._executor, None
+            sessions, self._sessions = self._sessions, []
+        if executor:
+            executor.shutdown(wait=True)
+        for session in sessions:
+            session.close()
+
+
+if __name__ == "__main__":
+    import json
+    from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+    LATENCY = 0.05
+    hits = {}
+    hits_lock = threading.Lock()
+
+    class _MockHandler(BaseHTTPRequestHandler):
+        """
+        /items/<n> : n번째 요청마다 상황을 흉내내는 목 서버
+          - n % 10 == 0 : 첫 요청에 429 + Retry-After: 1
+          - n % 10 == 1 : 첫 두 요청에 503
+          - 나머지      : 바로 200
+        """
+        protocol_version = "HTTP/1.1"
+
+        def _reply(self, status, body=b"", headers=None):
+            self.send_response(status)
+            for key, value in (headers or {}).items():
+                self.send_header(key, value)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def _handle(self):
+            length = int(self.headers.get("Content-Length") or 0)
+            if length:
+                self.rfile.read(length)
+            n = int(self.path.rsplit("/", 1)[-1].split("?")[0])
+            with hits_lock:
+                hits[n] = count = hits.get(n, 0) + 1
+            time.sleep(LATENCY)
+            if n % 10 == 0 and count == 1:
+                self._reply(429, headers={"Retry-After": "1"})
+            elif n % 10 == 1 and count <= 2:
+                self._reply(503)
+            else:
+                self._reply(200, json.dumps({"id": n, "attempt": count}).encode())
+
+        do_GET = do_POST = _handle
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _MockHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    base = f"http://127.0.0.1:{server.server_address[1]}/items"
+    total = 100
+
+    # 기존 방식: 모듈 수준 requests.post, 재시도 없음, 순차 실행 (오류를 흉내내지 않는 번호만)
+    sequential_ids = [n for n in range(total) if n % 10 >= 2]
+    start = time.perf_counter()
+    for n in sequential_ids:
+        requests.post(f"{base}/{n}", json={"page_size": 30}, timeout=10).raise_for_status()
+    sequential = time.perf_counter() - start
+
+    hits.clear()
+    engine = HttpEngine(concurrency=16, backoff=0.1)
+
+    def fetch(n):
+        response = engine.request("POST", f"{base}/{n}", payload={"page_size": 30})
+        response.raise_for_status()
+        return response.json()
+
+    start = time.perf_counter()
+    results = engine.fan_out(fetch, [(n,) for n in range(total)])
+    concurrent = time.perf_counter() - start
+    engine.close()
+    server.shutdown()
+
+    assert [r["id"] for r in results] == list(range(total))
+    assert all(r["attempt"] == 2 for r in results if r["id"] % 10 == 0)  # 429 후 재시도
+    assert all(r["attempt"] == 3 for r in results if r["id"] % 10 == 1)  # 503 두 번 후 재시도
+    print(f"Sequential requests.post ({len(sequential_ids)} ok-only calls): {sequential:.2f}s")
+    print(f"HttpEngine fan-out ({total} calls incl. 429/503 retries): {concurrent:.2f}s")
+    print(f"Engine metrics: {engine.metrics()}")
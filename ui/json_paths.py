@@ -0,0 +1,213 @@
+import re
+import time
+
+_TOKEN = re.compile(r"([^.\[\]]+)|\[(\d+|\*)\]")
+
+
+def iter_flatten(obj, parent_key='', sep='.'):
+    """
+    중첩된 dict/list를 (경로, 값) 쌍으로 하나씩 돌려주는 제너레이터.
+    재귀 없이 명시적인 스택을 사용하므로 깊은 JSON에서도 재귀 한도에 걸리지 않고,
+    중간 dict를 만들지 않아 필요한 만큼만 순회할 수 있다.
+
+    경로 형식은 flatten_dict와 같다: "comment.list[0].contents"
+    빈 list는 (경로, [])로, 빈 dict는 아무것도 내보내지 않는다.
+    """
+    stack = [(parent_key, obj)]
+    while stack:
+        key, value = stack.pop()
+        if isinstance(value, dict):
+            children = [(f"{key}{sep}{k}" if key else k, v) for k, v in value.items()]
+        elif isinstance(value, list) and value:
+            children = [(f"{key}[{i}]", v) for i, v in enumerate(value)]
+        else:
+            yield key, value
+            continue
+        # 원래 순서대로 나오도록 역순으로 쌓는다
+        stack.extend(reversed(children))
+
+
+def flatten_dict(d, parent_key='', sep='.'):
+    """
+    Flattens a nested dictionary into a single dictionary with dot-separated keys.
+
+    Parameters:
+        d (dict): The original dictionary to flatten.
+        parent_key (str): The base key to prepend.
+        sep (str): Separator for nested keys.
+
+    Returns:
+        dict: A flattened dictionary.
+    """
+    return dict(iter_flatten(d, parent_key, sep))
+
+
+class KeyPathSelector:
+    """
+    "comment.list[*].contents" 같은 키 경로를 미리 파싱해 두고,
+    전체를 평탄화하지 않고 해당 위치의 값만 따라 내려가 꺼낸다.
+    [*]는 list의 모든 원소, 키 자리의 *는 dict의 모든 값을 뜻한다.
+    """
+
+    def __init__(self, key_path, sep='.'):
+        self.key_path = key_path
+        self.steps = []
+        for part in key_path.split(sep):
+            for key, index in _TOKEN.findall(part):
+                if index == "*":
+                    self.steps.append(("each", None))
+                elif index:
+                    self.steps.append(("index", int(index)))
+                elif key == "*":
+                    self.steps.append(("each", None))
+                else:
+                    self.steps.append(("key", key))
+
+    @classmethod
+    def from_steps(cls, steps, key_path=""):
+        """이미 파싱된 단계 목록으로 만든다 (경로의 일부만 따로 적용할 때)"""
+        selector = cls("")
+        selector.key_path = key_path
+        selector.steps = list(steps)
+        return selector
+
+    def select(self, obj):
+        """경로에 해당하는 값을 순서대로 돌려주는 제너레이터"""
+        stack = [(0, obj)]
+        while stack:
+            depth, value = stack.pop()
+            if depth == len(self.steps):
+                yield value
+                continue
+            kind, arg = self.steps[depth]
+            if kind == "key":
+                if isinstance(value, dict) and arg in value:
+                    stack.append((depth + 1, value[arg]))
+            elif kind == "index":
+                if isinstance(value, list) and -len(value) <= arg < len(value):
+                    stack.append((depth + 1, value[arg]))
+            elif isinstance(value, list):
+                stack.extend((depth + 1, item) for item in reversed(value))
+            elif isinstance(value, dict):
+                stack.extend((depth + 1, item) for item in reversed(list(value.values())))
+
+
+_selector_cache = {}
+
+
+def compile_selector(key_path, sep='.'):
+    """같은 key_path는 한 번만 파싱하도록 캐시해서 반환"""
+    selector = _selector_cache.get((key_path, sep))
+    if selector is None:
+        selector = _selector_cache[(key_path, sep)] = KeyPathSelector(key_path, sep)
+    return selector
+
+
+def iter_leaves(value):
+    """값이 dict/list면 그 안의 말단 값들을, 아니면 값 자체를 돌려준다 (flatten_dict의 값 순서와 같다)"""
+    if isinstance(value, dict) or (isinstance(value, list) and value):
+        for _, leaf in iter_flatten(value):
+            yield leaf
+    else:
+        yield value
+
+
+def extract_by_key_path(response, key_path):
+    """
+    key_path에 해당하는 말단 값 목록을 반환한다 (GUI의 crawl 결과).
+
+    - key_path가 비어 있으면 기존 동작처럼 모든 말단 값
+    - 정확한 경로로 찾으면 그 값. 찾은 값이 list/dict면 그 안의 말단 값들로 펼친다
+      ("comment.list" -> 목록 안의 모든 값, 기존의 평탄화 + 포함 검색과 같은 결과)
+    - 정확한 경로로 찾지 못하면, 기존 동작처럼 평탄화된 경로에 key_path가 포함된 값을 모두 반환한다
+    """
+    if not key_path:
+        return [v for _, v in iter_flatten(response)]
+    results = [leaf for value in compile_selector(key_path).select(response) for leaf in iter_leaves(value)]
+    if results:
+        return results
+    return [v for k, v in iter_flatten(response) if key_path in k]
+
+
+def extract_items(response, key_path):
+    """
+    key_path가 가리키는 항목 목록을 반환한다 (페이지네이션에서 페이지의 항목을 꺼낼 때).
+    "comment.list"처럼 목록 자체를 가리키면 그 원소들을, "comment.list[*]"처럼 원소를 가리키면 그대로 사용하고,
+    정확한 경로로 찾지 못하면 extract_by_key_path의 포함 검색으로 대신한다.
+    """
+    if response is None:
+        return []
+    values = list(compile_selector(key_path).select(response)) if key_path else [response]
+    if len(values) == 1 and isinstance(values[0], list):
+        return values[0]
+    return values or extract_by_key_path(response, key_path)
+
+
+def _flatten_dict_recursive(d, parent_key='', sep='.'):
+    # 비교용: 기존 재귀 구현
+    items = []
+    for k, v in d.items():
+        new_key = f"{parent_key}{sep}{k}" if parent_key else k
+        if isinstance(v, dict):
+            items.extend(_flatten_dict_recursive(v, new_key, sep=sep).items())
+        elif isinstance(v, list):
+            if len(v) > 0:
+                for i, item in enumerate(v):
+                    if isinstance(item, (dict, list)):
+                        items.extend(_flatten_dict_recursive(item, f"{new_key}[{i}]", sep=sep).items())
+                    else:
+                        items.append((f"{new_key}[{i}]", item))
+            else:
+                items.append((new_key, []))
+        else:
+            items.append((new_key, v))
+    return dict(items)
+
+
+if __name__ == "__main__":
+    import json
+
+    # 카카오 commentlist 응답과 비슷한 구조의 수 MB짜리 페이로드
+    comment = {
+        "commentid": 0, "contents": "여기 맛나서 서울여행동안 3번 먹었읍니다 " * 5, "point": 5,
+        "username": "user", "photoCnt": 2, "likeCnt": 3,
+        "photoList": [{"url": "http://example.com/a.jpg", "size": [640, 480]}] * 2,
+        "strengths": [{"id": 1, "name": "맛"}, {"id": 2, "name": "가성비"}],
+    }
+    payload = {"basicInfo": {"cid": 10332413}, "comment": {"list": [dict(comment, commentid=i) for i in range(20000)]}}
+    print(f"Payload: {len(json.dumps(payload, ensure_ascii=False)) / 1e6:.1f} MB")
+
+    start = time.perf_counter()
+    flattened = _flatten_dict_recursive(payload)
+    old = [v for k, v in flattened.items() if "contents" in k]
+    old_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    new = list(compile_selector("comment.list[*].contents").select(payload))
+    selector_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    iterative = flatten_dict(payload)
+    iterative_time = time.perf_counter() - start
+    assert iterative == flattened
+
+    assert old == new
+    print(f"Recursive flatten + substring scan: {old_time:.3f}s")
+    print(f"Iterative flatten (full): {iterative_time:.3f}s")
+    print(f"Compiled selector: {selector_time:.3f}s")
+
+    # GUI 결과는 기존 평탄화 + 포함 검색과 같아야 한다 (빈 경로, 목록을 가리키는 경로, 부분 키)
+    small = {"comment": {"list": [dict(comment, commentid=i) for i in range(3)], "hasNext": False}}
+    small_flat = _flatten_dict_recursive(small)
+    for key_path in ("", "comment.list", "contents"):
+        assert extract_by_key_path(small, key_path) == [v for k, v in small_flat.items() if key_path in k], key_path
+    assert extract_by_key_path(small, "comment.list[*].contents") == extract_by_key_path(small, "contents")
+    assert extract_by_key_path(small, "comment.list[1].commentid") == [1]
+    assert [item["commentid"] for item in extract_items(small, "comment.list")] == [0, 1, 2]
+
+    deep = current = {}
+    for _ in range(5000):
+        current["child"] = {}
+        current = current["child"]
+    current["leaf"] = 1
+    print(f"Deep payload (5000 levels): {next(iter_flatten(deep))[0].count('.')} separators, no RecursionError")
@@ -0,0 +1,317 @@
+import codecs
+import json
+import re
+
+from json_paths import KeyPathSelector, iter_leaves
+
+_STRING_SPECIAL = re.compile(r'["\\]')
+_WHITESPACE = re.compile(r"[ \t\r\n]*")
+_SCALAR_END = re.compile(r"[,\]}\s]")
+_STRUCTURAL = re.compile(r'["{}\[\]]')
+_STRING_REST = re.compile(r'(?:[^"\\]|\\.)*"')
+
+
+class _Frame:
+    __slots__ = ("kind", "key", "expect", "target", "count")
+
+    def __init__(self, kind, target=False):
+        self.kind = kind  # "obj" 또는 "arr"
+        self.key = None  # obj: 현재 읽고 있는 키
+        self.expect = "key" if kind == "obj" else "value"
+        self.target = target  # key_path가 가리키는 배열이면 True
+        self.count = 0  # target 배열에서 지금까지 시작된 원소 수
+
+
+class JsonPathStreamer:
+    """
+    JSON 텍스트를 조각(chunk) 단위로 받아, prefix 경로에 있는 값을 완성되는 즉시 (원소 여부, 값)으로 돌려준다.
+    prefix가 배열을 가리키면 배열의 원소를 하나씩 (True, 원소)로, 그 외의 값이면 값 전체를 한 번 (False, 값)으로 돌려준다.
+    전체 문서를 메모리에 올리지 않고, 현재 만들고 있는 원소의 텍스트만 버퍼에 유지한다.
+
+    :param prefix: 키 목록 (예: ["comment", "list"])
+    :param index: 배열의 index 번째 원소만 돌려준다 (None이면 모든 원소)
+    """
+
+    def __init__(self, prefix, index=None):
+        self.prefix = list(prefix)
+        self.index = index
+        self.element = False  # 지금 캡처 중인 값이 target 배열의 원소인지
+        self._buf = ""
+        self._pos = 0
+        self._stack = []
+        self._started = False  # 최상위 값이 시작되었는지
+        self._in_string = False
+        self._string_start = None
+        self._string_is_key = False
+        self._scalar_start = None
+        self._capture = None  # (시작 위치, 시작 시점의 스택 깊이)
+        self._nesting = 0  # 캡처 중인 객체/배열 안에서의 괄호 깊이 (프레임 없이 괄호만 센다)
+
+    def _at_prefix(self):
+        if len(self._stack) != len(self.prefix):
+            return False
+        return all(f.kind == "obj" and f.key == key for f, key in zip(self._stack, self.prefix))
+
+    def _value_start(self, i, c):
+        """i 위치에서 값이 시작될 때 호출. 캡처 여부를 정하고 부모 상태를 갱신한다."""
+        top = self._stack[-1] if self._stack else None
+        opens_target = False
+        if self._capture is None:
+            if top is not None and top.target:
+                if self.index is None or top.count == self.index:
+                    self._capture, self.element = (i, len(self._stack)), True
+                top.count += 1
+            elif self._at_prefix():
+                if c == "[":
+                    opens_target = True
+                else:
+                    self._capture, self.element = (i, len(self._stack)), False
+        if top is not None:
+            top.expect = "comma"
+        else:
+            self._started = True
+        return opens_target
+
+    def _value_end(self, end, out):
+        if self._capture and len(self._stack) == self._capture[1]:
+            out.append((self.element, json.loads(self._buf[self._capture[0]:end])))
+            self._capture = None
+
+    def feed(self, text):
+        """텍스트 조각을 추가하고, 이번에 완성된 값 목록을 반환한다."""
+        self._buf += text
+        buf, i, n = self._buf, self._pos, len(self._buf)
+        out = []
+
+        while i < n:
+            if self._nesting:
+                # 캡처 중인 원소 내부: 구조를 해석하지 않고 괄호 짝만 맞추며 빠르게 건너뛴다
+                m = _STRUCTURAL.search(buf, i)
+                if not m:
+                    i = n
+                    break
+                i = m.start()
+                c = buf[i]
+                if c == '"':
+                    m = _STRING_REST.match(buf, i + 1)
+                    if not m:
+                        break  # 문자열이 다음 조각에서 끝남
+                    i = m.end()
+                    continue
+                self._nesting += 1 if c in "{[" else -1
+                i += 1
+                if not self._nesting:
+                    self._value_end(i, out)
+                continue
+
+            if self._in_string:
+                m = _STRING_SPECIAL.search(buf, i)
+                if not m:
+                    i = n
+                    break
+                i = m.start()
+                if buf[i] == "\\":
+                    if i + 1 >= n:
+                        break  # 이스케이프 문자가 다음 조각에 있음
+                    i += 2
+                    continue
+                # 문자열 끝
+                self._in_string = False
+                i += 1
+                if self._string_is_key:
+                    self._stack[-1].key = json.loads(buf[self._string_start:i])
+                    self._stack[-1].expect = "colon"
+                else:
+                    self._value_end(i, out)
+                self._string_start = None
+                continue
+
+            if self._scalar_start is not None:
+                m = _SCALAR_END.search(buf, i)
+                if not m:
+                    i = n
+                    break
+                i = m.start()
+                self._scalar_start = None
+                self._value_end(i, out)
+                continue
+
+            i = _WHITESPACE.match(buf, i).end()
+            if i >= n:
+                break
+            c = buf[i]
+            top = self._stack[-1] if self._stack else None
+            expecting_value = (top.expect == "value") if top else not self._started
+
+            if c == '"' and top is not None and top.kind == "obj" and top.expect == "key":
+                self._in_string, self._string_is_key, self._string_start = True, True, i
+            elif c in "}]":
+                self._stack.pop()
+                self._value_end(i + 1, out)
+            elif c == ":":
+                top.expect = "value"
+            elif c == ",":
+                top.expect = "key" if top.kind == "obj" else "value"
+            elif expecting_value:
+                opens_target = self._value_start(i, c)
+                if c in "{[" and self._capture and self._capture[0] == i:
+                    self._nesting = 1
+                elif c == "{":
+                    self._stack.append(_Frame("obj"))
+                elif c == "[":
+                    self._stack.append(_Frame("arr", target=opens_target))
+                elif c == '"':
+                    self._in_string, self._string_is_key, self._string_start = True, False, i
+                else:
+                    self._scalar_start = i
+            else:
+                raise ValueError(f"Unexpected character {c!r} in JSON stream")
+            i += 1
+
+        # 다 처리한 앞부분은 버린다 (캡처 중인 원소나 읽는 중인 키/숫자는 남김)
+        keep = [i]
+        if self._capture:
+            keep.append(self._capture[0])
+        if self._string_start is not None and self._string_is_key:
+            keep.append(self._string_start)
+        if self._scalar_start is not None:
+            keep.append(self._scalar_start)
+        cut = min(keep)
+        self._buf = buf[cut:]
+        self._pos = i - cut
+        if self._capture:
+            self._capture = (self._capture[0] - cut, self._capture[1])
+        if self._string_start is not None:
+            self._string_start -= cut
+        if self._scalar_start is not None:
+            self._scalar_start -= cut
+        return out
+
+    def close(self):
+        """스트림이 끝났을 때 호출. 최상위 숫자처럼 끝 표시가 없는 값을 마무리한다."""
+        out = []
+        if self._scalar_start is not None:
+            self._scalar_start = None
+            self._value_end(len(self._buf), out)
+        return out
+
+
+def stream_plan(key_path):
+    """
+    key_path(json_paths 문법)를 스트리밍할 수 있게 (prefix 키 목록, 배열 단계, 원소에 적용할 단계, 값 전체에 적용할 단계)로 나눈다.
+    빈 경로나 와일드카드로 시작하는 경로처럼 고정된 키로 시작하지 않아 문서 전체가 필요한 경로면 None.
+    """
+    steps = KeyPathSelector(key_path).steps
+    prefix = []
+    for kind, arg in steps:
+        if kind != "key":
+            break
+        prefix.append(arg)
+    if not prefix:
+        return None
+    rest = steps[len(prefix):]
+    array_step = rest[0] if rest else None
+    return prefix, array_step, rest[1:] if array_step else [], rest
+
+
+def is_streamable(key_path):
+    return stream_plan(key_path) is not None
+
+
+def iter_json_path(chunks, key_path, encoding="utf-8"):
+    """
+    bytes 또는 str 조각의 이터러블에서 key_path에 해당하는 값을 도착하는 대로 돌려준다.
+    key_path 문법은 json_paths.KeyPathSelector와 같고, 경로가 배열에서 끝나면 원소를 하나씩 돌려준다.
+    스트리밍할 수 없는 경로(is_streamable)면 ValueError.
+
+    key_path 예시:
+        "comment.list"             -> list의 원소(리뷰 dict)를 하나씩
+        "comment.list[*].contents" -> 각 원소에서 contents만
+        "comment.list[0]"          -> 첫 번째 원소만
+    """
+    plan = stream_plan(key_path)
+    if plan is None:
+        raise ValueError(f"스트리밍으로 처리할 수 없는 key_path입니다: {key_path!r}")
+    prefix, array_step, element_steps, value_steps = plan
+    index = array_step[1] if array_step and array_step[0] == "index" else None
+    element_selector = KeyPathSelector.from_steps(element_steps) if element_steps else None
+    value_selector = KeyPathSelector.from_steps(value_steps) if value_steps else None
+
+    def select(results):
+        for is_element, value in results:
+            selector = element_selector if is_element else value_selector
+            if selector:
+                yield from selector.select(value)
+            else:
+                yield value
+
+    streamer = JsonPathStreamer(prefix, index)
+    decoder = codecs.getincrementaldecoder(encoding)()
+    for chunk in chunks:
+        text = decoder.decode(chunk) if isinstance(chunk, bytes) else chunk
+        yield from select(streamer.feed(text))
+    yield from select(streamer.feed(decoder.decode(b"", final=True)) + streamer.close())
+
+
+def iter_key_path_leaves(chunks, key_path, encoding="utf-8"):
+    """
+    json_paths.extract_by_key_path(전체 응답, key_path)의 정확한 경로 결과와 같은 말단 값들을 스트리밍으로 돌려준다.
+    아무것도 돌려주지 않았다면 정확한 경로가 없는 것이므로, 호출하는 쪽이 전체 응답으로 포함 검색을 해야 한다.
+    """
+    for value in iter_json_path(chunks, key_path, encoding):
+        yield from iter_leaves(value)
+
+
+if __name__ == "__main__":
+    import time
+    import tracemalloc
+
+    comment = {"commentid": 0, "contents": "뜨끈해서 추울때 먹으니 딱 좋더라구여 \"ㅎㅎ\" " * 5, "point": 5,
+               "photoList": [{"url": "http://example.com/a.jpg"}]}
+    count = 50000
+
+    def body_chunks(size=65536):
+        # 큰 목록 응답을 네트워크에서 조각으로 받는 상황을 흉내낸다
+        pending = '{"basicInfo": {"cid": 1}, "comment": {"kamapComntcnt": %d, "list": [' % count
+        for i in range(count):
+            pending += ("," if i else "") + json.dumps(dict(comment, commentid=i), ensure_ascii=False)
+            if len(pending) >= size:
+                yield pending.encode("utf-8")
+                pending = ""
+        yield (pending + "]}}").encode("utf-8")
+
+    # 스트리밍 결과는 전체 파싱 + extract_by_key_path와 같아야 한다 (정확한 경로가 없으면 전체 파싱으로 대신)
+    from json_paths import extract_by_key_path
+
+    small = {"comment": {"list": [dict(comment, commentid=i) for i in range(3)], "empty": [], "hasNext": False}}
+    text = json.dumps(small, ensure_ascii=False)
+    for key_path in ("comment.list", "comment.list[*].contents", "comment.list[1]", "comment.list[1].photoList",
+                     "comment.hasNext", "comment", "comment.empty", "contents", "comment.list[*].missing", ""):
+        expected = extract_by_key_path(small, key_path)
+        if is_streamable(key_path):
+            chunks = [text[i:i + 7] for i in range(0, len(text), 7)]
+            streamed = list(iter_key_path_leaves(chunks, key_path)) or extract_by_key_path(small, key_path)
+        else:
+            streamed = extract_by_key_path(small, key_path)
+        assert streamed == expected, (key_path, streamed, expected)
+
+    tracemalloc.start()
+    start = time.perf_counter()
+    document = json.loads(b"".join(body_chunks()))
+    loaded = [c["contents"] for c in document["comment"]["list"]]
+    full_time = time.perf_counter() - start
+    _, full_peak = tracemalloc.get_traced_memory()
+    del document, loaded
+    tracemalloc.reset_peak()
+
+    start = time.perf_counter()
+    streamed = 0
+    for _ in iter_json_path(body_chunks(), "comment.list[*].contents"):
+        streamed += 1
+    stream_time = time.perf_counter() - start
+    _, stream_peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    assert streamed == count
+    print(f"Full parse: {full_time:.2f}s, peak {full_peak / 1e6:.1f} MB")
+    print(f"Streaming:  {stream_time:.2f}s, peak {stream_peak / 1e6:.1f} MB")
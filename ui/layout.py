@@ -1,30 +1,63 @@
 import tkinter as tk
-from tkinter import messagebox, scrolledtext
-from selenium import webdriver
+from tkinter import filedialog, messagebox, scrolledtext
 from selenium.webdriver.common.by import By
-from selenium.webdriver.chrome.service import Service
-from webdriver_manager.chrome import ChromeDriverManager
 from selenium.webdriver.common.action_chains import ActionChains
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 import time
 import re
 import json
+import os
+import sys
+import threading
+import itertools
+
+# core/ 의 공용 크롤링 모듈 사용
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "core"))
+from driver_pool import DriverPool
+from crawl_profile import CRAWL_PROFILE
+from bulk_dom import bulk_hide, bulk_text
+from scroll_collector import iter_scroll_items
+from crawl_runner import CrawlCancelled, CrawlRunner
+from log_view import BoundedTextView, add_pager_buttons
+from json_paths import extract_by_key_path
+from json_stream import is_streamable, iter_key_path_leaves
+from http_engine import HttpEngine
+from api_pagination import PAGINATION_MODES, iter_pages
+from action_plan import ActionPlan, PlanExecutor, compile_plan, format_timings
+from navigation import NAVIGATION_STRATEGIES, NavigationSweep
+
+# 실행할 때마다 Chrome을 새로 띄우지 않고 headless 세션을 빌려 쓴다
+# (click-list 링크는 메인 세션 외의 세션들에서 동시에 처리, 이미지/글꼴/분석 스크립트는 받지 않음)
+driver_pool = DriverPool(size=4, profile=CRAWL_PROFILE)
+# API 요청은 세션을 재사용하고 재시도/동시 실행을 지원하는 엔진으로 보낸다
+http_engine = HttpEngine(concurrency=8, timeout=10)
 
 def safe_log(message):
     """
     Safely log messages to the log_text widget if available.
     If log_text is not initialized, print to the console.
+    Messages from the crawl worker thread are queued and written by the UI thread.
     """
-    if log_text:
-        log_text.insert(tk.END, message + "\n")  # self-referencing 제거
-        log_text.see(tk.END)  # 자동 스크롤
+    if threading.current_thread() is not threading.main_thread() and crawl_runner:
+        crawl_runner.log(message.rstrip("\n"))
+    elif log_view:
+        log_view.append(message)  # 줄 수 제한 + 묶음 갱신 + 파일 기록
     else:
         print(message)
 
+# Log/Results 창에 유지할 최대 줄 수 (나머지는 파일에서 페이지 단위로 조회)
+LOG_MAX_LINES = 5000
+# 스트리밍 응답에서 결과창으로 한 번에 넘길 항목 수
+STREAM_BATCH_SIZE = 200
+
 # Action List to store user-defined actions
 action_list = []
 log_text = None  # 초기화
+log_view = None  # log_text에 붙는 BoundedTextView (GUI 생성 후 초기화)
+crawl_runner = None  # GUI 생성 후 초기화
+plan_executor = None  # GUI 생성 후 초기화
+loaded_plan = None  # Load Plan으로 불러온 실행 계획
 if log_text:
     safe_log("Message here.\n")
 
@@ -41,43 +74,21 @@ def extract_class_name(input_text):
         return None
 
 # Scroll and Load Function
-def scroll_to_load(driver, xpath=None, class_name=None, start_idx=0, end_idx=None):
+def scroll_to_load(driver, xpath=None, class_name=None, start_idx=0, end_idx=None, max_wait=3):
     """
-    Scrolls until the required number of elements are loaded or no more content is available.
+    Scrolls until the required number of elements are loaded or no more content is available,
+    yielding the text of newly loaded items (within [start_idx:end_idx]) in batches as they appear.
     """
+    collected = 0
     try:
-        prev_height = driver.execute_script("return document.body.scrollHeight")
-        collected_data = []
-
-        while True:
-            # Scroll to the bottom of the page
-            driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-
-            # Wait for the page height to change
-            WebDriverWait(driver, 10).until(
-                lambda d: d.execute_script("return document.body.scrollHeight") > prev_height
-            )
-            prev_height = driver.execute_script("return document.body.scrollHeight")
-
-            # Collect elements
-            elements = []
-            if xpath:
-                elements = driver.find_elements(By.XPATH, xpath)
-            elif class_name:
-                elements = driver.find_elements(By.CLASS_NAME, class_name)
-
-            if end_idx and len(elements) >= end_idx:
-                collected_data = elements[start_idx:end_idx]
-                break
-
-            safe_log(f"Collected {len(elements)} items so far.")
-
-        safe_log(f"Completed scrolling. Collected {len(collected_data)} items.")
-        return collected_data
-
+        for batch in iter_scroll_items(driver, xpath=xpath, class_name=class_name, start_idx=start_idx,
+                                       end_idx=end_idx or None, max_wait=max_wait):
+            collected += len(batch)
+            safe_log(f"Collected {collected} items so far.")
+            yield batch
     except Exception as e:
         safe_log(f"Error during scrolling: {str(e)}")
-        return []
+    safe_log(f"Completed scrolling. Collected {collected} items.")
 
 # Handle Element Actions
 def handle_element_actions(driver, action_xpath=None, action_class_name=None, action_type="click"):
@@ -103,16 +114,12 @@ def handle_element_actions(driver, action_xpath=None, action_class_name=None, ac
 def hide_elements(driver, class_name=None, xpath=None):
     try:
         if class_name:
-            elements = driver.find_elements(By.CLASS_NAME, class_name)
-            for element in elements:
-                driver.execute_script("arguments[0].style.display = 'none';", element)
-            safe_log(f"Hid elements with class name: {class_name}")
+            count = bulk_hide(driver, class_name=class_name)
+            safe_log(f"Hid {count} elements with class name: {class_name}")
 
         if xpath:
-            elements = driver.find_elements(By.XPATH, xpath)
-            for element in elements:
-                driver.execute_script("arguments[0].style.display = 'none';", element)
-            safe_log(f"Hid elements with XPath: {xpath}")
+            count = bulk_hide(driver, xpath=xpath)
+            safe_log(f"Hid {count} elements with XPath: {xpath}")
 
     except Exception as e:
         safe_log(f"Error hiding elements: {str(e)}")
@@ -123,13 +130,15 @@ def selenium_crawling(driver, xpath=None, class_name=None, start_idx=0, end_idx=
     Crawls the page and collects data until the required number of elements are loaded.
     """
     try:
-        elements = scroll_to_load(driver, xpath=xpath, class_name=class_name, start_idx=start_idx, end_idx=end_idx)
+        # 스크롤할 때마다 새로 붙은 항목만 읽어 온다
+        collected_data = []
+        for batch in scroll_to_load(driver, xpath=xpath, class_name=class_name, start_idx=start_idx, end_idx=end_idx):
+            collected_data.extend(batch)
 
-        if not elements:
+        if not collected_data:
             safe_log("No elements found for crawling.")
             return []
 
-        collected_data = [element.text for element in elements]
         safe_log(f"Collected {len(collected_data)} items.")
         return collected_data
 
@@ -156,23 +165,9 @@ def call_api(method, url, headers=None, payload=None):
     """
     try:
         method = method.upper()  # 메서드 이름 대문자로 변환
-        if method == "GET":
-            response = requests.get(url, headers=headers, params=payload)
-        elif method == "POST":
-            response = requests.post(url, headers=headers, json=payload)
-        elif method == "PUT":
-            response = requests.put(url, headers=headers, json=payload)
-        elif method == "PATCH":
-            response = requests.patch(url, headers=headers, json=payload)
-        elif method == "DELETE":
-            response = requests.delete(url, headers=headers, json=payload)
-        elif method == "OPTIONS":
-            response = requests.options(url, headers=headers)
-        elif method == "HEAD":
-            response = requests.head(url, headers=headers)
-        else:
-            raise ValueError(f"지원되지 않는 HTTP 메서드입니다: {method}")
-        
+        # 연결 재사용, timeout, 429/5xx 재시도는 http_engine이 처리
+        response = http_engine.request(method, url, headers=headers, payload=payload)
+
         # 응답 상태 코드 확인
         response.raise_for_status()
 
@@ -204,24 +199,72 @@ def call_api(method, url, headers=None, payload=None):
 
     return None
 
-# 5. flatten_dict 개선
-def flatten_dict(d, parent_key='', sep='.'):
+
+def call_api_stream(method, url, headers=None, payload=None, key_path="", chunk_size=65536):
+    """
+    call_api와 같은 요청을 보내되, 응답 본문을 조각 단위로 읽으면서
+    key_path에 해당하는 값을 도착하는 대로 하나씩 돌려주는 제너레이터.
+    응답 전체를 메모리에 올리지 않으므로 큰 목록 응답에 사용한다.
+
+    결과는 call_api + extract_by_key_path와 같다. 스트리밍할 수 없는 key_path(빈 경로 등)면 일반 요청으로 처리한다.
+    정확한 경로로 아무것도 찾지 못했으면(포함 검색이 필요) 요청을 다시 보내지 않고, 받아 둔 본문으로 extract_by_key_path를 실행한다.
+    본문은 첫 값이 나올 때까지만 보관하므로, 경로를 찾은 응답은 전체를 메모리에 올리지 않는다.
+    """
+    if not is_streamable(key_path):
+        response = call_api(method, url, headers=headers, payload=payload)
+        if response:
+            yield from extract_by_key_path(response, key_path)
+        return
+
+    count = 0
+    state = {"received": []}  # 첫 값이 나오기 전까지 받은 조각 (값이 나오면 None으로 바꿔 더 보관하지 않는다)
+
+    def chunks(response):
+        for chunk in response.iter_content(chunk_size):
+            if state["received"] is not None:
+                state["received"].append(chunk)
+            yield chunk
+
     try:
-        items = []
-        for k, v in d.items():
-            new_key = f"{parent_key}{sep}{k}" if parent_key else k
-            if isinstance(v, dict):
-                items.extend(flatten_dict(v, new_key, sep=sep).items())
-            elif isinstance(v, list):
-                for i, item in enumerate(v):
-                    items.extend(flatten_dict(item, f"{new_key}[{i}]", sep=sep).items())
-            else:
-                items.append((new_key, v))
-        return dict(items)
-    except Exception as e:
-        if log_text:
-            safe_log(f"Flatten error: {str(e)}\n")
-        return {}
+        with http_engine.request(method, url, headers=headers, payload=payload, stream=True) as response:
+            response.raise_for_status()
+            for value in iter_key_path_leaves(chunks(response), key_path):
+                state["received"] = None
+                count += 1
+                yield value
+    except requests.exceptions.HTTPError as http_err:
+        safe_log(f"HTTP error occurred: {http_err}")
+        return
+    except requests.exceptions.ConnectionError as conn_err:
+        safe_log(f"Connection error occurred: {conn_err}")
+        return
+    except requests.exceptions.Timeout as timeout_err:
+        safe_log(f"Timeout error occurred: {timeout_err}")
+        return
+    except requests.exceptions.RequestException as req_err:
+        safe_log(f"General API error occurred: {req_err}")
+        return
+    except ValueError as e:
+        safe_log(f"Invalid JSON in streamed response: {e}")
+        return
+
+    if not count:
+        try:
+            document = json.loads(b"".join(state["received"]))
+        except ValueError as e:
+            safe_log(f"Invalid JSON in streamed response: {e}")
+            return
+        yield from extract_by_key_path(document, key_path)
+
+
+def call_api_many(calls):
+    """
+    여러 call_api 요청을 http_engine으로 동시에 보내고 응답을 입력 순서대로 반환한다.
+
+    Parameters:
+        calls (list): call_api 키워드 인자 dict 목록 (method, url, headers, payload)
+    """
+    return http_engine.fan_out(call_api, calls)
 
 # Function to extract URLs from API response
 def extract_urls_from_response(response, key_path):
@@ -297,6 +340,11 @@ def add_action():
     request_method = request_method_var.get()  # 선택된 요청 메서드
     pagination_size = int(pagination_size_entry.get().strip() or 30)
     key_path = key_path_entry.get().strip()
+    stream = stream_var.get()  # 응답을 스트리밍으로 읽을지 여부
+    navigation = navigation_var.get()  # 인덱스 범위 click의 탐색 전략
+    pagination = pagination_mode_var.get()  # none / page / offset / cursor
+    cursor_path = cursor_path_entry.get().strip()
+    max_items = int(max_items_entry.get().strip() or 0) or None
 
     if target_class:
         target_class = extract_class_name(target_class)
@@ -313,6 +361,11 @@ def add_action():
         "request_method": request_method,  # 요청 메서드 추가
         "pagination_size": pagination_size,  # 페이지 크기 추가
         "key_path": key_path,  # Key Path 추가
+        "stream": stream,
+        "navigation": navigation,
+        "pagination": pagination,
+        "cursor_path": cursor_path,  # cursor 모드: 마지막 항목에서 다음 커서를 꺼낼 경로
+        "max_items": max_items,  # 수집할 최대 항목 수 (None이면 끝까지)
     }
     if target_xpath:
         action["target"] = {"xpath": target_xpath}
@@ -323,7 +376,7 @@ def add_action():
         return
 
     action_list.append(action)
-    action_log_text.insert(tk.END, f"Action added: {action}\n")
+    action_log_text.insert(tk.END, f"Action added: {json.dumps(action, ensure_ascii=False)}\n")
 
 # Synchronize Action List from Log
 def sync_action_list_from_log():
@@ -341,30 +394,46 @@ def sync_action_list_from_log():
             safe_log(f"Sync error: {str(e)}\n")
 
 
-# Function to recursively iterate over all combinations of indices for any website
-def perform_action_for_combinations(driver, action, start_idx_sets, end_idx_sets, current_indices=None, delay=1):
-    if current_indices is None:
-        current_indices = []
+# Function to iterate over all combinations of indices for any website
+def perform_action_for_combinations(driver, action, start_idx_sets, end_idx_sets, current_indices=None, delay=1,
+                                    on_page=None):
+    """
+    인덱스 범위의 모든 조합에 대해 액션을 수행한다.
+    click은 목록 페이지를 조합마다 다시 로드하지 않도록 action["navigation"] 전략(기본값: tab)으로 한 번에 처리하고,
+    목록 페이지 로드 수 등 탐색 통계를 반환한다.
 
-    # Base case: If the current_indices has reached the number of dimensions, perform the action
-    if len(current_indices) == len(start_idx_sets):
-        safe_log(f"Performing action for combination: {current_indices}\n")
-        perform_action(driver, current_indices, action, delay)
-        return
+    :param on_page: click으로 연 대상 페이지에서 호출할 함수 on_page(driver, indices)
+    """
+    prefix = list(current_indices or [])
+    ranges = [range(start, end + 1) for start, end in zip(start_idx_sets[len(prefix):], end_idx_sets[len(prefix):])]
+    combinations = [prefix + list(rest) for rest in itertools.product(*ranges)]
+    template = action.get("xpath_template") or DEFAULT_XPATH_TEMPLATE
+
+    if action['type'] != 'click':
+        for indices in combinations:
+            perform_action(driver, indices, action, delay, template)
+        return None
 
-    # Recursive case: Loop through the current dimension's range
-    current_dim = len(current_indices)
-    for idx in range(start_idx_sets[current_dim], end_idx_sets[current_dim] + 1):
-        # Append the current index and recurse for the next dimension
-        perform_action_for_combinations(driver, action, start_idx_sets, end_idx_sets,
-                                         current_indices + [idx], delay)
+    def visit(page_driver, indices):
+        safe_log(f"Performing action for combination: {indices}\n")
+        if on_page:
+            on_page(page_driver, indices)
+        time.sleep(delay)
+
+    targets = [(indices, create_dynamic_xpath(indices, template)) for indices in combinations]
+    strategy = action.get("navigation", "tab")
+    sweep = NavigationSweep(driver, strategy, pool=driver_pool if strategy == "hrefs" else None,
+                            log=lambda message: safe_log(f"{message}\n"), propagate=(CrawlCancelled,))
+    stats = sweep.run(targets, visit)
+    safe_log(f"Sweep of {len(targets)} targets ({strategy}): {stats}\n")
+    return stats
 
 
 # General action function that can handle clicking, crawling, or other actions
-def perform_action(driver, indices, action, delay=1):
+def perform_action(driver, indices, action, delay=1, template=None):
     try:
         # Create a dynamic XPath or class name based on the current indices
-        xpath = create_dynamic_xpath(indices)  # Example: dynamically create XPath based on indices
+        xpath = create_dynamic_xpath(indices, template or DEFAULT_XPATH_TEMPLATE)
 
         # Perform the action (click, crawl, etc.)
         if action['type'] == 'click':
@@ -378,12 +447,18 @@ def perform_action(driver, indices, action, delay=1):
         safe_log(f"Error performing action for {indices}: {str(e)}\n")
 
 
+DEFAULT_XPATH_TEMPLATE = "//div[@class='item-class'][{0}][{1}]"
+
+
 # Function to create a dynamic XPath based on indices
-def create_dynamic_xpath(indices, template="//div[@class='item-class'][{0}][{1}]"):
+def create_dynamic_xpath(indices, template=DEFAULT_XPATH_TEMPLATE):
+    if "{" not in template:
+        # 자리표시자가 없으면 일치하는 요소 중 n번째 (start/end index와 같이 0부터 셈)
+        return f"({template})[{indices[0] + 1}]"
     return template.format(*indices)
 
 # Function to click an element given the dynamic XPath
-def click_element(driver, xpath, delay):
+def click_element(driver, xpath, delay, reload_url=None):
     element = WebDriverWait(driver, 10).until(
         EC.element_to_be_clickable((By.XPATH, xpath))
     )
@@ -395,27 +470,25 @@ def click_element(driver, xpath, delay):
     WebDriverWait(driver, 10).until(EC.presence_of_element_located((By.TAG_NAME, "body")))
 
     # Reload the main page to get the updated list
-    reload_main_page(driver)
+    reload_main_page(driver, url=reload_url)
 
 
 # Function to crawl data from an element given the dynamic XPath
 def crawl_data(driver, xpath, action, delay):
     try:
-        elements = driver.find_elements(By.XPATH, xpath)
-        collected_data = []
-        for element in elements:
-            collected_data.append(element.text)
-        
+        collected_data = bulk_text(driver, xpath=xpath)
+
         safe_log(f"Collected data: {collected_data}\n")
     except Exception as e:
         safe_log(f"Error collecting data from {xpath}: {str(e)}\n")
 
 # Reload the main page using the URL input after each action
-def reload_main_page(driver, class_name):
+def reload_main_page(driver, class_name=None, url=None):
     try:
-        url = url_entry.get()  # URL 입력값 가져오기
+        url = url or url_entry.get()  # URL 입력값 가져오기
         driver.get(url)
-        WebDriverWait(driver, 10).until(EC.presence_of_element_located((By.CLASS_NAME, class_name)))
+        locator = (By.CLASS_NAME, class_name) if class_name else (By.TAG_NAME, "body")
+        WebDriverWait(driver, 10).until(EC.presence_of_element_located(locator))
         safe_log("Main page reloaded successfully.")
     except Exception as e:
         safe_log(f"Error reloading main page: {str(e)}")
@@ -431,140 +504,229 @@ def execute_crawling(headers, payload, api_url, key_path, actions):
             print("No URLs found.")
             return
 
-        # Step 2: Initiate WebDriver
-        driver = webdriver.Chrome(service=Service(ChromeDriverManager(cache_valid_range=7).install()))
-
-        # Step 3: Loop through URLs and execute actions
-        for url in urls:
-            driver.get(url)
-            time.sleep(2)  # Allow page to load
-
-            for action in actions:
-                if action["type"] == "click":
-                    handle_click(
-                        driver,
-                        xpath=action.get("target", {}).get("xpath"),
-                        class_name=action.get("target", {}).get("class_name"),
-                        delay=action.get("delay", 1),
-                    )
-                elif action["type"] == "click-list":
-                    nested_urls = extract_urls_from_response(driver.page_source, action["url_key"])
-                    handle_click_list(driver, nested_urls, action.get("actions", []), delay=1)
+        # Step 2: Lease a warm WebDriver from the pool
+        with driver_pool.lease() as driver:
+            # Step 3: Loop through URLs and execute actions
+            for url in urls:
+                driver_pool.get(driver, url)
+                time.sleep(2)  # Allow page to load
+
+                for action in actions:
+                    if action["type"] == "click":
+                        handle_click(
+                            driver,
+                            xpath=action.get("target", {}).get("xpath"),
+                            class_name=action.get("target", {}).get("class_name"),
+                            delay=action.get("delay", 1),
+                        )
+                    elif action["type"] == "click-list":
+                        nested_urls = extract_urls_from_response(driver.page_source, action["url_key"])
+                        handle_click_list(driver, nested_urls, action.get("actions", []), delay=1)
 
         print("Crawling completed.")
+        print(f"Driver pool: {driver_pool.metrics()}")
 
     except Exception as e:
         print(f"Error in execute_crawling: {e}")
-    finally:
-        if 'driver' in locals():
-            driver.quit()
 
-def flatten_dict(d, parent_key='', sep='.'):
+def execute_crawling_with_actions():
     """
-    Flattens a nested dictionary into a single dictionary with dot-separated keys.
-    
-    Parameters:
-        d (dict): The original dictionary to flatten.
-        parent_key (str): The base key to prepend (used for recursion).
-        sep (str): Separator for nested keys.
-    
-    Returns:
-        dict: A flattened dictionary.
+    Executes the actions defined in the action list with Pagination, Key Path, and Request Method.
+    The crawl runs on a background thread so the window stays responsive; logs and results are
+    streamed back to the widgets in batches.
     """
-    try:
-        items = []
-        for k, v in d.items():
-            new_key = f"{parent_key}{sep}{k}" if parent_key else k
-            if isinstance(v, dict):
-                items.extend(flatten_dict(v, new_key, sep=sep).items())
-            elif isinstance(v, list):
-                if len(v) > 0:
-                    for i, item in enumerate(v):
-                        if isinstance(item, (dict, list)):
-                            items.extend(flatten_dict(item, f"{new_key}[{i}]", sep=sep).items())
-                        else:
-                            items.append((f"{new_key}[{i}]", item))
-                else:
-                    items.append((new_key, []))  # Handle empty list
-            else:
-                items.append((new_key, v))
-        return dict(items)
-    except Exception as e:
-        safe_log(f"Flatten error: {str(e)}")
-        return {}
+    url = url_entry.get()
+    if not url:
+        messagebox.showerror("Input Error", "URL is required.")
+        return
+    if crawl_runner.running:
+        messagebox.showerror("Busy", "A crawl is already running.")
+        return
 
+    # 실행 도중 액션 목록이 바뀌어도 영향을 받지 않도록 복사본 사용
+    actions = [dict(action) for action in action_list]
+    # 불러온 계획을 그대로 실행하고 있다면 저장된 단계를 사용, 아니면 새로 컴파일
+    plan = loaded_plan if loaded_plan and loaded_plan.actions == actions else None
+    crawl_runner.start(run_actions, url, actions, plan)
 
-def execute_crawling_with_actions():
+
+def _api_call_args(url, action):
+    """crawl 액션 하나를 call_api 키워드 인자로 변환"""
+    return {
+        "method": action.get("request_method", "GET"),
+        "url": url,
+        "headers": {},  # Add any headers if needed
+        "payload": {"page_size": action.get("pagination_size", 30)},  # Example payload with Pagination
+    }
+
+
+def crawl_paginated(url, action):
     """
-    Executes the actions defined in the action list with Pagination, Key Path, and Request Method.
+    crawl 액션의 pagination 설정에 따라 API를 여러 페이지 요청하면서,
+    페이지마다 key_path 항목을 결과창으로 바로 넘긴다. 다음 페이지는 미리 요청해 둔다.
+    """
+    args = _api_call_args(url, action)
+    payload = args.pop("payload")
+
+    def fetch(page_payload):
+        return call_api(payload=page_payload, **args)
+
+    count = pages = 0
+    for items in iter_pages(
+        fetch,
+        action.get("key_path", ""),
+        mode=action["pagination"],
+        page_size=action.get("pagination_size", 30),
+        base_payload=payload,
+        cursor_path=action.get("cursor_path") or "id",
+        max_items=action.get("max_items"),
+        submit=http_engine.submit,
+    ):
+        crawl_runner.checkpoint()
+        crawl_runner.emit(*items)
+        count += len(items)
+        pages += 1
+        crawl_runner.progress("pagination", f"{pages} pages, {count} items")
+    safe_log(f"Paginated crawl finished: {pages} pages, {count} items.\n" if count else "No data found.\n")
+
+
+def crawl_streamed(url, action):
+    """응답을 다 받기 전에 key_path 항목이 완성되는 대로 묶어서 결과창에 반영"""
+    batch, count = [], 0
+    for item in call_api_stream(**_api_call_args(url, action), key_path=action.get("key_path", "")):
+        batch.append(item)
+        if len(batch) >= STREAM_BATCH_SIZE:
+            crawl_runner.checkpoint()
+            crawl_runner.emit(*batch)
+            count += len(batch)
+            batch = []
+    if batch:
+        crawl_runner.emit(*batch)
+        count += len(batch)
+    safe_log(f"Streamed {count} items.\n" if count else "No data found.\n")
+
+
+def run_crawl_step(driver, step, url):
     """
+    계획의 crawl 단계: 묶인 crawl 액션들을 실행한다 (브라우저 세션 불필요).
+    일반 요청은 한 번에 동시에 보내고, 페이지네이션/스트리밍 요청은 각각 처리한다.
+    """
+    plain = [a for a in step["actions"] if not a.get("stream") and a.get("pagination", "none") == "none"]
+    responses = call_api_many([_api_call_args(url, action) for action in plain])
+    if len(plain) > 1:
+        safe_log(f"Fetched {len(plain)} crawl requests concurrently.\n")
+    for action, response in zip(plain, responses):
+        if response:
+            # Key Path에 해당하는 데이터 추출 (전체를 평탄화하지 않고 경로를 따라 선택)
+            crawl_runner.emit(*extract_by_key_path(response, action.get("key_path", "")))
+        else:
+            safe_log("No data found.\n")
+
+    for action in step["actions"]:
+        crawl_runner.checkpoint()
+        if action.get("pagination", "none") != "none":
+            crawl_paginated(url, action)
+        elif action.get("stream"):
+            crawl_streamed(url, action)
+
+
+def run_sweep_step(driver, step, url):
+    """계획의 sweep 단계: 인덱스 범위의 대상들을 navigation 전략으로 차례로 열고, 열린 페이지마다 단계의 body를 실행한다"""
+    target = step.get("target", {})
+    template = target.get("xpath")
+    if not template and target.get("class_name"):
+        template = f"//*[contains(concat(' ', normalize-space(@class), ' '), ' {target['class_name']} ')]"
+    action = {"type": "click", "xpath_template": template, "navigation": step.get("navigation", "tab")}
+    body = step.get("body") or []
+
+    def on_page(page_driver, indices):
+        plan_executor.run_on_page(page_driver, body, page_driver.current_url, f"sweep s{step['id']} {indices}")
+
+    perform_action_for_combinations(driver, action, step["start_idx"], step["end_idx"], delay=step.get("delay", 0),
+                                    on_page=on_page if any(sub["op"] != "load" for sub in body) else None)
+
+
+def run_element_step(driver, step, url):
+    """계획의 click/hover 단계"""
+    target = step.get("target", {})
+    handle_element_actions(
+        driver,
+        action_xpath=target.get("xpath"),
+        action_class_name=target.get("class_name"),
+        action_type=step["op"],
+    )
+    time.sleep(step.get("delay", 0))
+
+
+def run_actions(url, actions, plan=None):
+    """
+    Worker-thread body of execute_crawling_with_actions.
+    액션 목록을 실행 계획으로 컴파일해서 실행하고, 단계별 소요 시간을 로그에 남긴다.
+    """
+    plan = plan or compile_plan(url, actions)
+    safe_log(f"Action plan:\n{plan.describe()}\n")
+
+    plan_executor.run(plan, url)
+
+    safe_log("All actions completed.\n")
+    safe_log(f"Step timings:\n{format_timings(plan_executor.timings)}\n")
+    safe_log(f"Driver pool: {driver_pool.metrics()}\n")
+    safe_log(f"HTTP engine: {http_engine.metrics()}\n")
+
+
+def save_plan():
+    path = filedialog.asksaveasfilename(defaultextension=".json", filetypes=[("Action plan", "*.json")])
+    if not path:
+        return
+    compile_plan(url_entry.get().strip(), action_list).save(path)
+    safe_log(f"Action plan saved: {path}\n")
+
+
+def load_plan():
+    global action_list, loaded_plan
+    path = filedialog.askopenfilename(filetypes=[("Action plan", "*.json")])
+    if not path:
+        return
     try:
-        url = url_entry.get()
-        if not url:
-            messagebox.showerror("Input Error", "URL is required.")
-            return
+        loaded_plan = ActionPlan.load(path)
+    except (OSError, ValueError, KeyError) as e:
+        messagebox.showerror("Error", f"Could not load plan: {e}")
+        return
 
-        driver = webdriver.Chrome(service=Service(ChromeDriverManager(cache_valid_range=7).install()))
-        driver.get(url)
-        safe_log(f"URL loaded: Waiting for the page to load...\n")
+    action_list = [dict(action) for action in loaded_plan.actions]
+    action_log_text.delete("1.0", tk.END)
+    for action in action_list:
+        action_log_text.insert(tk.END, f"Action added: {json.dumps(action, ensure_ascii=False)}\n")
+    if loaded_plan.url and not url_entry.get().strip():
+        url_entry.insert(0, loaded_plan.url)
+    safe_log(f"Action plan loaded: {path}\n{loaded_plan.describe()}\n")
 
-        # Explicit wait for the page to load
-        try:
-            WebDriverWait(driver, 10).until(EC.presence_of_element_located((By.TAG_NAME, "body")))
-            safe_log("Page load complete.\n")
-        except Exception as e:
-            safe_log(f"Error waiting for page load: {str(e)}\n")
-            return
 
-        # Execute each action in the action list
-        for action in action_list:
-            action_type = action.get("type")
-            target = action.get("target", {})
-            delay = action.get("delay", 1)
-
-            # 추가된 필드 가져오기
-            request_method = action.get("request_method", "GET")
-            pagination_size = action.get("pagination_size", 30)
-            key_path = action.get("key_path", "")
-
-            safe_log(f"Executing action: {action}\n")
-
-            try:
-                if action_type == "crawl":
-                    # API 호출에 추가된 필드 반영
-                    headers = {}  # Add any headers if needed
-                    payload = {"page_size": pagination_size}  # Example payload with Pagination
-                    response = call_api(request_method, url, headers=headers, payload=payload)
-                    if response:
-                        # 평탄화된 딕셔너리 생성
-                        flattened_data = flatten_dict(response)
-                        # Key Path에 해당하는 데이터 추출
-                        results = [v for k, v in flattened_data.items() if key_path in k]
-                        results_text.insert(tk.END, "\n".join(map(str, results)) + "\n")
-                    else:
-                        safe_log("No data found.\n")
-
-                elif action_type in ["click", "hover"]:
-                    handle_element_actions(
-                        driver,
-                        action_xpath=target.get("xpath"),
-                        action_class_name=target.get("class_name"),
-                        delay=delay,
-                        action_type=action_type,
-                    )
+def append_results(results):
+    results_view.append("\n".join(map(str, results)))
 
-            except Exception as e:
-                safe_log(f"Error executing action {action}: {str(e)}\n")
-                continue
 
-        safe_log("All actions completed.\n")
+def append_log(text):
+    log_view.append(text)
 
-    except Exception as e:
-        messagebox.showerror("Error", f"Error occurred: {str(e)}")
 
-    finally:
-        if driver:
-            driver.quit()
+def crawl_finished(status, message):
+    pause_button.config(text="Pause")
+    if status == "cancelled":
+        append_log("Crawl cancelled.")
+    elif status == "error":
+        messagebox.showerror("Error", f"Error occurred: {message}")
+
+
+def toggle_pause():
+    if not crawl_runner.running:
+        return
+    if crawl_runner.paused:
+        crawl_runner.resume()
+        pause_button.config(text="Pause")
+    else:
+        crawl_runner.pause()
+        pause_button.config(text="Resume")
 
 
 # GUI Setup
@@ -611,6 +773,11 @@ delay_entry = tk.Entry(action_frame, width=10)
 delay_entry.insert(0, "1")
 delay_entry.grid(row=3, column=1, pady=5)
 
+# Start/End Index가 있는 click은 목록의 대상들을 차례로 여는데, 목록 페이지를 매번 다시 로드하지 않도록 탐색 방식을 고른다
+tk.Label(action_frame, text="Navigation:", font=("Arial", 10)).grid(row=3, column=2, sticky="w")
+navigation_var = tk.StringVar(value="tab")
+tk.OptionMenu(action_frame, navigation_var, *NAVIGATION_STRATEGIES).grid(row=3, column=3, pady=5)
+
 # Start and End Index
 tk.Label(action_frame, text="Start Index:", font=("Arial", 10)).grid(row=4, column=0, sticky="w")
 start_idx_entry = tk.Entry(action_frame, width=10)
@@ -627,15 +794,31 @@ request_method_dropdown = tk.OptionMenu(action_frame, request_method_var,
                                          "GET", "POST", "PUT", "PATCH", "DELETE", "OPTIONS", "HEAD")
 request_method_dropdown.grid(row=6, column=1, pady=5)
 
+tk.Label(action_frame, text="Pagination:", font=("Arial", 10)).grid(row=6, column=2, sticky="w")
+pagination_mode_var = tk.StringVar(value="none")
+tk.OptionMenu(action_frame, pagination_mode_var, *PAGINATION_MODES).grid(row=6, column=3, pady=5)
+
+tk.Label(action_frame, text="Cursor Path:", font=("Arial", 10)).grid(row=5, column=0, sticky="w")
+cursor_path_entry = tk.Entry(action_frame, width=50)  # 예: commentid
+cursor_path_entry.grid(row=5, column=1, columnspan=3, pady=5)
+
 tk.Label(action_frame, text="Pagination Size:", font=("Arial", 10)).grid(row=7, column=0, sticky="w")
 pagination_size_entry = tk.Entry(action_frame, width=10)  # Pagination Size 입력 필드
 pagination_size_entry.insert(0, "30")
 pagination_size_entry.grid(row=7, column=1, pady=5)
 
+tk.Label(action_frame, text="Max Items:", font=("Arial", 10)).grid(row=7, column=2, sticky="w")
+max_items_entry = tk.Entry(action_frame, width=10)  # 비워두면 끝까지
+max_items_entry.grid(row=7, column=3, pady=5)
+
 tk.Label(action_frame, text="Key Path:", font=("Arial", 10)).grid(row=8, column=0, sticky="w")
 key_path_entry = tk.Entry(action_frame, width=50)  # JSON Key Path 입력 필드
 key_path_entry.grid(row=8, column=1, columnspan=3, pady=5)
 
+# 큰 목록 응답은 전체를 받기 전에 key_path 항목을 하나씩 꺼내 처리
+stream_var = tk.BooleanVar(value=False)
+tk.Checkbutton(action_frame, text="Stream response", variable=stream_var).grid(row=9, column=1, sticky="w")
+
 
 # Action Log Section
 action_log_frame = tk.LabelFrame(root, text="Action Log", padx=10, pady=10)
@@ -652,6 +835,10 @@ log_frame.columnconfigure(0, weight=1)  # 프레임 내부 요소 조정
 log_text = scrolledtext.ScrolledText(log_frame, height=25, width=70)
 log_text.grid(row=0, column=0, padx=10, pady=5, sticky="nsew")
 
+# 화면에는 최근 줄만 유지하고 전체 로그는 파일로 보관
+log_view = BoundedTextView(log_text, max_lines=LOG_MAX_LINES, spill_path="crawl_log.txt")
+add_pager_buttons(log_frame, log_view).grid(row=1, column=0, pady=5)
+
 # Results Section
 results_frame = tk.LabelFrame(root, text="Results", padx=10, pady=10)
 results_frame.grid(row=0, column=2, rowspan=2, padx=10, pady=5, sticky="nsew")
@@ -660,6 +847,9 @@ results_frame.columnconfigure(0, weight=1)  # 프레임 내부 요소 조정
 results_text = scrolledtext.ScrolledText(results_frame, height=25, width=70)
 results_text.grid(row=0, column=0, padx=10, pady=5, sticky="nsew")
 
+results_view = BoundedTextView(results_text, max_lines=LOG_MAX_LINES, spill_path="crawl_results.txt")
+add_pager_buttons(results_frame, results_view).grid(row=1, column=0, pady=5)
+
 # Buttons
 add_action_button = tk.Button(action_frame, text="Add Action", command=add_action, bg="green", fg="white", width=15)
 add_action_button.grid(row=9, column=0, padx=10, pady=5)
@@ -672,7 +862,7 @@ clear_log_button = tk.Button(
     text="Clear Log",
     command=lambda: [
         action_log_text.delete(1.0, tk.END),
-        log_text.delete(1.0, tk.END) if log_text else None,  # log_text가 초기화 가능한지 체크 후 삭제
+        log_view.clear() if log_view else None,  # log_text가 초기화 가능한지 체크 후 삭제
         safe_log("Logs have been cleared.")  # 로그 초기화 메시지 추가
     ],
     bg="red",
@@ -684,6 +874,30 @@ clear_log_button.grid(row=1, column=2, padx=10, pady=10, sticky="ew")  # 로그
 execute_button = tk.Button(action_log_frame, text="Execute Crawling", command=execute_crawling_with_actions, bg="blue", fg="white", width=15)
 execute_button.grid(row=1, column=0, padx=10, pady=10, sticky="ew")  # 실행 버튼을 첫 번째로 배치
 
+pause_button = tk.Button(action_log_frame, text="Pause", command=toggle_pause, bg="gray", fg="white", width=15)
+pause_button.grid(row=2, column=0, padx=10, pady=5, sticky="ew")
+
+cancel_button = tk.Button(action_log_frame, text="Cancel", command=lambda: crawl_runner.cancel(), bg="black", fg="white", width=15)
+cancel_button.grid(row=2, column=1, padx=10, pady=5, sticky="ew")
+
+save_plan_button = tk.Button(action_log_frame, text="Save Plan", command=save_plan, width=15)
+save_plan_button.grid(row=3, column=0, padx=10, pady=5, sticky="ew")
+
+load_plan_button = tk.Button(action_log_frame, text="Load Plan", command=load_plan, width=15)
+load_plan_button.grid(row=3, column=1, padx=10, pady=5, sticky="ew")
+
+# 크롤링은 백그라운드 스레드에서 실행하고, 로그/결과는 root.after로 묶어서 반영
+crawl_runner = CrawlRunner(root, on_log=append_log, on_results=append_results, on_done=crawl_finished)
+
+# 액션 목록을 계획으로 컴파일해 실행하는 엔진 (click/hover/crawl 동작은 이 화면의 함수 사용)
+plan_executor = PlanExecutor(
+    driver_pool,
+    handlers={"click": run_element_step, "hover": run_element_step, "sweep": run_sweep_step, "crawl": run_crawl_step},
+    checkpoint=lambda: crawl_runner.checkpoint(),
+    log=safe_log,
+    propagate=(CrawlCancelled,),
+)
+
 # Adjust dynamic dimensions
 root.columnconfigure(0, weight=1)  # Action Settings 크기 고정
 root.columnconfigure(1, weight=1)  # Log 크기 고정
@@ -697,4 +911,8 @@ initial_height = action_frame.winfo_reqheight() + log_frame.winfo_reqheight() +
 root.geometry(f"{initial_width}x{initial_height}")
 
 # Start GUI loop
-root.mainloop()
\ No newline at end of file
+root.mainloop()
+driver_pool.close()
+http_engine.close()
+log_view.close()
+results_view.close()
\ No newline at end of file
@@ -0,0 +1,151 @@
+import tkinter as tk
+from collections import deque
+
+
+class BoundedTextView:
+    """
+    Text/ScrolledText 위젯에 붙이는 제한된 크기의 로그/결과 뷰어.
+
+    - 위젯에는 최근 max_lines 줄만 유지한다 (링 버퍼).
+    - append()는 바로 위젯에 쓰지 않고 모아뒀다가 flush_ms마다 한 번에 삽입한다.
+    - spill_path를 주면 모든 줄을 파일에도 기록하고, page()/show_page()로 지난 내용을 페이지 단위로 다시 볼 수 있다.
+
+    UI 스레드에서만 호출해야 한다 (작업 스레드는 CrawlRunner를 통해 전달).
+    """
+
+    def __init__(self, widget, max_lines=5000, spill_path=None, flush_ms=200, page_size=None):
+        self.widget = widget
+        self.max_lines = max_lines
+        self.flush_ms = flush_ms
+        self.page_size = page_size or max_lines
+        self.live = True  # False면 과거 페이지를 보는 중 (새 줄은 버퍼에만 쌓임)
+        self.current_page = None
+        self._recent = deque(maxlen=max_lines)
+        self._pending = []
+        self._widget_lines = 0
+        self._flush_scheduled = False
+        self._total_lines = 0
+        self._page_offsets = []  # 페이지 시작 위치 (spill 파일 바이트 오프셋)
+        self._spill = open(spill_path, "w+b") if spill_path else None
+
+    @property
+    def total_lines(self):
+        return self._total_lines
+
+    @property
+    def page_count(self):
+        return len(self._page_offsets)
+
+    def append(self, text):
+        for line in text.rstrip("\n").split("\n"):
+            if self._spill:
+                if self._total_lines % self.page_size == 0:
+                    self._page_offsets.append(self._spill.seek(0, 2))
+                self._spill.write(line.encode("utf-8") + b"\n")
+            self._total_lines += 1
+            self._recent.append(line)
+            self._pending.append(line)
+
+        # 메시지마다 위젯을 갱신하지 않고 flush_ms 간격으로 모아서 반영
+        if not self._flush_scheduled:
+            self._flush_scheduled = True
+            self.widget.after(self.flush_ms, self._flush)
+
+    def _flush(self):
+        self._flush_scheduled = False
+        if self._spill:
+            self._spill.flush()
+        if not self.live or not self._pending:
+            self._pending = []
+            return
+
+        lines = self._pending[-self.max_lines:]
+        self._pending = []
+        self.widget.insert(tk.END, "\n".join(lines) + "\n")
+        self._widget_lines += len(lines)
+
+        excess = self._widget_lines - self.max_lines
+        if excess > 0:
+            self.widget.delete("1.0", f"{excess + 1}.0")
+            self._widget_lines -= excess
+        self.widget.see(tk.END)
+
+    def clear(self):
+        self._pending = []
+        self._recent.clear()
+        self.widget.delete("1.0", tk.END)
+        self._widget_lines = 0
+
+    def page(self, index):
+        """spill 파일에서 index 번째 페이지의 줄 목록을 읽는다."""
+        if not self._spill or not 0 <= index < len(self._page_offsets):
+            return []
+        self._spill.flush()
+        self._spill.seek(self._page_offsets[index])
+        lines = []
+        for _ in range(self.page_size):
+            raw = self._spill.readline()
+            if not raw:
+                break
+            lines.append(raw.decode("utf-8").rstrip("\n"))
+        self._spill.seek(0, 2)
+        return lines
+
+    def show_page(self, index):
+        """위젯에 과거 페이지를 표시하고 실시간 갱신을 멈춘다."""
+        if not 0 <= index < self.page_count:
+            return
+        self.live = False
+        self.current_page = index
+        lines = self.page(index)
+        self.widget.delete("1.0", tk.END)
+        self.widget.insert(tk.END, "\n".join(lines) + "\n")
+        self.widget.see("1.0")
+
+    def follow(self):
+        """실시간 모드로 돌아가 최근 max_lines 줄을 다시 표시한다."""
+        self.live = True
+        self.current_page = None
+        self._pending = []
+        self.widget.delete("1.0", tk.END)
+        self.widget.insert(tk.END, "\n".join(self._recent) + ("\n" if self._recent else ""))
+        self._widget_lines = len(self._recent)
+        self.widget.see(tk.END)
+
+    def close(self):
+        if self._spill:
+            self._spill.close()
+            self._spill = None
+
+
+def add_pager_buttons(parent, view):
+    """이전/다음 페이지, 실시간 보기 버튼이 들어있는 Frame을 만들어 반환"""
+    frame = tk.Frame(parent)
+    status = tk.Label(frame, text="Live", font=("Arial", 9))
+
+    def show(index):
+        view.show_page(index)
+        if view.current_page is not None:
+            status.config(text=f"Page {view.current_page + 1}/{view.page_count}")
+
+    def older():
+        current = view.current_page if view.current_page is not None else view.page_count
+        show(max(current - 1, 0))
+
+    def newer():
+        if view.current_page is None:
+            return
+        if view.current_page + 1 >= view.page_count:
+            live()
+        else:
+            show(view.current_page + 1)
+
+    def live():
+        view.follow()
+        status.config(text="Live")
+
+    tk.Button(frame, text="◀ Older", command=older, width=8).grid(row=0, column=0, padx=2)
+    tk.Button(frame, text="Newer ▶", command=newer, width=8).grid(row=0, column=1, padx=2)
+    tk.Button(frame, text="Live", command=live, width=8).grid(row=0, column=2, padx=2)
+    status.grid(row=0, column=3, padx=5)
+    return frame
@@ -1,35 +1,42 @@
 import tkinter as tk
 from tkinter import messagebox, scrolledtext
-from selenium import webdriver
 from selenium.webdriver.common.by import By
-from selenium.webdriver.chrome.service import Service
-from webdriver_manager.chrome import ChromeDriverManager
-import time
+from concurrent.futures import ThreadPoolExecutor
+import os
+import sys
+import threading
+import requests
+
+from crawl_runner import CrawlRunner
+from template_inference import infer_template
+
+# core/ 의 공용 크롤링 모듈 사용
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "core"))
+from crawl_wait import WaitStats, element_present, wait_until
+from driver_pool import DriverPool
+from crawl_profile import CRAWL_PROFILE
+
+# 테스트 실행과 전체 크롤링이 같은 headless Chrome 세션을 재사용하도록 풀로 관리 (가벼운 크롤링 프로필 적용)
+driver_pool = DriverPool(size=os.cpu_count() or 2, profile=CRAWL_PROFILE)
 
 
 def dynamic_url_xpath_processing(url1, url2, xpath1, xpath2):
-    """두 URL 또는 XPath를 비교하여 바뀌는 부분을 {n}으로 처리"""
-    url_template, xpath_template = url1, xpath1
-    if url1 and url2:
-        for i in range(len(url1)):
-            if url1[i] != url2[i]:
-                url_template = url1[:i] + "{n}" + url1[i + 1:]
-                break
-    if xpath1 and xpath2:
-        for i in range(len(xpath1)):
-            if xpath1[i] != xpath2[i]:
-                xpath_template = xpath1[:i] + "{n}" + xpath1[i + 1:]
-                break
+    """
+    두 URL 또는 XPath를 비교하여 바뀌는 숫자 자리를 {n}으로 처리한 템플릿(SlotTemplate)을 반환.
+    여러 자리 숫자(9 -> 10)도 처리하며, 같은 입력 조합의 결과는 캐시된다.
+    """
+    url_template = infer_template(url1, url2)
+    xpath_template = infer_template(xpath1, xpath2) if xpath1 else None
     return url_template, xpath_template
 
 
-def selenium_test_run(url, xpath=None, class_name=None):
-    """단일 URL과 XPath/Class-name으로 테스트 실행"""
-    driver = webdriver.Chrome(service=Service(ChromeDriverManager().install()))
+def selenium_test_run(url, xpath=None, class_name=None, max_wait=2):
+    """단일 URL과 XPath/Class-name으로 테스트 실행 (풀에서 빌린 세션 재사용)"""
     result = ""
-    try:
-        driver.get(url)
-        time.sleep(2)
+    with driver_pool.lease() as driver:
+        driver_pool.get(driver, url)
+        if xpath or class_name:
+            wait_until(driver, element_present(xpath, class_name), timeout=max_wait)
 
         if xpath:
             try:
@@ -45,38 +52,139 @@ def selenium_test_run(url, xpath=None, class_name=None):
                 result = f"Class-name 테스트 실패: {str(e)}"
         else:
             result = "XPath 또는 Class-name이 필요합니다."
-    finally:
-        driver.quit()
     return result
 
 
-def selenium_crawling(url_template, xpath_template, start_idx, end_idx, class_name=None):
-    """동적 URL 및 XPath 처리 크롤링"""
-    driver = webdriver.Chrome(service=Service(ChromeDriverManager().install()))
-    results = []
+def _crawl_index(driver, url_template, xpath_template, n, class_name=None, max_wait=2, wait_stats=None):
+    """{n} 자리에 인덱스를 넣은 URL을 열고 대상 요소의 텍스트를 반환"""
+    url = url_template.render(n)
+    driver_pool.get(driver, url)
+    dynamic_xpath = xpath_template.render(n) if xpath_template else None
+    # 고정 2초 대신 대상 요소가 나타나는 즉시 진행
+    wait_until(driver, element_present(dynamic_xpath, class_name), timeout=max_wait, stats=wait_stats)
+
     try:
+        if xpath_template:
+            return driver.find_element(By.XPATH, dynamic_xpath).text
+        elif class_name:
+            return driver.find_element(By.CLASS_NAME, class_name).text
+    except Exception as e:
+        return f"오류 발생 (URL: {url}, {n}): {str(e)}"
+
+
+def _fetch_index_http(session, url_template, xpath_template, n, class_name=None):
+    """브라우저 없이 HTTP로 받아 lxml로 대상 요소의 텍스트를 추출 (정적 페이지용)"""
+    from lxml import html as lxml_html
+
+    url = url_template.render(n)
+    try:
+        response = session.get(url, timeout=10)
+        response.raise_for_status()
+        tree = lxml_html.fromstring(response.content)
+        if xpath_template:
+            nodes = xpath_template.lxml_finder()(tree, n)  # 컴파일된 XPath 재사용
+        else:
+            nodes = tree.xpath(f"//*[contains(concat(' ', normalize-space(@class), ' '), ' {class_name} ')]")
+        if not nodes:
+            raise ValueError("요소를 찾을 수 없습니다.")
+        node = nodes[0]
+        return node.text_content().strip() if hasattr(node, "text_content") else str(node)
+    except Exception as e:
+        return f"오류 발생 (URL: {url}, {n}): {str(e)}"
+
+
+def selenium_crawling(url_template, xpath_template, start_idx, end_idx, class_name=None, max_wait=2, wait_stats=None,
+                      runner=None):
+    """
+    동적 URL 및 XPath 처리 크롤링 (풀에서 빌린 세션 재사용)
+    runner(CrawlRunner)를 주면 인덱스마다 일시정지/취소를 확인하고 결과를 바로 UI로 보낸다.
+    """
+    results = []
+    wait_stats = wait_stats or WaitStats()
+    with driver_pool.lease() as driver:
         for n in range(start_idx, end_idx + 1):
-            url = url_template.replace("{n}", str(n))
-            driver.get(url)
-            time.sleep(2)
+            if runner:
+                runner.checkpoint()
+            text = _crawl_index(driver, url_template, xpath_template, n, class_name, max_wait, wait_stats)
+            results.append(text)
+            if runner:
+                runner.emit(text)
+    if runner:
+        runner.log(f"대기 시간: {wait_stats.report()}")
+    return results
 
-            try:
-                if xpath_template:
-                    dynamic_xpath = xpath_template.replace("{n}", str(n))
-                    element = driver.find_element(By.XPATH, dynamic_xpath)
-                    results.append(element.text)
-                elif class_name:
-                    element = driver.find_element(By.CLASS_NAME, class_name)
-                    results.append(element.text)
-            except Exception as e:
-                results.append(f"오류 발생 (URL: {url}, {n}): {str(e)}")
-    finally:
-        driver.quit()
+
+def shard_range(start_idx, end_idx, shards):
+    """start_idx..end_idx 범위를 shards개의 연속 구간으로 나눈다"""
+    total = end_idx - start_idx + 1
+    size, extra = divmod(total, shards)
+    ranges, lo = [], start_idx
+    for i in range(shards):
+        hi = lo + size + (1 if i < extra else 0)
+        if hi > lo:
+            ranges.append(range(lo, hi))
+        lo = hi
+    return ranges
+
+
+def selenium_crawling_parallel(url_template, xpath_template, start_idx, end_idx, class_name=None,
+                               workers=None, mode="browser", runner=None, max_wait=2):
+    """
+    인덱스 범위를 여러 워커에 나눠 병렬로 크롤링한다. 결과는 인덱스 순서대로 반환된다.
+
+    mode="browser": 워커마다 풀에서 headless Chrome 세션을 빌려 사용
+    mode="http": 브라우저 없이 requests + lxml로 가져옴 (자바스크립트 렌더링이 필요 없는 페이지)
+    runner: CrawlRunner를 주면 샤드별 진행 상황을 보고하고, 앞에서부터 완성된 결과를 순서대로 UI로 보낸다
+    """
+    workers = max(1, min(workers or os.cpu_count() or 1, end_idx - start_idx + 1))
+    shards = shard_range(start_idx, end_idx, workers)
+    pending = object()
+    results = [pending] * (end_idx - start_idx + 1)
+    emitted = [0]  # 순서대로 UI에 보낸 결과 수
+    lock = threading.Lock()
+    wait_stats = WaitStats()
+
+    def store(shard_id, n, text, done, total):
+        with lock:
+            results[n - start_idx] = text
+            ready = []
+            while emitted[0] < len(results) and results[emitted[0]] is not pending:
+                ready.append(results[emitted[0]])
+                emitted[0] += 1
+            # 묶음을 만든 순서 그대로 큐에 넣어야 샤드끼리 앞뒤가 바뀌지 않는다 (emit은 큐에 넣기만 하므로 잠금 안에서 호출)
+            if runner and ready:
+                runner.emit(*ready)
+        if runner:
+            runner.progress(f"shard {shard_id}", f"{done}/{total}")
+
+    def run_shard(shard_id, indices):
+        if mode == "http":
+            with requests.Session() as session:
+                for done, n in enumerate(indices, 1):
+                    if runner:
+                        runner.checkpoint()
+                    text = _fetch_index_http(session, url_template, xpath_template, n, class_name)
+                    store(shard_id, n, text, done, len(indices))
+        else:
+            with driver_pool.lease() as driver:
+                for done, n in enumerate(indices, 1):
+                    if runner:
+                        runner.checkpoint()
+                    text = _crawl_index(driver, url_template, xpath_template, n, class_name, max_wait, wait_stats)
+                    store(shard_id, n, text, done, len(indices))
+
+    with ThreadPoolExecutor(max_workers=len(shards)) as executor:
+        futures = [executor.submit(run_shard, shard_id, indices) for shard_id, indices in enumerate(shards)]
+        for future in futures:
+            future.result()
+
+    if runner and mode != "http":
+        runner.log(f"대기 시간: {wait_stats.report()}")
     return results
 
 
 def execute_crawling():
-    """GUI에서 실행 버튼을 눌렀을 때 호출"""
+    """GUI에서 실행 버튼을 눌렀을 때 호출 (입력값만 읽고 크롤링은 백그라운드에서 실행)"""
     try:
         url1 = url_entry1.get()
         url2 = url_entry2.get()
@@ -85,29 +193,71 @@ def execute_crawling():
         class_name = class_entry.get()
         start_idx = int(start_entry.get())
         end_idx = int(end_entry.get())
+        workers = int(workers_entry.get() or 1)
 
         if not url1 or (not xpath1 and not class_name):
             messagebox.showerror("입력 오류", "URL과 XPath 또는 Class-name 중 하나를 입력하세요.")
             return
 
-        # Test Run
-        if not url2 and (not xpath2 or not class_name):
-            test_result = selenium_test_run(url1, xpath1, class_name)
-            results_text.insert(tk.END, f"테스트 결과:\n{test_result}\n")
+        if crawl_runner.running:
+            messagebox.showerror("실행 중", "이미 크롤링이 실행 중입니다.")
             return
 
-        # 동적 URL 및 XPath 처리
-        url_template, xpath_template = dynamic_url_xpath_processing(url1, url2, xpath1, xpath2)
-        log_text.insert(tk.END, f"URL 템플릿: {url_template}\nXPath 템플릿: {xpath_template}\n")
+        def job():
+            # Test Run
+            if not url2 and (not xpath2 or not class_name):
+                test_result = selenium_test_run(url1, xpath1, class_name)
+                crawl_runner.emit(f"테스트 결과:\n{test_result}")
+                return
+
+            # 동적 URL 및 XPath 처리
+            url_template, xpath_template = dynamic_url_xpath_processing(url1, url2, xpath1, xpath2)
+            crawl_runner.log(f"URL 템플릿: {url_template}\nXPath 템플릿: {xpath_template}")
+
+            # 크롤링 실행 (workers > 1이면 병렬)
+            if workers > 1:
+                selenium_crawling_parallel(url_template, xpath_template, start_idx, end_idx, class_name,
+                                           workers=workers, runner=crawl_runner)
+            else:
+                selenium_crawling(url_template, xpath_template, start_idx, end_idx, class_name, runner=crawl_runner)
+            crawl_runner.log("크롤링 완료!")
+            crawl_runner.log(f"브라우저 풀: {driver_pool.metrics()}")
 
-        # 크롤링 실행
-        results = selenium_crawling(url_template, xpath_template, start_idx, end_idx, class_name)
-        results_text.insert(tk.END, "\n".join(results) + "\n")
-        log_text.insert(tk.END, "크롤링 완료!\n")
+        crawl_runner.start(job)
     except Exception as e:
         messagebox.showerror("오류", f"오류 발생: {str(e)}")
 
 
+def append_log(text):
+    log_text.insert(tk.END, text + "\n")
+    log_text.see(tk.END)
+
+
+def append_results(results):
+    results_text.insert(tk.END, "\n".join(map(str, results)) + "\n")
+
+
+def crawl_finished(status, message):
+    pause_button.config(text="Pause")
+    if status == "cancelled":
+        append_log("크롤링이 취소되었습니다.")
+    elif status == "error":
+        messagebox.showerror("오류", f"오류 발생: {message}")
+
+
+def toggle_pause():
+    if not crawl_runner.running:
+        return
+    if crawl_runner.paused:
+        crawl_runner.resume()
+        pause_button.config(text="Pause")
+        append_log("재개합니다.")
+    else:
+        crawl_runner.pause()
+        pause_button.config(text="Resume")
+        append_log("일시정지합니다.")
+
+
 # Tkinter GUI 설정
 root = tk.Tk()
 root.title("크롤링 툴")
@@ -145,17 +295,33 @@ tk.Label(root, text="End Index:", font=("Arial", 10)).grid(row=6, column=0, padx
 end_entry = tk.Entry(root, width=10)
 end_entry.grid(row=6, column=1, sticky="w", padx=10, pady=5)
 
+# 병렬 워커 수 (1이면 순차 실행)
+tk.Label(root, text="Workers:", font=("Arial", 10)).grid(row=7, column=0, padx=10, pady=5, sticky="w")
+workers_entry = tk.Entry(root, width=10)
+workers_entry.insert(0, "1")
+workers_entry.grid(row=7, column=1, sticky="w", padx=10, pady=5)
+
 # 로그 및 결과 창
-tk.Label(root, text="Log:", font=("Arial", 10)).grid(row=7, column=0, padx=10, pady=5, sticky="nw")
+tk.Label(root, text="Log:", font=("Arial", 10)).grid(row=8, column=0, padx=10, pady=5, sticky="nw")
 log_text = scrolledtext.ScrolledText(root, height=10, width=80)
-log_text.grid(row=7, column=1, padx=10, pady=5)
+log_text.grid(row=8, column=1, padx=10, pady=5)
 
-tk.Label(root, text="Results:", font=("Arial", 10)).grid(row=8, column=0, padx=10, pady=5, sticky="nw")
+tk.Label(root, text="Results:", font=("Arial", 10)).grid(row=9, column=0, padx=10, pady=5, sticky="nw")
 results_text = scrolledtext.ScrolledText(root, height=10, width=80)
-results_text.grid(row=8, column=1, padx=10, pady=5)
+results_text.grid(row=9, column=1, padx=10, pady=5)
 
 # 실행 버튼
-execute_button = tk.Button(root, text="Execute Crawling", command=execute_crawling, bg="blue", fg="white")
-execute_button.grid(row=9, column=1, pady=20)
+button_frame = tk.Frame(root)
+button_frame.grid(row=10, column=1, pady=20)
+execute_button = tk.Button(button_frame, text="Execute Crawling", command=execute_crawling, bg="blue", fg="white")
+execute_button.grid(row=0, column=0, padx=5)
+pause_button = tk.Button(button_frame, text="Pause", command=toggle_pause, bg="orange", fg="white", width=10)
+pause_button.grid(row=0, column=1, padx=5)
+cancel_button = tk.Button(button_frame, text="Cancel", command=lambda: crawl_runner.cancel(), bg="red", fg="white", width=10)
+cancel_button.grid(row=0, column=2, padx=5)
+
+# 크롤링은 백그라운드 스레드에서 실행되고, 로그/결과는 root.after로 묶어서 반영
+crawl_runner = CrawlRunner(root, on_log=append_log, on_results=append_results, on_done=crawl_finished)
 
 root.mainloop()
+driver_pool.close()
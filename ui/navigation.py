@@ -0,0 +1,285 @@
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from selenium.common.exceptions import TimeoutException
+from selenium.webdriver.common.by import By
+from selenium.webdriver.support import expected_conditions as EC
+from selenium.webdriver.support.ui import WebDriverWait
+
+NAVIGATION_STRATEGIES = ("tab", "hrefs", "back", "reload")
+
+# 대상 요소(자신, 조상, 자손 중 첫 번째 a[href])의 링크. 링크가 없으면 "" (JS로만 이동하는 요소), 요소가 없으면 null
+HREFS_SCRIPT = """
+return arguments[0].map(xpath => {
+    const node = document.evaluate(xpath, document, null, XPathResult.FIRST_ORDERED_NODE_TYPE, null).singleNodeValue;
+    if (!node) return null;
+    const link = node.href ? node : (node.closest('a[href]') || node.querySelector('a[href]'));
+    return link ? link.href : "";
+});
+"""
+
+# 목록 페이지에 표시를 남겨, 뒤로 가기 후 bfcache에서 복원됐는지(표시 유지) 새로 로드됐는지 구분한다
+MARK_SCRIPT = "window.__navigationSweepMark = true;"
+IS_MARKED_SCRIPT = "return window.__navigationSweepMark === true;"
+
+
+class NavigationSweep:
+    """
+    목록 페이지에서 여러 대상(XPath)을 차례로 열어보는 탐색 전략.
+
+    - reload: 클릭 → 대상 페이지 → 목록 페이지 다시 로드 (기존 방식, 대상마다 목록을 새로 로드)
+    - back:   클릭 → 대상 페이지 → 뒤로 가기 (bfcache에서 복원되면 목록을 다시 로드하지 않음)
+    - tab:    대상의 링크를 작업용 탭에서 열고, 목록 탭은 그대로 둔다 (링크가 없으면 back으로 대체)
+    - hrefs:  모든 대상의 링크를 한 번에 모은 뒤, 작업용 탭(또는 pool의 여러 세션)에서 차례로 연다
+
+    stats에 목록 로드 수(list_loads), 대상 로드 수(target_loads), bfcache 복원 수 등을 기록한다.
+    대상 하나가 실패하면(요소 없음, 시간 초과 등) 로그를 남기고 failed에 세고, 목록 페이지로 돌아와 다음 대상으로 넘어간다.
+
+    :param driver: 목록 페이지가 열려 있는 WebDriver
+    :param strategy: 위 전략 중 하나
+    :param ready: 목록 페이지가 준비되었는지 판단할 locator (기본값: body)
+    :param pool: hrefs 전략에서 링크를 나눠 열 DriverPool (없으면 현재 세션의 작업용 탭 사용)
+    :param max_workers: pool 사용 시 동시에 여는 세션 수
+    :param lease_timeout: pool 세션을 기다리는 최대 시간 (초). 넘으면 현재 세션의 작업용 탭에서 연다
+                          (click-list 분기 안처럼 pool의 세션이 모두 사용 중일 때 멈추지 않도록)
+    :param log: 실패한 대상을 기록할 함수
+    :param propagate: 실패로 처리하지 않고 그대로 올려보낼 예외 (예: 취소)
+    """
+
+    def __init__(self, driver, strategy="tab", ready=(By.TAG_NAME, "body"), timeout=10, pool=None, max_workers=None,
+                 lease_timeout=5, log=print, propagate=()):
+        if strategy not in NAVIGATION_STRATEGIES:
+            raise ValueError(f"Unknown navigation strategy: {strategy}")
+        self.driver = driver
+        self.strategy = strategy
+        self.ready = ready
+        self.timeout = timeout
+        self.pool = pool
+        self.max_workers = max_workers
+        self.lease_timeout = lease_timeout
+        self.log = log
+        self.propagate = tuple(propagate)
+        self.list_url = driver.current_url
+        self.list_handle = driver.current_window_handle
+        self._work_handle = None
+        self.stats = {"list_loads": 1, "target_loads": 0, "bfcache_restores": 0, "fallbacks": 0, "failed": 0,
+                      "lease_timeouts": 0}
+        self._stats_lock = threading.Lock()
+        self._driver_lock = threading.Lock()  # pool 방문이 현재 세션(작업용 탭)으로 대체될 때 세션을 한 스레드만 쓰도록
+        driver.execute_script(MARK_SCRIPT)
+
+    def _count(self, name):
+        with self._stats_lock:
+            self.stats[name] += 1
+
+    def _wait_ready(self, driver=None):
+        """목록 페이지 준비 대기"""
+        WebDriverWait(driver or self.driver, self.timeout).until(EC.presence_of_element_located(self.ready))
+
+    def _wait_body(self, driver=None):
+        """대상 페이지 로드 대기"""
+        WebDriverWait(driver or self.driver, self.timeout).until(EC.presence_of_element_located((By.TAG_NAME, "body")))
+
+    def _reload_list(self):
+        self.driver.get(self.list_url)
+        self._wait_ready()
+        self.driver.execute_script(MARK_SCRIPT)
+        self._count("list_loads")
+
+    def _click(self, xpath):
+        """대상을 클릭하고 다른 페이지로 이동했으면 True (같은 페이지 안에서 처리되면 False)"""
+        element = WebDriverWait(self.driver, self.timeout).until(EC.element_to_be_clickable((By.XPATH, xpath)))
+        element.click()
+        try:
+            WebDriverWait(self.driver, self.timeout).until(EC.url_changes(self.list_url))
+        except TimeoutException:
+            return False
+        self._wait_body()
+        self._count("target_loads")
+        return True
+
+    def _visit_reload(self, key, xpath, on_page):
+        navigated = self._click(xpath)
+        on_page(self.driver, key)
+        if navigated:
+            self._reload_list()
+
+    def _visit_back(self, key, xpath, on_page):
+        navigated = self._click(xpath)
+        on_page(self.driver, key)
+        if not navigated:
+            return
+        self.driver.back()
+        self._wait_ready()
+        if self.driver.execute_script(IS_MARKED_SCRIPT):
+            self._count("bfcache_restores")
+        else:
+            self._count("list_loads")
+            self.driver.execute_script(MARK_SCRIPT)
+
+    def _open_in_work_tab(self, key, href, on_page):
+        if self._work_handle is None:
+            self.driver.switch_to.new_window("tab")
+            self._work_handle = self.driver.current_window_handle
+        else:
+            self.driver.switch_to.window(self._work_handle)
+        try:
+            self.driver.get(href)
+            self._wait_body()
+            self._count("target_loads")
+            on_page(self.driver, key)
+        finally:
+            self.driver.switch_to.window(self.list_handle)
+
+    def _visit_tab(self, key, xpath, on_page):
+        href = self.driver.execute_script(HREFS_SCRIPT, [xpath])[0]
+        if href is None:
+            raise LookupError(f"대상 요소가 없습니다: {xpath}")
+        if not href:
+            self._count("fallbacks")
+            self._visit_back(key, xpath, on_page)
+            return
+        self._open_in_work_tab(key, href, on_page)
+
+    def _recover(self):
+        """실패한 대상 뒤에 목록 탭, 목록 페이지로 돌아온다 (돌아오지 못하면 세션이 망가진 것이므로 예외를 올린다)"""
+        if self.driver.current_window_handle != self.list_handle:
+            self.driver.switch_to.window(self.list_handle)
+        if self.driver.current_url != self.list_url:
+            self._reload_list()
+
+    def _attempt(self, key, visit, *args, recover=True):
+        """대상 하나를 방문한다. 실패하면 기록하고 False (다음 대상은 계속 진행)"""
+        try:
+            visit(key, *args)
+            return True
+        except self.propagate:
+            raise
+        except Exception as e:
+            self._count("failed")
+            self.log(f"Navigation target {key} failed: {e}")
+            if recover:
+                self._recover()
+            return False
+
+    def _visit_leased(self, key, href, on_page):
+        """pool의 세션에서 연다. lease_timeout 안에 빈 세션이 없으면 현재 세션의 작업용 탭에서 연다"""
+        leased = False
+        try:
+            with self.pool.lease(timeout=self.lease_timeout) as driver:
+                leased = True
+                self.pool.get(driver, href)
+                self._wait_body(driver)
+                self._count("target_loads")
+                on_page(driver, key)
+        except TimeoutError:
+            if leased:
+                raise
+            self._count("lease_timeouts")
+            with self._driver_lock:
+                self._attempt(key, self._open_in_work_tab, href, on_page)
+
+    def _run_hrefs(self, targets, on_page):
+        hrefs = self.driver.execute_script(HREFS_SCRIPT, [xpath for _, xpath in targets])
+        linked = [(key, href) for (key, _), href in zip(targets, hrefs) if href]
+
+        for (key, xpath), href in zip(targets, hrefs):
+            if href is None:
+                self._count("failed")
+                self.log(f"Navigation target {key} failed: 대상 요소가 없습니다: {xpath}")
+            elif not href:
+                # 링크가 없는 대상은 목록 페이지에서 클릭 후 뒤로 가기로 처리
+                self._count("fallbacks")
+                self._attempt(key, self._visit_back, xpath, on_page)
+
+        if self.pool is None:
+            for key, href in linked:
+                self._attempt(key, self._open_in_work_tab, href, on_page)
+            return
+
+        def visit(item):
+            key, href = item
+            self._attempt(key, self._visit_leased, href, on_page, recover=False)
+
+        with ThreadPoolExecutor(max_workers=self.max_workers or self.pool.size) as executor:
+            list(executor.map(visit, linked))
+
+    def run(self, targets, on_page):
+        """
+        targets의 (key, xpath)마다 대상 페이지를 열고 on_page(driver, key)를 호출한다.
+        끝나면 목록 페이지가 열린 상태로 돌아오고, stats를 반환한다.
+        """
+        try:
+            if self.strategy == "hrefs":
+                self._run_hrefs(targets, on_page)
+            else:
+                visit = getattr(self, f"_visit_{self.strategy}")
+                for key, xpath in targets:
+                    self._attempt(key, visit, xpath, on_page)
+        finally:
+            if self._work_handle is not None:
+                self.driver.switch_to.window(self._work_handle)
+                self.driver.close()
+                self.driver.switch_to.window(self.list_handle)
+                self._work_handle = None
+        return self.stats
+
+
+if __name__ == "__main__":
+    import os
+    import sys
+    from contextlib import ExitStack
+    from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+    sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "core"))
+    from driver_pool import DriverPool
+
+    ROWS, COLS = 5, 4
+
+    class _FixtureHandler(BaseHTTPRequestHandler):
+        """/ : ROWS x COLS 격자의 링크 목록, /item/<r>/<c> : 상세 페이지"""
+
+        def do_GET(self):
+            if self.path.startswith("/item/"):
+                body = f"<html><body><h1>{self.path}</h1></body></html>"
+            else:
+                rows = "".join(
+                    "<div class='row'>" + "".join(f"<a class='cell' href='/item/{r}/{c}'>{r},{c}</a>" for c in range(COLS)) + "</div>"
+                    for r in range(ROWS)
+                )
+                body = f"<html><body>{rows}</body></html>"
+            data = body.encode()
+            self.send_response(200)
+            self.send_header("Content-Type", "text/html")
+            self.send_header("Content-Length", str(len(data)))
+            self.end_headers()
+            self.wfile.write(data)
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _FixtureHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    list_url = f"http://127.0.0.1:{server.server_address[1]}/"
+    targets = [((r, c), f"//div[@class='row'][{r + 1}]/a[{c + 1}]") for r in range(ROWS) for c in range(COLS)]
+    missing = ("missing", "//div[@class='row'][99]/a[1]")  # 없는 대상 하나가 나머지 탐색을 멈추지 않아야 한다
+
+    pool = DriverPool(size=3)
+    try:
+        for strategy in NAVIGATION_STRATEGIES:
+            with pool.lease() as driver, ExitStack() as held:
+                pool.get(driver, list_url)
+                if strategy == "hrefs":
+                    # 나머지 세션을 모두 빌려 둔 상태(click-list 분기 안)에서도 작업용 탭으로 대체해 끝나야 한다
+                    for _ in range(pool.size - 1):
+                        held.enter_context(pool.lease())
+                visited = []
+                stats = NavigationSweep(driver, strategy, pool=pool if strategy == "hrefs" else None, lease_timeout=1,
+                                        timeout=2).run(targets[:3] + [missing] + targets[3:],
+                                                       lambda d, key: visited.append(key))
+                assert sorted(visited) == sorted(key for key, _ in targets), strategy
+                assert stats["failed"] == 1, (strategy, stats)
+                print(f"{strategy:>6}: {stats}")
+    finally:
+        pool.close()
+        server.shutdown()
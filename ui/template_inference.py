@@ -0,0 +1,215 @@
+import difflib
+import functools
+import re
+from fractions import Fraction
+
+_TOKEN = re.compile(r"\d+|\D+")
+PLACEHOLDER = "{n}"
+
+
+def _escape(literal):
+    return literal.replace("{", "{{").replace("}", "}}")
+
+
+class SlotTemplate:
+    """
+    숫자 자리(slot)를 가진 URL/XPath 템플릿.
+
+    각 slot의 값은 scale * n + offset이며, width > 1이면 그 폭만큼 0을 채운다 (예: 007).
+    render(n)은 만들 때 한 번 준비해 둔 format 문자열에 값만 넣으므로 인덱스마다 문자열을 다시 분석하지 않는다.
+
+    :param literals: slot 사이의 고정 문자열 (len(slots) + 1개)
+    :param slots: (scale, offset, width) 목록
+    """
+
+    def __init__(self, literals, slots):
+        self.literals = tuple(literals)
+        self.slots = tuple(slots)
+        parts = [_escape(self.literals[0])]
+        for i, (_, _, width) in enumerate(self.slots):
+            parts.append(f"{{{i}:0{width}d}}" if width > 1 else f"{{{i}}}")
+            parts.append(_escape(self.literals[i + 1]))
+        self._format = "".join(parts)
+        self._lxml_find = None
+
+    @property
+    def is_static(self):
+        return not self.slots
+
+    def values(self, n):
+        return [scale * n + offset for scale, offset, _ in self.slots]
+
+    def render(self, n):
+        return self._format.format(*[scale * n + offset for scale, offset, _ in self.slots])
+
+    def __str__(self):
+        parts = [self.literals[0]]
+        for (scale, offset, width), literal in zip(self.slots, self.literals[1:]):
+            expr = "n" if scale == 1 else f"{scale}*n"
+            if offset:
+                expr += f"{offset:+d}"
+            parts.append(f"{{{expr}:0{width}}}" if width > 1 else f"{{{expr}}}")
+            parts.append(literal)
+        return "".join(parts)
+
+    def __repr__(self):
+        return f"SlotTemplate({str(self)!r})"
+
+    def lxml_finder(self):
+        """
+        정적 HTML(lxml 트리)에서 find(tree, n) -> 노드 목록을 돌려주는 함수를 반환한다 (한 번 만들어 캐시).
+
+        인덱스별 XPath 문자열을 컴파일해 LRU 캐시에 보관하므로, 같은 인덱스를 다시 찾을 때는 컴파일하지 않는다.
+        (XPath 변수($s0...)로 한 번만 컴파일하는 방식은 변수 바인딩 비용 때문에 tree.xpath(str)보다 약 2배 느리다)
+        """
+        if self._lxml_find is not None:
+            return self._lxml_find
+
+        from lxml import etree
+
+        compile_cached = functools.lru_cache(maxsize=4096)(etree.XPath)
+
+        def find(tree, n):
+            return compile_cached(self.render(n))(tree)
+
+        self._lxml_find = find
+        return find
+
+
+def parse_placeholder(template):
+    """"...{n}..." 형식으로 직접 입력한 템플릿을 SlotTemplate으로 변환"""
+    literals = template.split(PLACEHOLDER)
+    return SlotTemplate(literals, [(1, 0, 1)] * (len(literals) - 1))
+
+
+def _alignment(base, tokens):
+    """base 토큰 위치 -> tokens 토큰 위치. 숫자 토큰끼리만 달라도 되고, 나머지가 다르면 ValueError."""
+    mapping = {}
+    matcher = difflib.SequenceMatcher(None, base, tokens, autojunk=False)
+    for tag, i1, i2, j1, j2 in matcher.get_opcodes():
+        numeric_replace = (tag == "replace" and i2 - i1 == j2 - j1
+                           and all(base[i].isdigit() and tokens[j].isdigit() for i, j in zip(range(i1, i2), range(j1, j2))))
+        if tag != "equal" and not numeric_replace:
+            raise ValueError(f"숫자가 아닌 부분이 다릅니다: {''.join(base[i1:i2])!r} / {''.join(tokens[j1:j2])!r}")
+        mapping.update(zip(range(i1, i2), range(j1, j2)))
+    return mapping
+
+
+def _linear_fit(primary, values):
+    """values = scale * primary + offset 를 만족하는 정수 (scale, offset)"""
+    pairs = list(zip(primary, values))
+    for (p0, v0), (p1, v1) in zip(pairs, pairs[1:]):
+        if p0 != p1:
+            scale = Fraction(v1 - v0, p1 - p0)
+            break
+    else:
+        scale = Fraction(0)
+    offset = pairs[0][1] - scale * pairs[0][0]
+    if scale.denominator != 1 or offset.denominator != 1 or any(scale * p + offset != v for p, v in pairs):
+        raise ValueError(f"숫자 자리가 인덱스와 일정한 관계가 아닙니다: {values} (기준 {primary})")
+    return int(scale), int(offset)
+
+
+@functools.lru_cache(maxsize=256)
+def infer_template(*samples):
+    """
+    같은 형태의 샘플 URL/XPath 여러 개를 토큰(숫자 / 숫자 아닌 부분) 단위로 정렬해,
+    샘플마다 달라지는 숫자 자리를 slot으로 만든 SlotTemplate을 반환한다 (입력 조합별로 캐시).
+
+    - 자릿수가 달라도 된다: ".../item9" 와 ".../item10" -> ".../item{n}"
+    - 달라지는 자리가 여러 개면 첫 자리를 n으로 두고 나머지는 n의 일차식으로 맞춘다
+      (예: "page=2&offset=20", "page=3&offset=40" -> "page={n}&offset={20*n-20}")
+    - 0으로 채운 자리는 폭을 유지한다: "img007" / "img008" -> "img{n:03}"
+    - 샘플이 하나뿐이면 "{n}" 자리표시자를 그대로 해석하고, 없으면 고정 문자열 템플릿이 된다.
+    """
+    samples = [sample for sample in samples if sample]
+    if not samples:
+        return None
+    if len(samples) == 1 or PLACEHOLDER in samples[0]:
+        return parse_placeholder(samples[0])
+
+    base = _TOKEN.findall(samples[0])
+    token_lists = [base] + [_TOKEN.findall(sample) for sample in samples[1:]]
+    mappings = [{i: i for i in range(len(base))}] + [_alignment(base, tokens) for tokens in token_lists[1:]]
+
+    slot_positions = sorted({i for mapping, tokens in zip(mappings[1:], token_lists[1:])
+                             for i, j in mapping.items() if tokens[j] != base[i]})
+    if not slot_positions:
+        return SlotTemplate(["".join(base)], [])
+
+    columns = [[tokens[mapping[i]] for mapping, tokens in zip(mappings, token_lists)] for i in slot_positions]
+    primary = [int(value) for value in columns[0]]
+    literals, slots, last = [], [], 0
+    for position, column in zip(slot_positions, columns):
+        scale, offset = _linear_fit(primary, [int(value) for value in column])
+        padded = {len(value) for value in column if len(value) > 1 and value.startswith("0")}
+        width = padded.pop() if len(padded) == 1 else 1
+        literals.append("".join(base[last:position]))
+        slots.append((scale, offset, width))
+        last = position + 1
+    literals.append("".join(base[last:]))
+    return SlotTemplate(literals, slots)
+
+
+if __name__ == "__main__":
+    import time
+
+    def dynamic_url_xpath_processing_old(url1, url2, xpath1, xpath2):
+        # 비교용: 기존 ui/main 구현 (첫 번째로 다른 한 글자만 {n}으로 바꿈)
+        url_template, xpath_template = url1, xpath1
+        for i in range(len(url1)):
+            if url1[i] != url2[i]:
+                url_template = url1[:i] + "{n}" + url1[i + 1:]
+                break
+        for i in range(len(xpath1)):
+            if xpath1[i] != xpath2[i]:
+                xpath_template = xpath1[:i] + "{n}" + xpath1[i + 1:]
+                break
+        return url_template, xpath_template
+
+    url1, url2 = "https://example.com/store/19/reviews?page=19", "https://example.com/store/20/reviews?page=20"
+    xpath1, xpath2 = "//ul/li[19]/div[2]/span", "//ul/li[20]/div[2]/span"
+    old_url, old_xpath = dynamic_url_xpath_processing_old(url1, url2, xpath1, xpath2)
+    url_template, xpath_template = infer_template(url1, url2), infer_template(xpath1, xpath2)
+    print(f"Old:      {old_url} | {old_xpath} -> n=123: {old_url.replace('{n}', '123')}")
+    print(f"Inferred: {url_template} | {xpath_template} -> n=123: {url_template.render(123)}")
+    assert url_template.render(123) == "https://example.com/store/123/reviews?page=123"
+    assert xpath_template.render(123) == "//ul/li[123]/div[2]/span"
+    assert str(infer_template("a?page=2&offset=20", "a?page=3&offset=40")) == "a?page={n}&offset={20*n-20}"
+    assert infer_template("img007.jpg", "img008.jpg").render(12) == "img012.jpg"
+
+    count = 10000
+    start = time.perf_counter()
+    for n in range(count):
+        # 기존 흐름: 클릭(인덱스)마다 템플릿을 다시 만들고 문자열 치환
+        u, x = dynamic_url_xpath_processing_old(url1, url2, xpath1, xpath2)
+        u.replace("{n}", str(n)), x.replace("{n}", str(n))
+    old_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for n in range(count):
+        u, x = infer_template(url1, url2), infer_template(xpath1, xpath2)  # 캐시에서 바로 반환
+        u.render(n), x.render(n)
+    new_time = time.perf_counter() - start
+    print(f"{count} indices: recompute per item {old_time:.3f}s, cached template {new_time:.3f}s")
+
+    try:
+        from lxml import html as lxml_html
+    except ImportError:
+        print("lxml not installed: skipping XPath benchmark")
+    else:
+        tree = lxml_html.fromstring("<ul>" + "".join(f"<li><div>a</div><div><span>{i}</span></div></li>" for i in range(1, 2001)) + "</ul>")
+        start = time.perf_counter()
+        old_nodes = [tree.xpath(xpath_template.render(n)) for n in range(1, 2001)]
+        per_item = time.perf_counter() - start
+        find = xpath_template.lxml_finder()
+        start = time.perf_counter()
+        new_nodes = [find(tree, n) for n in range(1, 2001)]
+        compiled = time.perf_counter() - start
+        start = time.perf_counter()
+        cached_nodes = [find(tree, n) for n in range(1, 2001)]
+        cached = time.perf_counter() - start
+        assert [[e.text for e in nodes] for nodes in old_nodes] == [[e.text for e in nodes] for nodes in new_nodes]
+        assert [[e.text for e in nodes] for nodes in new_nodes] == [[e.text for e in nodes] for nodes in cached_nodes]
+        print(f"2000 lookups: tree.xpath(str) {per_item:.3f}s, cached XPath first pass {compiled:.3f}s, "
+              f"second pass {cached:.3f}s")